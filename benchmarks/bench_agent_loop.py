@@ -0,0 +1,131 @@
+"""Benchmark the agent loop by replaying recorded sessions
+
+Each cassette (recorded with `mini-agent --record PATH`) is replayed through a fresh Agent
+in a temporary workspace, with real file and bash tools and no network access. Replay
+latency is excluded from the timings, so the result is the overhead of the loop itself:
+history handling, logging, event rendering and tool plumbing.
+
+Usage:
+    python benchmarks/bench_agent_loop.py                       # All cassettes in benchmarks/cassettes
+    python benchmarks/bench_agent_loop.py session.jsonl -n 50   # One cassette, 50 runs
+    python benchmarks/bench_agent_loop.py --max-step-overhead-ms 20   # Exit 1 above this (for CI)
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mini_agent.agent import Agent  # noqa: E402
+from mini_agent.events import NullSink  # noqa: E402
+from mini_agent.llm.replay import ReplayClient, load_cassette  # noqa: E402
+from mini_agent.profiler import Profiler  # noqa: E402
+from mini_agent.tools.bash_tool import BashTool  # noqa: E402
+from mini_agent.tools.file_tools import EditTool, ReadTool, WriteTool  # noqa: E402
+
+CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes"
+
+
+async def replay_once(calls: list[dict], latency: float, profiler: Profiler | None = None) -> tuple[float, int]:
+    """Replay a cassette once in a fresh workspace
+
+    Returns:
+        (loop overhead in seconds, number of steps)
+    """
+    llm = ReplayClient(calls, latency=latency)
+    with tempfile.TemporaryDirectory() as workspace:
+        agent = Agent(
+            llm_client=llm,
+            system_prompt="You are a benchmark replay agent.",
+            tools=[ReadTool(workspace), WriteTool(workspace), EditTool(workspace), BashTool(workspace_dir=workspace)],
+            max_steps=len(calls) + 1,
+            workspace_dir=workspace,
+            event_sink=NullSink(),
+            profiler=profiler,
+        )
+        agent.add_user_message("Replay the recorded session.")
+        started = time.perf_counter()
+        await agent.run()
+        elapsed = time.perf_counter() - started
+    if agent.stop_reason != "end_turn":
+        raise RuntimeError(f"Replay stopped with {agent.stop_reason}, expected end_turn")
+    return elapsed - llm.replay_time, llm.position
+
+
+async def bench_cassette(path: Path, runs: int, latency: float) -> dict:
+    """Time repeated replays of one cassette and break one profiled replay down by phase"""
+    calls = load_cassette(path)
+    await replay_once(calls, latency)  # Warm-up: imports, tiktoken, first log file
+
+    overheads = []
+    steps = 0
+    for _ in range(runs):
+        overhead, steps = await replay_once(calls, latency)
+        overheads.append(overhead)
+
+    profiler = Profiler()
+    await replay_once(calls, latency, profiler)
+    phases: dict[str, float] = {}
+    for row in profiler.summary():
+        if row["category"] in ("tool", "log", "render", "summary"):
+            phases[row["category"]] = phases.get(row["category"], 0.0) + row["total_ms"] / steps
+
+    step_overheads = [overhead / steps * 1000 for overhead in overheads]
+    return {
+        "cassette": path.name,
+        "steps": steps,
+        "runs": runs,
+        "step_overhead_ms": {
+            "mean": statistics.mean(step_overheads),
+            "median": statistics.median(step_overheads),
+            "min": min(step_overheads),
+            "max": max(step_overheads),
+        },
+        "phase_ms_per_step": phases,
+    }
+
+
+def format_result(result: dict) -> str:
+    overhead = result["step_overhead_ms"]
+    phases = ", ".join(f"{name} {ms:.2f}" for name, ms in sorted(result["phase_ms_per_step"].items()))
+    return (
+        f"{result['cassette']}: {result['steps']} steps x {result['runs']} runs, per-step overhead "
+        f"mean {overhead['mean']:.2f} ms, median {overhead['median']:.2f} ms, max {overhead['max']:.2f} ms"
+        f"\n  per-step phases (ms): {phases}"
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded sessions and report agent loop overhead per step")
+    parser.add_argument("cassettes", nargs="*", type=Path, help="Cassette files (default: benchmarks/cassettes/*.jsonl)")
+    parser.add_argument("--runs", "-n", type=int, default=20, help="Timed replays per cassette (default: 20)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Synthetic LLM latency per call in seconds (default: 0)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--max-step-overhead-ms", type=float, default=None, help="Fail if the median per-step overhead exceeds this")
+    args = parser.parse_args()
+
+    cassettes = args.cassettes or sorted(CASSETTE_DIR.glob("*.jsonl"))
+    results = [await bench_cassette(path, max(1, args.runs), args.latency) for path in cassettes]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(format_result(result))
+
+    if args.max_step_overhead_ms is not None:
+        slow = [r for r in results if r["step_overhead_ms"]["median"] > args.max_step_overhead_ms]
+        for result in slow:
+            print(f"FAIL {result['cassette']}: median per-step overhead above {args.max_step_overhead_ms} ms", file=sys.stderr)
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -15,10 +15,13 @@ from acp import (
     CancelNotification,
     InitializeRequest,
     InitializeResponse,
+    LoadSessionRequest,
+    LoadSessionResponse,
     NewSessionRequest,
     NewSessionResponse,
     PromptRequest,
     PromptResponse,
+    RequestError,
     session_notification,
     start_tool_call,
     stdio_streams,
@@ -32,11 +35,12 @@ from pydantic import field_validator
 from acp.schema import AgentCapabilities, Implementation, McpCapabilities
 
 from mini_agent.agent import Agent
-from mini_agent.cli import add_workspace_tools, initialize_base_tools
+from mini_agent.cli import add_workspace_tools, build_agent_options, create_llm_client, initialize_base_tools
 from mini_agent.config import Config
-from mini_agent.llm import LLMClient
-from mini_agent.retry import RetryConfig as RetryConfigBase
-from mini_agent.schema import Message
+from mini_agent.events import AgentEvent, AssistantMessage, EventSink, LLMDelta, LLMError, ToolFinished, ToolStarted
+from mini_agent.journal import SessionJournal, is_valid_session_id
+from mini_agent.llm import LLMClient, LLMClientBase
+from mini_agent.utils.http_pool import close_http_sessions
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +68,56 @@ except Exception:  # pragma: no cover - defensive
 @dataclass
 class SessionState:
     agent: Agent
-    cancelled: bool = False
+
+
+# Agent stop reasons mapped to ACP stop reasons
+STOP_REASONS = {
+    "end_turn": "end_turn",
+    "max_steps": "max_turn_requests",
+    "cancelled": "cancelled",
+    "error": "refusal",
+    "time_budget": "max_turn_requests",
+    "token_budget": "max_tokens",
+}
+
+
+class ACPEventSink(EventSink):
+    """Forward agent events to an ACP client as session updates."""
+
+    def __init__(self, conn: AgentSideConnection, session_id: str):
+        self._conn = conn
+        self._session_id = session_id
+
+    async def emit(self, event: AgentEvent) -> None:
+        if isinstance(event, LLMDelta):
+            block = text_block(event.delta)
+            await self._send(update_agent_thought(block) if event.kind == "thinking" else update_agent_message(block))
+        elif isinstance(event, AssistantMessage):
+            if event.streamed:
+                return
+            if event.thinking:
+                await self._send(update_agent_thought(text_block(event.thinking)))
+            if event.content:
+                await self._send(update_agent_message(text_block(event.content)))
+        elif isinstance(event, ToolStarted):
+            call = event.tool_call
+            args = call.function.arguments
+            # Show tool name with key arguments for better visibility
+            args_preview = ", ".join(f"{k}={repr(v)[:50]}" for k, v in list(args.items())[:2]) if isinstance(args, dict) else ""
+            label = f"🔧 {call.function.name}({args_preview})" if args_preview else f"🔧 {call.function.name}()"
+            await self._send(start_tool_call(call.id, label, kind="execute", raw_input=args))
+        elif isinstance(event, ToolFinished):
+            result = event.result
+            status = "completed" if result.success else "failed"
+            prefix = "✅" if result.success else "❌"
+            text = f"{prefix} {result.content if result.success else result.error or 'Tool execution failed'}"
+            await self._send(update_tool_call(event.tool_call.id, status=status, content=[tool_content(text_block(text))], raw_output=text))
+        elif isinstance(event, LLMError):
+            logger.error("LLM error: %s", event.message)
+            await self._send(update_agent_message(text_block(f"Error: {event.message}")))
+
+    async def _send(self, update: Any) -> None:
+        await self._conn.sessionUpdate(session_notification(self._session_id, update))
 
 
 class MiniMaxACPAgent:
@@ -74,7 +127,7 @@ class MiniMaxACPAgent:
         self,
         conn: AgentSideConnection,
         config: Config,
-        llm: LLMClient,
+        llm: LLMClient | LLMClientBase,
         base_tools: list,
         system_prompt: str,
     ):
@@ -88,78 +141,71 @@ class MiniMaxACPAgent:
     async def initialize(self, params: InitializeRequest) -> InitializeResponse:  # noqa: ARG002
         return InitializeResponse(
             protocolVersion=PROTOCOL_VERSION,
-            agentCapabilities=AgentCapabilities(loadSession=False),
+            agentCapabilities=AgentCapabilities(loadSession=self._config.agent.enable_journal),
             agentInfo=Implementation(name="mini-agent", title="Mini-Agent", version="0.1.0"),
         )
 
     async def newSession(self, params: NewSessionRequest) -> NewSessionResponse:
         session_id = f"sess-{len(self._sessions)}-{uuid4().hex[:8]}"
-        workspace = Path(params.cwd or self._config.agent.workspace_dir).expanduser()
+        journal = SessionJournal(session_id, self._config.agent.journal_dir) if self._config.agent.enable_journal else None
+        agent = Agent(
+            llm_client=self._llm,
+            system_prompt=self._system_prompt,
+            journal=journal,
+            **self._agent_options(session_id, params.cwd),
+        )
+        self._sessions[session_id] = SessionState(agent=agent)
+        return NewSessionResponse(sessionId=session_id)
+
+    async def loadSession(self, params: LoadSessionRequest) -> LoadSessionResponse:
+        """Resume a journaled session, e.g. after the server restarted."""
+        session_id = params.sessionId
+        if session_id not in self._sessions:
+            not_found = RequestError.invalid_params({"sessionId": session_id, "message": "Session not found"})
+            if not is_valid_session_id(session_id):
+                raise not_found
+            try:
+                agent = Agent.resume(
+                    session_id,
+                    llm_client=self._llm,
+                    journal_dir=self._config.agent.journal_dir,
+                    **self._agent_options(session_id, params.cwd),
+                )
+            except FileNotFoundError as e:
+                raise not_found from e
+            self._sessions[session_id] = SessionState(agent=agent)
+        return LoadSessionResponse()
+
+    def _agent_options(self, session_id: str, cwd: str | None) -> dict[str, Any]:
+        """Agent constructor arguments shared by new and resumed sessions."""
+        workspace = Path(cwd or self._config.agent.workspace_dir).expanduser()
         if not workspace.is_absolute():
             workspace = workspace.resolve()
         tools = list(self._base_tools)
-        add_workspace_tools(tools, self._config, workspace)
-        agent = Agent(llm_client=self._llm, system_prompt=self._system_prompt, tools=tools, max_steps=self._config.agent.max_steps, workspace_dir=str(workspace))
-        self._sessions[session_id] = SessionState(agent=agent)
-        return NewSessionResponse(sessionId=session_id)
+        # stdout carries the ACP protocol, so tool loading must stay quiet
+        add_workspace_tools(tools, self._config, workspace, verbose=False)
+        return dict(
+            build_agent_options(self._config),
+            tools=tools,
+            workspace_dir=str(workspace),
+            event_sink=ACPEventSink(self._conn, session_id),
+        )
 
     async def prompt(self, params: PromptRequest) -> PromptResponse:
         state = self._sessions.get(params.sessionId)
         if not state:
             return PromptResponse(stopReason="refusal")
-        state.cancelled = False
         user_text = "\n".join(block.get("text", "") if isinstance(block, dict) else getattr(block, "text", "") for block in params.prompt)
-        state.agent.messages.append(Message(role="user", content=user_text))
-        stop_reason = await self._run_turn(state, params.sessionId)
-        return PromptResponse(stopReason=stop_reason)
+        state.agent.add_user_message(user_text)
+        await state.agent.run()
+        # Idle sessions keep their history in compact form until the next prompt
+        state.agent.park()
+        return PromptResponse(stopReason=STOP_REASONS.get(state.agent.stop_reason, "end_turn"))
 
     async def cancel(self, params: CancelNotification) -> None:
         state = self._sessions.get(params.sessionId)
         if state:
-            state.cancelled = True
-
-    async def _run_turn(self, state: SessionState, session_id: str) -> str:
-        agent = state.agent
-        for _ in range(agent.max_steps):
-            if state.cancelled:
-                return "cancelled"
-            tool_schemas = [tool.to_schema() for tool in agent.tools.values()]
-            try:
-                response = await agent.llm.generate(messages=agent.messages, tools=tool_schemas)
-            except Exception as exc:
-                logger.exception("LLM error")
-                await self._send(session_id, update_agent_message(text_block(f"Error: {exc}")))
-                return "refusal"
-            if response.thinking:
-                await self._send(session_id, update_agent_thought(text_block(response.thinking)))
-            if response.content:
-                await self._send(session_id, update_agent_message(text_block(response.content)))
-            agent.messages.append(Message(role="assistant", content=response.content, thinking=response.thinking, tool_calls=response.tool_calls))
-            if not response.tool_calls:
-                return "end_turn"
-            for call in response.tool_calls:
-                name, args = call.function.name, call.function.arguments
-                # Show tool name with key arguments for better visibility
-                args_preview = ", ".join(f"{k}={repr(v)[:50]}" for k, v in list(args.items())[:2]) if isinstance(args, dict) else ""
-                label = f"🔧 {name}({args_preview})" if args_preview else f"🔧 {name}()"
-                await self._send(session_id, start_tool_call(call.id, label, kind="execute", raw_input=args))
-                tool = agent.tools.get(name)
-                if not tool:
-                    text, status = f"❌ Unknown tool: {name}", "failed"
-                else:
-                    try:
-                        result = await tool.execute(**args)
-                        status = "completed" if result.success else "failed"
-                        prefix = "✅" if result.success else "❌"
-                        text = f"{prefix} {result.content if result.success else result.error or 'Tool execution failed'}"
-                    except Exception as exc:
-                        status, text = "failed", f"❌ Tool error: {exc}"
-                await self._send(session_id, update_tool_call(call.id, status=status, content=[tool_content(text_block(text))], raw_output=text))
-                agent.messages.append(Message(role="tool", content=text, tool_call_id=call.id, name=name))
-        return "max_turn_requests"
-
-    async def _send(self, session_id: str, update: Any) -> None:
-        await self._conn.sessionUpdate(session_notification(session_id, update))
+            state.agent.cancel()
 
 
 async def run_acp_server(config: Config | None = None) -> None:
@@ -176,16 +222,19 @@ async def run_acp_server(config: Config | None = None) -> None:
         meta = skill_loader.get_skills_metadata_prompt()
         if meta:
             system_prompt = f"{system_prompt.rstrip()}\n\n{meta}"
-    rcfg = config.llm.retry
-    llm = LLMClient(api_key=config.llm.api_key, api_base=config.llm.api_base, model=config.llm.model, retry_config=RetryConfigBase(enabled=rcfg.enabled, max_retries=rcfg.max_retries, initial_delay=rcfg.initial_delay, max_delay=rcfg.max_delay, exponential_base=rcfg.exponential_base))
+    # One client for all sessions, so they share its rate limiters, router health and cache
+    llm = create_llm_client(config, verbose=False)
     reader, writer = await stdio_streams()
     AgentSideConnection(lambda conn: MiniMaxACPAgent(conn, config, llm, base_tools, system_prompt), writer, reader)
     logger.info("Mini-Agent ACP server running")
-    await asyncio.Event().wait()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await close_http_sessions()
 
 
 def main() -> None:
     asyncio.run(run_acp_server())
 
 
-__all__ = ["MiniMaxACPAgent", "run_acp_server", "main"]
\ No newline at end of file
+__all__ = ["ACPEventSink", "MiniMaxACPAgent", "run_acp_server", "main"]
\ No newline at end of file
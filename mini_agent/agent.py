@@ -1,42 +1,48 @@
 """Core Agent implementation."""
 
-import json
+import asyncio
+import contextlib
+import time
 from pathlib import Path
-
-import tiktoken
-
+from typing import Any
+
+from .budget import BudgetExhaustedError, RunBudget
+from .cancellation import CancellationToken, RunCancelledError
+from .context_policy import ContextPolicy
+from .events import (
+    AgentEvent,
+    AssistantMessage,
+    ContextTrimmed,
+    EventSink,
+    LLMDelta,
+    LLMError,
+    Notice,
+    RunFinished,
+    RunStarted,
+    StepStarted,
+    SummaryFinished,
+    SummaryRound,
+    SummaryStarted,
+    TerminalSink,
+    ToolFinished,
+    ToolStarted,
+)
+from .history import CompactHistory
+from .journal import SessionJournal
 from .llm import LLMClient
+from .llm.rate_limit import rate_limit_priority
 from .logger import AgentLogger
-from .schema import Message
+from .profiler import Profiler
+from .schema import LLMResponse, Message, ToolCall
+from .token_ledger import TokenLedger
+from .tools.artifact_tool import ArtifactStore, ReadArtifactTool
 from .tools.base import Tool, ToolResult
-from .utils import calculate_display_width
-
-
-# ANSI color codes
-class Colors:
-    """Terminal color definitions"""
-
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    DIM = "\033[2m"
+from .tools.registry import ToolRegistry
+from .tools.result_cache import ToolResultCache
+from .tools.subagent_tool import SpawnSubagentsTool
 
-    # Foreground colors
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-
-    # Bright colors
-    BRIGHT_BLACK = "\033[90m"
-    BRIGHT_RED = "\033[91m"
-    BRIGHT_GREEN = "\033[92m"
-    BRIGHT_YELLOW = "\033[93m"
-    BRIGHT_BLUE = "\033[94m"
-    BRIGHT_MAGENTA = "\033[95m"
-    BRIGHT_CYAN = "\033[96m"
-    BRIGHT_WHITE = "\033[97m"
+# Prefix marking execution summaries inserted into history by summarization
+SUMMARY_PREFIX = "[Assistant Execution Summary]"
 
 
 class Agent:
@@ -50,11 +56,36 @@ class Agent:
         max_steps: int = 50,
         workspace_dir: str = "./workspace",
         token_limit: int = 80000,  # Summary triggered when tokens exceed this value
+        context_policies: list[ContextPolicy] | None = None,  # Local eviction strategies tried before summarization
+        llm_summarization: bool = True,  # Summarize with the LLM if history still exceeds token_limit
+        parallel_tool_calls: bool = False,  # Run parallel-safe tool calls of one step concurrently
+        max_parallel_tools: int = 4,  # Concurrency cap for parallel tool dispatch
+        stream: bool = False,  # Stream LLM output (thinking/text deltas emitted as tokens arrive)
+        background_compaction: bool = False,  # Summarize older rounds during tool execution
+        compaction_watermark: float = 0.7,  # Fraction of token_limit that starts background compaction
+        event_sink: EventSink | None = None,  # Receives loop events (default: render to terminal)
+        artifact_threshold: int = 0,  # Tool results longer than this many chars go to the artifact store (0: off)
+        journal: SessionJournal | None = None,  # Append-only history journal for crash-safe resume
+        profiler: Profiler | None = None,  # Records per-phase latency spans (LLM, tools, summary, logging, rendering)
+        memoize_tools: bool = False,  # Serve repeated read-only tool calls of a run from cache
+        time_budget: float | None = None,  # Default wall-clock limit per run in seconds (None: unlimited)
+        token_budget: int | None = None,  # Default LLM token limit per run, input plus output (None: unlimited)
+        max_subagents: int = 0,  # Concurrency of the spawn_subagents tool (0: tool not offered)
+        subagent_max_steps: int = 20,  # Step limit of each sub-agent
     ):
         self.llm = llm_client
-        self.tools = {tool.name: tool for tool in tools}
+        # Tool schemas are built once here, not on every LLM call
+        self.tools = ToolRegistry(tools)
         self.max_steps = max_steps
         self.token_limit = token_limit
+        self.context_policies = list(context_policies or [])
+        self.llm_summarization = llm_summarization
+        self.parallel_tool_calls = parallel_tool_calls
+        self.max_parallel_tools = max(1, max_parallel_tools)
+        self.stream = stream
+        self.background_compaction = background_compaction
+        self.compaction_watermark = compaction_watermark
+        self.event_sink = event_sink if event_sink is not None else TerminalSink()
         self.workspace_dir = Path(workspace_dir)
 
         # Ensure workspace exists
@@ -67,135 +98,379 @@ class Agent:
 
         self.system_prompt = system_prompt
 
-        # Initialize message history
-        self.messages: list[Message] = [Message(role="system", content=system_prompt)]
+        # Initialize message history; while parked, it is held in compact form instead
+        self._parked: CompactHistory | None = None
+        self._messages: list[Message] = [Message(role="system", content=system_prompt)]
+
+        # Large tool results are kept out of history; read_artifact pages through them
+        self.artifact_threshold = artifact_threshold
+        self.artifact_store: ArtifactStore | None = None
+        if artifact_threshold > 0:
+            # Previews, handle included, are no longer than the threshold, so storing an output shrinks it
+            self.artifact_store = ArtifactStore(self.workspace_dir / ".artifacts", preview_chars=min(2000, artifact_threshold))
+            artifact_tool = ReadArtifactTool(self.artifact_store)
+            if artifact_tool.name not in self.tools:
+                self.tools.add(artifact_tool)
+
+        # Independent subtasks can be delegated to child agents that run concurrently
+        if max_subagents > 0:
+            subagent_tool = SpawnSubagentsTool(
+                llm_client,
+                tools=list(self.tools.values()),
+                workspace_dir=str(self.workspace_dir),
+                max_concurrency=max_subagents,
+                agent_options=dict(
+                    max_steps=subagent_max_steps,
+                    token_limit=token_limit,
+                    context_policies=context_policies,
+                    llm_summarization=llm_summarization,
+                    parallel_tool_calls=parallel_tool_calls,
+                    max_parallel_tools=max_parallel_tools,
+                    artifact_threshold=artifact_threshold,
+                    memoize_tools=memoize_tools,
+                    profiler=profiler,
+                ),
+                budget=lambda: self.budget,
+            )
+            if subagent_tool.name not in self.tools:
+                self.tools.add(subagent_tool)
+
+        self.journal = journal
+        self.profiler = profiler
+
+        # Results of cacheable tool calls, dropped when a tool writes to the files they read
+        self.tool_cache = ToolResultCache() if memoize_tools else None
+
+        # Budget limits, and the consumption of the current (or last) run
+        self.time_budget = time_budget
+        self.token_budget = token_budget
+        self.budget = RunBudget()
+
+        # Cached per-message token counts
+        self.token_ledger = TokenLedger()
+
+        # In-flight background compaction and the history snapshot it works on
+        self._compaction_task: asyncio.Task | None = None
+        self._compaction_snapshot: list[Message] = []
+
+        # Why the last run stopped: "end_turn", "max_steps", "error" or "cancelled"
+        self.stop_reason: str | None = None
+        self.cancel_token = CancellationToken()
 
         # Initialize logger
         self.logger = AgentLogger()
 
+    @classmethod
+    def resume(
+        cls,
+        session_id: str,
+        llm_client: LLMClient,
+        tools: list[Tool],
+        journal_dir: str | Path | None = None,
+        **kwargs: Any,
+    ) -> "Agent":
+        """Rebuild an agent from its session journal, without re-running LLM or tool calls
+
+        Args:
+            session_id: Id of the journaled session
+            llm_client: LLM client for the resumed agent
+            tools: Tools for the resumed agent
+            journal_dir: Directory holding journal files (default: ~/.mini-agent/sessions)
+            **kwargs: Other Agent constructor arguments (max_steps, workspace_dir, ...)
+
+        Returns:
+            Agent whose history is the journaled history; new messages keep appending to the same journal
+
+        Raises:
+            FileNotFoundError: No journal exists for the session id
+        """
+        journal = SessionJournal.open(session_id, journal_dir=journal_dir)
+        messages = journal.messages
+        if not messages or messages[0].role != "system":
+            raise ValueError(f"Session journal {journal.path} has no system prompt")
+
+        agent = cls(llm_client=llm_client, system_prompt=messages[0].content, tools=tools, journal=journal, **kwargs)
+        agent.messages = messages
+        return agent
+
+    @property
+    def messages(self) -> list[Message]:
+        """Message history (restored first if the agent is parked)"""
+        if self._parked is not None:
+            self.unpark()
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages: list[Message]):
+        if self._parked is not None:
+            # Restore first, so the journal sees a replaced history rather than a new one
+            self.unpark()
+        self._messages = messages
+
+    @property
+    def parked(self) -> bool:
+        """Whether the history is currently held in compact form"""
+        return self._parked is not None
+
+    def park(self) -> CompactHistory:
+        """Move the history into compact form while the agent is idle
+
+        Servers holding many idle sessions can park them between prompts: the history is
+        kept as immutable records with interned strings and cached token counts instead of
+        Message objects. Any access to `messages` (or a new run) restores it transparently.
+
+        Returns:
+            The compact history, which is also a snapshot of the session
+        """
+        if self._parked is not None:
+            return self._parked
+        if self._compaction_task is not None:
+            # Its result refers to the Message objects being dropped, so it could not be applied
+            self._compaction_task.cancel()
+            self._compaction_task = None
+            self._compaction_snapshot = []
+        counts = [self.token_ledger.count_message(msg) for msg in self._messages]
+        self._parked = CompactHistory.from_messages(self._messages, counts)
+        self._messages = []
+        self.token_ledger.clear()
+        if self.journal is not None:
+            self.journal.rebind([])
+        return self._parked
+
+    def unpark(self):
+        """Restore a parked history as Message objects"""
+        parked, self._parked = self._parked, None
+        if parked is None:
+            return
+        self._messages = parked.to_messages()
+        for msg, record in zip(self._messages, parked):
+            if record.tokens is not None:
+                self.token_ledger.remember(msg, record.tokens)
+        if self.journal is not None:
+            # Same history as already journaled, so the next sync only appends
+            self.journal.rebind(self._messages)
+
     def add_user_message(self, content: str):
         """Add a user message to history."""
         self.messages.append(Message(role="user", content=content))
+        self._sync_journal()
+
+    def _sync_journal(self):
+        """Write history changes since the last sync to the session journal, if any"""
+        if self.journal is not None:
+            self.journal.sync(self.messages)
+
+    def _span(self, name: str, category: str, **args: Any) -> contextlib.AbstractContextManager[dict[str, Any]]:
+        """Profiler span for a phase of the loop, or a no-op context without a profiler"""
+        if self.profiler is None:
+            return contextlib.nullcontext({})
+        return self.profiler.span(name, category, **args)
+
+    async def _emit(self, event: AgentEvent):
+        """Send an event to the sink, timing rendering as its own profiler phase"""
+        with self._span(event.type, "render"):
+            await self.event_sink.emit(event)
+
+    def cancel(self):
+        """Stop the current run, interrupting any in-flight LLM call, tool call or summarization.
+
+        Does nothing when no run is in progress; a run that has been called but not yet
+        reached its first LLM call is stopped before making it.
+        """
+        self.cancel_token.cancel()
 
     def _estimate_tokens(self) -> int:
-        """Accurately calculate token count for message history using tiktoken
+        """Calculate token count for message history using tiktoken (cl100k_base)
 
-        Uses cl100k_base encoder (GLM-4.6 (via Z.AI)/MiniMax-M2/M2 compatible)
+        Counts are cached per message by the token ledger, so only new or modified
+        messages are encoded; falls back to character-based estimation without tiktoken.
         """
-        try:
-            # Use cl100k_base encoder (used by GLM-4.6 (via Z.AI) and most modern models)
-            encoding = tiktoken.get_encoding("cl100k_base")
-        except Exception:
-            # Fallback: if tiktoken initialization fails, use simple estimation
-            return self._estimate_tokens_fallback()
-
-        total_tokens = 0
-
-        for msg in self.messages:
-            # Count text content
-            if isinstance(msg.content, str):
-                total_tokens += len(encoding.encode(msg.content))
-            elif isinstance(msg.content, list):
-                for block in msg.content:
-                    if isinstance(block, dict):
-                        # Convert dict to string for calculation
-                        total_tokens += len(encoding.encode(str(block)))
-
-            # Count thinking
-            if msg.thinking:
-                total_tokens += len(encoding.encode(msg.thinking))
-
-            # Count tool_calls
-            if msg.tool_calls:
-                total_tokens += len(encoding.encode(str(msg.tool_calls)))
-
-            # Metadata overhead per message (approximately 4 tokens)
-            total_tokens += 4
-
-        return total_tokens
-
-    def _estimate_tokens_fallback(self) -> int:
-        """Fallback token estimation method (when tiktoken is unavailable)"""
-        total_chars = 0
-        for msg in self.messages:
-            if isinstance(msg.content, str):
-                total_chars += len(msg.content)
-            elif isinstance(msg.content, list):
-                for block in msg.content:
-                    if isinstance(block, dict):
-                        total_chars += len(str(block))
-
-            if msg.thinking:
-                total_chars += len(msg.thinking)
-
-            if msg.tool_calls:
-                total_chars += len(str(msg.tool_calls))
-
-        # Rough estimation: average 2.5 characters = 1 token
-        return int(total_chars / 2.5)
+        return self.token_ledger.count(self.messages)
+
+    @staticmethod
+    def _is_summary_message(msg: Message) -> bool:
+        """Check whether a message is an execution summary inserted by summarization"""
+        return msg.role == "user" and isinstance(msg.content, str) and msg.content.startswith(SUMMARY_PREFIX)
+
+    def _find_unsummarized_spans(self, messages: list[Message]) -> list[tuple[int, int, int]]:
+        """Find execution spans that have not been summarized yet
+
+        A round is a real user message plus everything up to the next real user message.
+        Summaries already inserted into a round cover everything before them, so only the
+        messages after the round's last summary are pending.
+
+        Args:
+            messages: Message history to inspect
+
+        Returns:
+            List of (round_num, start, end) message index ranges, one per round with pending messages
+        """
+        user_indices = [i for i, msg in enumerate(messages) if i > 0 and msg.role == "user" and not self._is_summary_message(msg)]
+
+        spans = []
+        for i, user_idx in enumerate(user_indices):
+            # If last user, go to end of message list; otherwise to before next user
+            end = user_indices[i + 1] if i < len(user_indices) - 1 else len(messages)
+            start = user_idx + 1
+            for j in range(user_idx + 1, end):
+                if self._is_summary_message(messages[j]):
+                    start = j + 1
+            if start < end:
+                spans.append((i + 1, start, end))
+        return spans
+
+    async def _compact_messages(self, messages: list[Message]) -> list[Message]:
+        """Summarize every unsummarized span of a message list
+
+        The per-round summary calls run concurrently. The input list is not modified.
+
+        Args:
+            messages: Message history (or a snapshot of it)
+
+        Returns:
+            New message list with each pending span replaced by its summary
+        """
+        spans = self._find_unsummarized_spans(messages)
+        summaries = await asyncio.gather(
+            *(self._create_summary(messages[start:end], round_num) for round_num, start, end in spans)
+        )
+
+        # Build new message list, replacing each pending span with its summary
+        new_messages = []
+        cursor = 0
+        for (_, start, end), summary_text in zip(spans, summaries):
+            new_messages.extend(messages[cursor:start])
+            if summary_text:
+                new_messages.append(Message(role="user", content=f"{SUMMARY_PREFIX}\n\n{summary_text}"))
+            cursor = end
+        new_messages.extend(messages[cursor:])
+        return new_messages
 
     async def _summarize_messages(self):
         """Message history summarization: summarize conversations between user messages when tokens exceed limit
 
-        Strategy (Agent mode):
+        Strategy (Agent mode, rolling):
         - Keep all user messages (these are user intents)
         - Summarize content between each user-user pair (agent execution process)
         - If last round is still executing (has agent/tool messages but no next user), also summarize
+        - Spans that were summarized before are kept as-is; only messages added after a round's
+          last summary are summarized, and the per-round summary calls run concurrently
         - Structure: system -> user1 -> summary1 -> user2 -> summary2 -> user3 -> summary3 (if executing)
         """
+        # Swap in (or wait for) background compaction before deciding anything else
+        await self._apply_background_compaction()
+
         estimated_tokens = self._estimate_tokens()
 
         # If not exceeded, no summary needed
         if estimated_tokens <= self.token_limit:
             return
 
-        print(f"\n{Colors.BRIGHT_YELLOW}📊 Token estimate: {estimated_tokens}/{self.token_limit}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_YELLOW}🔄 Triggering message history summarization...{Colors.RESET}")
+        # Cheap local strategies first; the LLM only summarizes what they could not shrink
+        estimated_tokens = await self._apply_context_policies(estimated_tokens)
+        if estimated_tokens <= self.token_limit:
+            return
+        if not self.llm_summarization:
+            await self._emit(
+                Notice(level="warning", message=f"History exceeds the token limit ({estimated_tokens}/{self.token_limit}) and LLM summarization is disabled")
+            )
+            return
+
+        await self._emit(SummaryStarted(tokens=estimated_tokens, token_limit=self.token_limit))
 
-        # Find all user message indices (skip system prompt)
-        user_indices = [i for i, msg in enumerate(self.messages) if msg.role == "user" and i > 0]
+        # Need at least one unsummarized round to perform summary
+        spans = self._find_unsummarized_spans(self.messages)
+        if not spans:
+            await self._emit(Notice(level="warning", message="Insufficient messages, cannot summarize"))
+            return
+
+        # Replace message list
+        with self._span("summarize", "summary", spans=len(spans)):
+            self.messages = await self._compact_messages(self.messages)
 
-        # Need at least 1 user message to perform summary
-        if len(user_indices) < 1:
-            print(f"{Colors.BRIGHT_YELLOW}⚠️  Insufficient messages, cannot summarize{Colors.RESET}")
+        new_tokens = self._estimate_tokens()
+        await self._emit(SummaryFinished(tokens_before=estimated_tokens, tokens_after=new_tokens, spans=len(spans)))
+
+    async def _apply_context_policies(self, tokens: int) -> int:
+        """Apply context policies in order until history fits in the token limit
+
+        Returns:
+            Token count of the resulting history
+        """
+        for policy in self.context_policies:
+            if tokens <= self.token_limit:
+                break
+            with self._span(policy.name, "summary"):
+                self.messages = policy.apply(self.messages, self.token_limit, self.token_ledger.count)
+            new_tokens = self._estimate_tokens()
+            if new_tokens < tokens:
+                await self._emit(ContextTrimmed(policy=policy.name, tokens_before=tokens, tokens_after=new_tokens))
+            tokens = new_tokens
+        return tokens
+
+    async def _maybe_start_background_compaction(self):
+        """Start summarizing older messages in the background once history crosses the soft watermark
+
+        Called right before tool execution, so summarization overlaps with tool latency. The
+        latest assistant message is excluded from the snapshot because its tool results are
+        still being produced.
+        """
+        if not self.background_compaction or self._compaction_task is not None:
             return
 
-        # Build new message list
-        new_messages = [self.messages[0]]  # Keep system prompt
-        summary_count = 0
+        estimated_tokens = self._estimate_tokens()
+        if estimated_tokens <= self.token_limit * self.compaction_watermark:
+            return
 
-        # Iterate through each user message and summarize the execution process after it
-        for i, user_idx in enumerate(user_indices):
-            # Add current user message
-            new_messages.append(self.messages[user_idx])
+        snapshot = self.messages[:-1]
+        if not self._find_unsummarized_spans(snapshot):
+            return
 
-            # Determine message range to summarize
-            # If last user, go to end of message list; otherwise to before next user
-            if i < len(user_indices) - 1:
-                next_user_idx = user_indices[i + 1]
-            else:
-                next_user_idx = len(self.messages)
-
-            # Extract execution messages for this round
-            execution_messages = self.messages[user_idx + 1 : next_user_idx]
-
-            # If there are execution messages in this round, summarize them
-            if execution_messages:
-                summary_text = await self._create_summary(execution_messages, i + 1)
-                if summary_text:
-                    summary_message = Message(
-                        role="user",
-                        content=f"[Assistant Execution Summary]\n\n{summary_text}",
-                    )
-                    new_messages.append(summary_message)
-                    summary_count += 1
+        await self._emit(SummaryStarted(tokens=estimated_tokens, token_limit=self.token_limit, background=True))
+        self._compaction_snapshot = snapshot
+        self._compaction_task = asyncio.create_task(self._run_background_compaction(snapshot))
 
-        # Replace message list
-        self.messages = new_messages
+    async def _run_background_compaction(self, snapshot: list[Message]) -> list[Message]:
+        """Body of the background compaction task (profiled on its own lane)"""
+        # Rate limited requests of the run itself go first
+        with self._span("compaction", "summary", background=True), rate_limit_priority(-1):
+            return await self._compact_messages(snapshot)
 
+    async def _apply_background_compaction(self):
+        """Swap in the result of a background compaction at a step boundary
+
+        An unfinished compaction is only awaited if history is already over the hard token
+        limit; otherwise the step proceeds and the result is applied at a later boundary.
+        The swap is skipped if history was replaced since the snapshot was taken.
+        """
+        task = self._compaction_task
+        if task is None:
+            return
+
+        if not task.done():
+            if self._estimate_tokens() <= self.token_limit:
+                return
+            await asyncio.wait([task])
+
+        snapshot = self._compaction_snapshot
+        self._compaction_task = None
+        self._compaction_snapshot = []
+
+        try:
+            compacted = task.result()
+        except Exception as e:
+            await self._emit(Notice(level="error", message=f"Background compaction failed: {e}"))
+            return
+
+        prefix = self.messages[: len(snapshot)]
+        if len(prefix) != len(snapshot) or any(a is not b for a, b in zip(prefix, snapshot)):
+            return
+
+        old_tokens = self._estimate_tokens()
+        self.messages = compacted + self.messages[len(snapshot) :]
         new_tokens = self._estimate_tokens()
-        print(f"{Colors.BRIGHT_GREEN}✓ Summary completed, tokens reduced from {estimated_tokens} to {new_tokens}{Colors.RESET}")
-        print(f"{Colors.DIM}  Structure: system + {len(user_indices)} user messages + {summary_count} summaries{Colors.RESET}")
+        spans = len(self._find_unsummarized_spans(snapshot))
+        await self._emit(SummaryFinished(tokens_before=old_tokens, tokens_after=new_tokens, spans=spans, background=True))
 
     async def _create_summary(self, messages: list[Message], round_num: int) -> str:
         """Create summary for one execution round
@@ -237,68 +512,133 @@ Requirements:
 5. Do not include "user" related content, only summarize the Agent's execution process"""
 
             summary_msg = Message(role="user", content=summary_prompt)
-            response = await self.llm.generate(
-                messages=[
-                    Message(
-                        role="system",
-                        content="You are an assistant skilled at summarizing Agent execution processes.",
-                    ),
-                    summary_msg,
-                ]
-            )
+            with self._span("summary_round", "llm", round=round_num):
+                response = await self.llm.generate(
+                    messages=[
+                        Message(
+                            role="system",
+                            content="You are an assistant skilled at summarizing Agent execution processes.",
+                        ),
+                        summary_msg,
+                    ]
+                )
 
             summary_text = response.content
-            print(f"{Colors.BRIGHT_GREEN}✓ Summary for round {round_num} generated successfully{Colors.RESET}")
+            await self._emit(SummaryRound(round_num=round_num, success=True))
             return summary_text
 
         except Exception as e:
-            print(f"{Colors.BRIGHT_RED}✗ Summary generation failed for round {round_num}: {e}{Colors.RESET}")
+            await self._emit(SummaryRound(round_num=round_num, success=False, error=str(e)))
             # Use simple text summary on failure
             return summary_content
 
-    async def run(self) -> str:
-        """Execute agent loop until task is complete or max steps reached."""
+    async def run(self, time_budget: float | None = None, token_budget: int | None = None) -> str:
+        """Execute agent loop until task is complete, max steps reached or a budget runs out.
+
+        Progress is reported as events to the event sink. Why the run stopped is stored
+        in `stop_reason`. With a profiler, every phase of the run is recorded as a span.
+
+        Args:
+            time_budget: Wall-clock limit for this run in seconds (default: the agent's time_budget)
+            token_budget: LLM input plus output token limit for this run (default: the agent's token_budget)
+
+        Returns:
+            The final answer, or a partial result if a budget ran out
+        """
+        # A fresh token per run, set before the first await so a cancel during startup is kept
+        self.cancel_token = CancellationToken()
+        self.budget = RunBudget(
+            time_budget=time_budget if time_budget is not None else self.time_budget,
+            token_budget=token_budget if token_budget is not None else self.token_budget,
+        )
+        if self.profiler is None:
+            return await self._run_loop()
+        with self.profiler.activate(), self.profiler.span("run", "agent"):
+            return await self._run_loop()
+
+    async def _run_loop(self) -> str:
         # Start new run, initialize log file
-        self.logger.start_new_run()
-        print(f"{Colors.DIM}📝 Log file: {self.logger.get_log_file_path()}{Colors.RESET}")
+        with self._span("start_run", "log"):
+            self.logger.start_new_run()
+        if self.tool_cache is not None:
+            # Files may have changed outside the agent since the last run
+            self.tool_cache.clear()
+        await self._emit(RunStarted(log_file=str(self.logger.get_log_file_path())))
 
         step = 0
 
         while step < self.max_steps:
-            # Check and summarize message history to prevent context overflow
-            await self._summarize_messages()
+            if self.cancel_token.cancelled:
+                return await self._finish_cancelled()
 
-            # Step header with proper width calculation
-            BOX_WIDTH = 58
-            step_text = f"{Colors.BOLD}{Colors.BRIGHT_CYAN}💭 Step {step + 1}/{self.max_steps}{Colors.RESET}"
-            step_display_width = calculate_display_width(step_text)
-            padding = max(0, BOX_WIDTH - 1 - step_display_width)  # -1 for leading space
+            with self._span("step", "agent", step=step + 1):
+                result = await self._run_step(step)
+            if result is not None:
+                return result
 
-            print(f"\n{Colors.DIM}╭{'─' * BOX_WIDTH}╮{Colors.RESET}")
-            print(f"{Colors.DIM}│{Colors.RESET} {step_text}{' ' * padding}{Colors.DIM}│{Colors.RESET}")
-            print(f"{Colors.DIM}╰{'─' * BOX_WIDTH}╯{Colors.RESET}")
+            step += 1
 
-            # Get tool list for LLM call
-            tool_list = list(self.tools.values())
+        # Max steps reached
+        return await self._finish_run("max_steps", f"Task couldn't be completed after {self.max_steps} steps.")
 
-            # Log LLM request and call LLM with Tool objects directly
-            self.logger.log_request(messages=self.messages, tools=tool_list)
+    async def _run_step(self, step: int) -> str | None:
+        """Run one step of the loop
 
-            try:
-                response = await self.llm.generate(messages=self.messages, tools=tool_list)
-            except Exception as e:
-                # Check if it's a retry exhausted error
-                from .retry import RetryExhaustedError
-
-                if isinstance(e, RetryExhaustedError):
-                    error_msg = f"LLM call failed after {e.attempts} retries\nLast error: {str(e.last_exception)}"
-                    print(f"\n{Colors.BRIGHT_RED}❌ Retry failed:{Colors.RESET} {error_msg}")
+        Returns:
+            The run result if the run finished during this step, otherwise None
+        """
+        # Check and summarize message history to prevent context overflow
+        try:
+            await self._interruptible(self._summarize_messages())
+        except BudgetExhaustedError as e:
+            return await self._finish_budget(e.reason)
+        except RunCancelledError:
+            return await self._finish_cancelled()
+        self._sync_journal()
+
+        # Stop before a call the budget cannot afford; otherwise shrink its output limit to fit
+        request_tokens = self._estimate_tokens()
+        exhausted = self.budget.exhausted(request_tokens)
+        if exhausted:
+            return await self._finish_budget(exhausted)
+        max_tokens = self.budget.max_tokens(request_tokens)
+
+        await self._emit(StepStarted(step=step + 1, max_steps=self.max_steps))
+
+        # Log LLM request and call LLM with the tool registry, whose schemas are precomputed
+        with self._span("log_request", "log"):
+            self.logger.log_request(messages=self.messages, tools=list(self.tools.values()))
+
+        llm_kwargs = {} if max_tokens is None else {"max_tokens": max_tokens}
+        call_started = time.monotonic()
+        try:
+            with self._span("generate", "llm", messages=len(self.messages), stream=self.stream, **llm_kwargs) as span_args:
+                if self.stream:
+                    call = self._generate_streaming(**llm_kwargs)
                 else:
-                    error_msg = f"LLM call failed: {str(e)}"
-                    print(f"\n{Colors.BRIGHT_RED}❌ Error:{Colors.RESET} {error_msg}")
-                return error_msg
+                    call = self.llm.generate(messages=self.messages, tools=self.tools, **llm_kwargs)
+                response = await self._interruptible(call)
+                span_args["finish_reason"] = response.finish_reason
+                if response.usage is not None:
+                    span_args["usage"] = response.usage
+        except BudgetExhaustedError as e:
+            return await self._finish_budget(e.reason)
+        except RunCancelledError:
+            return await self._finish_cancelled()
+        except Exception as e:
+            # Check if it's a retry exhausted error
+            from .retry import RetryExhaustedError
+
+            if isinstance(e, RetryExhaustedError):
+                error_msg = f"LLM call failed after {e.attempts} retries\nLast error: {str(e.last_exception)}"
+                await self._emit(LLMError(message=error_msg, attempts=e.attempts))
+            else:
+                error_msg = f"LLM call failed: {str(e)}"
+                await self._emit(LLMError(message=error_msg))
+            return await self._finish_run("error", error_msg)
 
-            # Log LLM response
+        # Log LLM response
+        with self._span("log_response", "log"):
             self.logger.log_response(
                 content=response.content,
                 thinking=response.thinking,
@@ -306,108 +646,280 @@ Requirements:
                 finish_reason=response.finish_reason,
             )
 
-            # Add assistant message
-            assistant_msg = Message(
-                role="assistant",
+        # Add assistant message
+        assistant_msg = Message(
+            role="assistant",
+            content=response.content,
+            thinking=response.thinking,
+            tool_calls=response.tool_calls,
+        )
+        self.messages.append(assistant_msg)
+        self._sync_journal()
+        self.budget.record(*self._call_usage(response, request_tokens, assistant_msg), time.monotonic() - call_started)
+
+        await self._emit(
+            AssistantMessage(
                 content=response.content,
                 thinking=response.thinking,
                 tool_calls=response.tool_calls,
+                finish_reason=response.finish_reason,
+                streamed=self.stream,
             )
-            self.messages.append(assistant_msg)
-
-            # Print thinking if present
-            if response.thinking:
-                print(f"\n{Colors.BOLD}{Colors.MAGENTA}🧠 Thinking:{Colors.RESET}")
-                print(f"{Colors.DIM}{response.thinking}{Colors.RESET}")
-
-            # Print assistant response
-            if response.content:
-                print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}🤖 Assistant:{Colors.RESET}")
-                print(f"{response.content}")
-
-            # Check if task is complete (no tool calls)
-            if not response.tool_calls:
-                return response.content
-
-            # Execute tool calls
-            for tool_call in response.tool_calls:
-                tool_call_id = tool_call.id
-                function_name = tool_call.function.name
-                arguments = tool_call.function.arguments
-
-                # Tool call header
-                print(f"\n{Colors.BRIGHT_YELLOW}🔧 Tool Call:{Colors.RESET} {Colors.BOLD}{Colors.CYAN}{function_name}{Colors.RESET}")
-
-                # Arguments (formatted display)
-                print(f"{Colors.DIM}   Arguments:{Colors.RESET}")
-                # Truncate each argument value to avoid overly long output
-                truncated_args = {}
-                for key, value in arguments.items():
-                    value_str = str(value)
-                    if len(value_str) > 200:
-                        truncated_args[key] = value_str[:200] + "..."
-                    else:
-                        truncated_args[key] = value
-                args_json = json.dumps(truncated_args, indent=2, ensure_ascii=False)
-                for line in args_json.split("\n"):
-                    print(f"   {Colors.DIM}{line}{Colors.RESET}")
-
-                # Execute tool
-                if function_name not in self.tools:
-                    result = ToolResult(
-                        success=False,
-                        content="",
-                        error=f"Unknown tool: {function_name}",
-                    )
-                else:
-                    try:
-                        tool = self.tools[function_name]
-                        result = await tool.execute(**arguments)
-                    except Exception as e:
-                        # Catch all exceptions during tool execution, convert to failed ToolResult
-                        import traceback
-
-                        error_detail = f"{type(e).__name__}: {str(e)}"
-                        error_trace = traceback.format_exc()
-                        result = ToolResult(
-                            success=False,
-                            content="",
-                            error=f"Tool execution failed: {error_detail}\n\nTraceback:\n{error_trace}",
-                        )
-
-                # Log tool execution result
-                self.logger.log_tool_result(
-                    tool_name=function_name,
-                    arguments=arguments,
-                    result_success=result.success,
-                    result_content=result.content if result.success else None,
-                    result_error=result.error if not result.success else None,
-                )
+        )
 
-                # Print result
-                if result.success:
-                    result_text = result.content
-                    if len(result_text) > 300:
-                        result_text = result_text[:300] + f"{Colors.DIM}...{Colors.RESET}"
-                    print(f"{Colors.BRIGHT_GREEN}✓ Result:{Colors.RESET} {result_text}")
-                else:
-                    print(f"{Colors.BRIGHT_RED}✗ Error:{Colors.RESET} {Colors.RED}{result.error}{Colors.RESET}")
-
-                # Add tool result message
-                tool_msg = Message(
-                    role="tool",
-                    content=result.content if result.success else f"Error: {result.error}",
-                    tool_call_id=tool_call_id,
-                    name=function_name,
-                )
-                self.messages.append(tool_msg)
+        # Check if task is complete (no tool calls)
+        if not response.tool_calls:
+            return await self._finish_run("end_turn", response.content)
 
-            step += 1
+        # Hide summarization latency behind tool execution
+        await self._maybe_start_background_compaction()
 
-        # Max steps reached
-        error_msg = f"Task couldn't be completed after {self.max_steps} steps."
-        print(f"\n{Colors.BRIGHT_YELLOW}⚠️  {error_msg}{Colors.RESET}")
-        return error_msg
+        # Execute tool calls (batches of parallel-safe calls run concurrently)
+        batches = self._plan_tool_batches(response.tool_calls)
+        for i, batch in enumerate(batches):
+            for tool_call in batch:
+                await self._emit(ToolStarted(tool_call=tool_call))
+
+            try:
+                results = await self._interruptible(self._execute_tool_batch(batch))
+            except BudgetExhaustedError as e:
+                await self._abort_tool_calls(batches[i:], "Not completed: time budget exhausted")
+                return await self._finish_budget(e.reason)
+            except RunCancelledError:
+                await self._abort_tool_calls(batches[i:], "Not completed: run cancelled")
+                return await self._finish_cancelled()
+
+            # Results are recorded in the original call order so tool messages match tool_calls
+            for tool_call, result in zip(batch, results):
+                await self._record_tool_result(tool_call, result)
+
+        return None
+
+    async def _finish_run(self, stop_reason: str, content: str) -> str:
+        """Record why the run stopped, emit the final event and return the run result"""
+        self._sync_journal()
+        self.stop_reason = stop_reason
+        await self._emit(RunFinished(stop_reason=stop_reason, content=content))
+        return content
+
+    async def _abort_tool_calls(self, batches: list[list[ToolCall]], error: str):
+        """Record failed results for interrupted tool calls; the first batch has already been started
+
+        Every tool call still needs a result message to keep history valid.
+        """
+        for i, batch in enumerate(batches):
+            for tool_call in batch:
+                if i > 0:
+                    await self._emit(ToolStarted(tool_call=tool_call))
+                await self._record_tool_result(tool_call, ToolResult(success=False, content="", error=error))
+
+    async def _finish_cancelled(self) -> str:
+        """Stop a cancelled run, also dropping any background compaction still using the LLM"""
+        if self._compaction_task is not None:
+            self._compaction_task.cancel()
+            self._compaction_task = None
+            self._compaction_snapshot = []
+        return await self._finish_run("cancelled", "Task cancelled.")
+
+    async def _finish_budget(self, reason: str) -> str:
+        """Stop a run whose budget ran out, returning the last answer text of the run as a partial result"""
+        partial = None
+        for msg in reversed(self.messages):
+            if msg.role == "user" and not self._is_summary_message(msg):
+                break
+            if msg.role == "assistant" and msg.content:
+                partial = msg.content
+                break
+
+        content = f"Stopped early: {self.budget.describe(reason)}."
+        if partial:
+            content += f"\n\nPartial result:\n{partial}"
+        return await self._finish_run(reason, content)
+
+    async def _interruptible(self, coro: Any) -> Any:
+        """Await a coroutine, cancelling it if the run is cancelled or its time budget runs out first
+
+        Raises:
+            RunCancelledError: The run was cancelled before the coroutine finished
+            BudgetExhaustedError: The time budget ran out before the coroutine finished
+        """
+        task = asyncio.ensure_future(coro)
+        if self.profiler is not None:
+            self.profiler.share_lane(task)
+        finished, result = await self.cancel_token.race(task, timeout=self.budget.remaining_time())
+        if finished:
+            return result
+        if self.cancel_token.cancelled:
+            raise RunCancelledError()
+        raise BudgetExhaustedError("time_budget")
+
+    def _call_usage(self, response: LLMResponse, request_tokens: int, assistant_msg: Message) -> tuple[int, int]:
+        """Input and output tokens of an LLM call, from reported usage or estimated
+
+        Cached input tokens count like any other input token.
+        """
+        usage = response.usage or {}
+        input_tokens = usage.get("input_tokens", usage.get("prompt_tokens"))
+        if input_tokens is None:
+            input_tokens = request_tokens
+        else:
+            input_tokens += usage.get("cache_read_input_tokens", 0) + usage.get("cache_creation_input_tokens", 0)
+        output_tokens = usage.get("output_tokens", usage.get("completion_tokens"))
+        if output_tokens is None:
+            output_tokens = self.token_ledger.count_message(assistant_msg)
+        return input_tokens, output_tokens
+
+    async def _generate_streaming(self, **llm_kwargs: Any) -> LLMResponse:
+        """Call the LLM in streaming mode, emitting thinking and text deltas as they arrive
+
+        Returns:
+            The complete LLMResponse from the final stream chunk
+        """
+        response = None
+
+        async for chunk in self.llm.generate_stream(messages=self.messages, tools=self.tools, **llm_kwargs):
+            if chunk.type in ("thinking", "text") and chunk.delta:
+                await self._emit(LLMDelta(kind=chunk.type, delta=chunk.delta))
+            elif chunk.type == "done":
+                response = chunk.response
+
+        if response is None:
+            raise RuntimeError("LLM stream ended without a final response")
+        return response
+
+    def _plan_tool_batches(self, tool_calls: list[ToolCall]) -> list[list[ToolCall]]:
+        """Group tool calls into batches that can be executed together
+
+        Consecutive calls to parallel-safe tools are merged into one batch; any other call
+        runs alone and acts as a barrier, so side effects keep the order the model chose.
+
+        Args:
+            tool_calls: Tool calls from one LLM response, in original order
+
+        Returns:
+            List of batches, preserving the original call order
+        """
+        if not self.parallel_tool_calls:
+            return [[tool_call] for tool_call in tool_calls]
+
+        batches: list[list[ToolCall]] = []
+        current: list[ToolCall] = []
+        for tool_call in tool_calls:
+            tool = self.tools.get(tool_call.function.name)
+            if tool is not None and tool.parallel_safe:
+                current.append(tool_call)
+                continue
+            if current:
+                batches.append(current)
+                current = []
+            batches.append([tool_call])
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _execute_tool_batch(self, batch: list[ToolCall]) -> list[ToolResult]:
+        """Execute a batch of tool calls, concurrently (capped by max_parallel_tools) if more than one
+
+        Returns:
+            Tool results in the same order as the batch
+        """
+        if len(batch) == 1:
+            return [await self._execute_tool(batch[0].function.name, batch[0].function.arguments)]
+
+        semaphore = asyncio.Semaphore(self.max_parallel_tools)
+
+        async def run_limited(tool_call: ToolCall) -> ToolResult:
+            async with semaphore:
+                return await self._execute_tool(tool_call.function.name, tool_call.function.arguments)
+
+        return list(await asyncio.gather(*(run_limited(tool_call) for tool_call in batch)))
+
+    async def _execute_tool(self, function_name: str, arguments: dict[str, Any]) -> ToolResult:
+        """Execute a single tool, converting any exception into a failed ToolResult"""
+        if function_name not in self.tools:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Unknown tool: {function_name}",
+            )
+
+        try:
+            tool = self.tools[function_name]
+            with self._span(function_name, "tool") as span_args:
+                cached = self._lookup_tool_cache(tool, arguments)
+                if cached is not None:
+                    span_args["cached"] = True
+                    return cached
+                result = await tool.execute(**arguments)
+                span_args["success"] = result.success
+            if self.tool_cache is not None and tool.cacheable and result.success:
+                self.tool_cache.put(function_name, arguments, result, tool.read_paths(**arguments))
+            return result
+        except Exception as e:
+            # Catch all exceptions during tool execution, convert to failed ToolResult
+            import traceback
+
+            error_detail = f"{type(e).__name__}: {str(e)}"
+            error_trace = traceback.format_exc()
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Tool execution failed: {error_detail}\n\nTraceback:\n{error_trace}",
+            )
+
+    def _lookup_tool_cache(self, tool: Tool, arguments: dict[str, Any]) -> ToolResult | None:
+        """Get a memoized result for a cacheable call; for other calls, drop what they may overwrite
+
+        Writing tools never run concurrently with other tools, so invalidating right before
+        the call is equivalent to invalidating after it, and also covers calls that fail
+        halfway through a write.
+        """
+        if self.tool_cache is None:
+            return None
+        if tool.cacheable:
+            return self.tool_cache.get(tool.name, arguments)
+        try:
+            written_paths = tool.written_paths(**arguments)
+        except TypeError:
+            written_paths = None  # Bad arguments: the call will fail, but be conservative
+        self.tool_cache.invalidate(written_paths)
+        return None
+
+    async def _record_tool_result(self, tool_call: ToolCall, result: ToolResult):
+        """Log and report a tool result, then append it to message history"""
+        function_name = tool_call.function.name
+
+        # Log tool execution result
+        with self._span("log_tool_result", "log"):
+            self.logger.log_tool_result(
+                tool_name=function_name,
+                arguments=tool_call.function.arguments,
+                result_success=result.success,
+                result_content=result.content if result.success else None,
+                result_error=result.error if not result.success else None,
+            )
+
+        await self._emit(ToolFinished(tool_call=tool_call, result=result))
+
+        content = result.content if result.success else f"Error: {result.error}"
+        # Pages read back from an artifact are never re-stored
+        if (
+            self.artifact_store is not None
+            and len(content) > self.artifact_threshold
+            and not isinstance(self.tools.get(function_name), ReadArtifactTool)
+        ):
+            artifact_id = self.artifact_store.put(content)
+            content = self.artifact_store.preview(content, artifact_id)
+
+        # Add tool result message
+        tool_msg = Message(
+            role="tool",
+            content=content,
+            tool_call_id=tool_call.id,
+            name=function_name,
+        )
+        self.messages.append(tool_msg)
+        self._sync_journal()
 
     def get_history(self) -> list[Message]:
         """Get message history."""
@@ -0,0 +1,279 @@
+"""Batch runner: many agent tasks concurrently on one event loop
+
+Tasks are read from a JSONL file, one object per line:
+
+    {"id": "fix-readme", "prompt": "Fix the typos in README.md", "max_steps": 20, "time_budget": 300}
+
+Only "prompt" is required. Each task runs as its own Agent in its own workspace
+directory, while the LLM client and the workspace-independent base tools are created
+once and shared. Results and per-task metrics are appended to a JSONL file as tasks
+finish, so a partial batch still leaves usable output.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from .agent import Agent
+from .cli import (
+    Colors,
+    add_workspace_tools,
+    build_agent_options,
+    create_llm_client,
+    initialize_base_tools,
+    load_system_prompt,
+    print_profile,
+)
+from .config import Config
+from .events import JsonlSink, NullSink
+from .llm import CachingClient, LLMClient, RouterClient
+from .profiler import Profiler
+from .tools.base import Tool
+from .tools.bash_tool import BashTool
+from .tools.mcp_loader import cleanup_mcp_connections
+from .utils.http_pool import close_http_sessions
+
+
+class BatchTask(BaseModel):
+    """One task of a batch"""
+
+    id: str
+    prompt: str
+    workspace: str | None = None  # Default: <workspace_root>/<id>
+    max_steps: int | None = None  # Default: agent.max_steps from config
+    time_budget: float | None = None  # Default: agent.time_budget from config
+    token_budget: int | None = None  # Default: agent.token_budget from config
+
+
+def load_tasks(path: str | Path) -> list[BatchTask]:
+    """Load tasks from a JSONL file
+
+    Args:
+        path: JSONL file with one task object per line
+
+    Returns:
+        Tasks in file order; tasks without an id are named task-<line number>
+
+    Raises:
+        ValueError: A line is not valid JSON or not a valid task, or a task id is repeated
+            or not a plain file name (ids name the task workspaces)
+    """
+    tasks = []
+    ids = set()
+    with open(path, encoding="utf-8") as f:
+        for line_num, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                data.setdefault("id", f"task-{line_num}")
+                task = BatchTask.model_validate(data)
+                if task.id in ("", "..") or Path(task.id).name != task.id or "\\" in task.id:
+                    raise ValueError(f"id {task.id!r} is not a plain file name")
+                if task.id in ids:
+                    raise ValueError(f"duplicate id {task.id!r}")
+                ids.add(task.id)
+                tasks.append(task)
+            except Exception as e:
+                raise ValueError(f"Invalid task on line {line_num} of {path}: {e}") from e
+    return tasks
+
+
+class BatchRunner:
+    """Run batch tasks with bounded concurrency, sharing the LLM client and base tools"""
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        base_tools: list[Tool],
+        config: Config,
+        system_prompt: str,
+        workspace_root: str | Path,
+        concurrency: int = 4,
+        record_events: bool = False,
+        profiler: Profiler | None = None,
+    ):
+        """Initialize batch runner.
+
+        Args:
+            llm_client: LLM client shared by all tasks
+            base_tools: Workspace-independent tools shared by all tasks
+            config: Configuration (agent options and workspace tools)
+            system_prompt: System prompt for every task
+            workspace_root: Parent directory of per-task workspaces
+            concurrency: Maximum number of tasks running at once
+            record_events: Write each task's agent events to events.jsonl in its workspace
+            profiler: Profiler shared by all tasks (each task is drawn on its own lanes)
+        """
+        self.llm_client = llm_client
+        self.base_tools = base_tools
+        self.config = config
+        self.system_prompt = system_prompt
+        self.workspace_root = Path(workspace_root).absolute()
+        self.concurrency = max(1, concurrency)
+        self.record_events = record_events
+        self.profiler = profiler
+
+    def _build_tools(self, workspace: Path) -> list[Tool]:
+        """Shared base tools plus this task's workspace tools"""
+        tools = []
+        for tool in self.base_tools:
+            # Shell commands run in the task workspace rather than the process cwd
+            tools.append(BashTool(workspace_dir=str(workspace)) if isinstance(tool, BashTool) else tool)
+        add_workspace_tools(tools, self.config, workspace, verbose=False)
+        return tools
+
+    async def run_task(self, task: BatchTask) -> dict[str, Any]:
+        """Run one task to completion
+
+        Returns:
+            Result record: id, stop_reason, result, error and metrics
+        """
+        workspace = Path(task.workspace).absolute() if task.workspace else self.workspace_root / task.id
+        workspace.mkdir(parents=True, exist_ok=True)
+        event_sink = JsonlSink(workspace / "events.jsonl") if self.record_events else NullSink()
+
+        options = build_agent_options(self.config)
+        for option in ("max_steps", "time_budget", "token_budget"):
+            if getattr(task, option) is not None:
+                options[option] = getattr(task, option)
+
+        start = time.perf_counter()
+        record: dict[str, Any] = {"id": task.id, "workspace": str(workspace)}
+        try:
+            agent = Agent(
+                llm_client=self.llm_client,
+                system_prompt=self.system_prompt,
+                tools=self._build_tools(workspace),
+                workspace_dir=str(workspace),
+                event_sink=event_sink,
+                profiler=self.profiler,
+                **options,
+            )
+            agent.add_user_message(task.prompt)
+            result = await agent.run()
+            record.update(
+                stop_reason=agent.stop_reason,
+                result=result,
+                error=None,
+                steps=sum(1 for msg in agent.messages if msg.role == "assistant"),
+                tool_calls=sum(1 for msg in agent.messages if msg.role == "tool"),
+                tokens=agent.token_ledger.count(agent.messages),
+                llm_tokens=agent.budget.tokens_used,
+            )
+        except Exception as e:
+            record.update(stop_reason="error", result=None, error=f"{type(e).__name__}: {e}")
+        finally:
+            await event_sink.close()
+
+        record["duration_s"] = round(time.perf_counter() - start, 3)
+        return record
+
+    async def run(self, tasks: list[BatchTask], output_path: str | Path) -> list[dict[str, Any]]:
+        """Run all tasks and append each result to the output JSONL as it finishes
+
+        Args:
+            tasks: Tasks to run
+            output_path: Results file (one JSON record per task, in completion order)
+
+        Returns:
+            Result records in task order
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        with open(output_path, "a", encoding="utf-8") as output:
+
+            async def run_limited(task: BatchTask) -> dict[str, Any]:
+                async with semaphore:
+                    record = await self.run_task(task)
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+                return record
+
+            return list(await asyncio.gather(*(run_limited(task) for task in tasks)))
+
+
+def summarize_results(records: list[dict[str, Any]], wall_time: float) -> dict[str, Any]:
+    """Aggregate batch metrics
+
+    Args:
+        records: Result records from BatchRunner.run
+        wall_time: Wall-clock duration of the whole batch in seconds
+
+    Returns:
+        Metrics: task counts by stop reason, wall time, throughput and task duration stats
+    """
+    by_reason: dict[str, int] = {}
+    for record in records:
+        by_reason[record["stop_reason"]] = by_reason.get(record["stop_reason"], 0) + 1
+    durations = sorted(record["duration_s"] for record in records)
+    return {
+        "tasks": len(records),
+        "stop_reasons": by_reason,
+        "wall_time_s": round(wall_time, 3),
+        "tasks_per_minute": round(len(records) / wall_time * 60, 2) if wall_time > 0 else None,
+        "task_duration_s": {
+            "mean": round(sum(durations) / len(durations), 3) if durations else None,
+            "p50": durations[len(durations) // 2] if durations else None,
+            "max": durations[-1] if durations else None,
+        },
+    }
+
+
+async def run_batch_command(
+    tasks_path: str,
+    output_path: str,
+    workspace_root: str,
+    concurrency: int,
+    record_events: bool = False,
+    profile_path: str | None = None,
+) -> int:
+    """Entry point of `mini-agent batch`
+
+    Returns:
+        Process exit code: 0 if every task ended its turn normally, 1 otherwise
+    """
+    tasks = load_tasks(tasks_path)
+    config = Config.load()
+    llm_client = create_llm_client(config)
+    base_tools, skill_loader = await initialize_base_tools(config)
+    system_prompt = load_system_prompt(config, skill_loader)
+
+    runner = BatchRunner(
+        llm_client=llm_client,
+        base_tools=base_tools,
+        config=config,
+        system_prompt=system_prompt,
+        workspace_root=workspace_root,
+        concurrency=concurrency,
+        record_events=record_events,
+        profiler=Profiler() if profile_path else None,
+    )
+
+    print(f"{Colors.BRIGHT_CYAN}Running {len(tasks)} tasks (concurrency {runner.concurrency}){Colors.RESET}")
+    start = time.perf_counter()
+    try:
+        records = await runner.run(tasks, output_path)
+    finally:
+        await cleanup_mcp_connections()
+        await close_http_sessions()
+    metrics = summarize_results(records, time.perf_counter() - start)
+    routed_client = llm_client
+    if isinstance(llm_client, CachingClient):
+        metrics["response_cache"] = llm_client.cache.stats.to_dict()
+        llm_client.cache.close()
+        routed_client = llm_client.client
+    if isinstance(routed_client, RouterClient):
+        metrics["backends"] = routed_client.stats()
+
+    print(f"{Colors.GREEN}✅ Results written to {output_path}{Colors.RESET}")
+    print(json.dumps(metrics, indent=2))
+    if runner.profiler is not None:
+        print_profile(runner.profiler, profile_path)
+    return 0 if metrics["stop_reasons"].get("end_turn", 0) == len(records) else 1
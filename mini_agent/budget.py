@@ -0,0 +1,123 @@
+"""Per-run time and token budgets
+
+A RunBudget tracks wall-clock time and LLM token consumption of one agent run. Before
+each LLM call the agent asks whether the budget still allows a useful call, and how
+many output tokens it can afford: the remaining token budget minus the tokens of the
+request itself, and the tokens the model can produce in the remaining time at the
+output rate observed so far in the run.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Output token cap when the budget does not constrain it (matches the clients' default)
+DEFAULT_MAX_OUTPUT_TOKENS = 16384
+
+# Below this many affordable output tokens, an LLM call is not worth making
+MIN_OUTPUT_TOKENS = 256
+
+
+@dataclass(slots=True)
+class RunBudget:
+    """Time and token limits of one run, and what has been consumed so far"""
+
+    time_budget: float | None = None  # Seconds of wall-clock time (None: unlimited)
+    token_budget: int | None = None  # Input plus output tokens over all LLM calls (None: unlimited)
+    max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+    min_output_tokens: int = MIN_OUTPUT_TOKENS
+    started: float = field(default_factory=time.monotonic)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    llm_calls: int = 0
+    llm_time: float = 0.0  # Seconds spent waiting for LLM calls, for the output rate
+
+    @property
+    def tokens_used(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining_time(self) -> float | None:
+        """Seconds left, or None without a time budget"""
+        if self.time_budget is None:
+            return None
+        return max(0.0, self.time_budget - self.elapsed())
+
+    def remaining_tokens(self) -> int | None:
+        """Tokens left, or None without a token budget"""
+        if self.token_budget is None:
+            return None
+        return max(0, self.token_budget - self.tokens_used)
+
+    def record(self, input_tokens: int, output_tokens: int, duration: float):
+        """Account for one LLM call"""
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.llm_calls += 1
+        self.llm_time += duration
+
+    def exhausted(self, request_tokens: int) -> str | None:
+        """Check whether the next LLM call fits in the budget
+
+        Args:
+            request_tokens: Estimated input tokens of the next call
+
+        Returns:
+            "time_budget" or "token_budget" if that budget is exhausted, otherwise None
+        """
+        remaining_time = self.remaining_time()
+        if remaining_time is not None and remaining_time <= 0:
+            return "time_budget"
+        remaining_tokens = self.remaining_tokens()
+        if remaining_tokens is not None and remaining_tokens - request_tokens < self.min_output_tokens:
+            return "token_budget"
+        return None
+
+    def max_tokens(self, request_tokens: int) -> int | None:
+        """Output token limit for the next LLM call
+
+        Args:
+            request_tokens: Estimated input tokens of the next call
+
+        Returns:
+            Affordable output tokens (at least min_output_tokens), or None if the budget
+            does not constrain the call
+        """
+        caps = []
+        remaining_tokens = self.remaining_tokens()
+        if remaining_tokens is not None:
+            caps.append(remaining_tokens - request_tokens)
+        remaining_time = self.remaining_time()
+        if remaining_time is not None and self.output_tokens and self.llm_time > 0:
+            caps.append(int(remaining_time * self.output_tokens / self.llm_time))
+
+        if not caps or min(caps) >= self.max_output_tokens:
+            return None
+        return max(self.min_output_tokens, min(caps))
+
+    def describe(self, reason: str) -> str:
+        """Human-readable description of an exhausted budget"""
+        if reason == "time_budget":
+            return f"time budget of {self.time_budget:g}s exhausted after {self.elapsed():.1f}s"
+        return f"token budget of {self.token_budget} tokens exhausted ({self.tokens_used} used)"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Consumption summary"""
+        return {
+            "elapsed_s": round(self.elapsed(), 3),
+            "time_budget_s": self.time_budget,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "token_budget": self.token_budget,
+            "llm_calls": self.llm_calls,
+        }
+
+
+class BudgetExhaustedError(Exception):
+    """Raised when the time budget runs out during an LLM or tool call"""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(reason)
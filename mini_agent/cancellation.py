@@ -0,0 +1,80 @@
+"""Cooperative cancellation of agent runs
+
+A CancellationToken is created for every run. Cancelling it wakes up whatever the run
+is awaiting (an LLM call, a tool batch, summarization) immediately: the awaited work
+runs as its own task, which is cancelled, so HTTP requests are aborted, retry sleeps
+end and tools release their resources (the bash tool kills its subprocess).
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class RunCancelledError(Exception):
+    """Raised when a run is cancelled during an LLM or tool call"""
+
+
+class CancellationToken:
+    """Cancellation flag of one run that can be awaited"""
+
+    def __init__(self):
+        self._event = asyncio.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """Request cancellation; safe to call more than once"""
+        self._event.set()
+
+    async def wait(self):
+        """Wait until the token is cancelled"""
+        await self._event.wait()
+
+    async def race(self, aw: Awaitable[T], timeout: float | None = None) -> tuple[bool, T | None]:
+        """Await `aw` unless the token is cancelled or the timeout expires first
+
+        The work is cancelled (and awaited, so it can clean up) if it loses the race. If it
+        finishes at the same time as the token is cancelled, its result wins.
+
+        Args:
+            aw: Coroutine or future to await
+            timeout: Seconds to wait at most (None: no limit)
+
+        Returns:
+            (True, result) if the work finished, (False, None) if it was interrupted;
+            the `cancelled` property tells a cancellation from a timeout
+
+        Raises:
+            Whatever the work raised, if it finished by raising
+        """
+        if self.cancelled:
+            if asyncio.iscoroutine(aw):
+                aw.close()
+            elif asyncio.isfuture(aw):
+                aw.cancel()
+            return False, None
+
+        task = asyncio.ensure_future(aw)
+        waiter = asyncio.ensure_future(self._event.wait())
+        try:
+            done, _ = await asyncio.wait({task, waiter}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # The caller itself was cancelled: do not leave the work running
+            task.cancel()
+            raise
+        finally:
+            waiter.cancel()
+
+        if task in done:
+            return True, task.result()
+
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await task
+        return False, None
@@ -24,7 +24,12 @@ from prompt_toolkit.styles import Style
 
 from mini_agent import LLMClient
 from mini_agent.agent import Agent
-from mini_agent.config import Config
+from mini_agent.config import Config, RateLimitConfig
+from mini_agent.context_policy import create_context_policy
+from mini_agent.journal import SessionJournal
+from mini_agent.llm import CachingClient, LLMClientBase, RateLimitedClient, RecordingClient, ResponseCache, RouterClient
+from mini_agent.llm.rate_limit import rate_limit_status, shared_rate_limiter
+from mini_agent.profiler import Profiler
 from mini_agent.schema import LLMProvider
 from mini_agent.tools.base import Tool
 from mini_agent.tools.bash_tool import BashKillTool, BashOutputTool, BashTool
@@ -33,6 +38,7 @@ from mini_agent.tools.mcp_loader import cleanup_mcp_connections, load_mcp_tools_
 from mini_agent.tools.note_tool import SessionNoteTool
 from mini_agent.tools.skill_tool import create_skill_tools
 from mini_agent.utils import calculate_display_width
+from mini_agent.utils.http_pool import close_http_sessions
 
 
 # ANSI color codes
@@ -146,6 +152,8 @@ def print_session_info(agent: Agent, workspace_dir: Path, model: str):
     print_info_line(f"Workspace: {workspace_dir}")
     print_info_line(f"Message History: {len(agent.messages)} messages")
     print_info_line(f"Available Tools: {len(agent.tools)} tools")
+    if agent.journal is not None:
+        print_info_line(f"Session: {agent.journal.session_id}")
 
     # Bottom border
     print(f"{Colors.DIM}└{'─' * BOX_WIDTH}┘{Colors.RESET}")
@@ -154,6 +162,15 @@ def print_session_info(agent: Agent, workspace_dir: Path, model: str):
     print()
 
 
+def print_profile(profiler: Profiler, trace_path: str):
+    """Write the profiler's Chrome trace and print its latency summary"""
+    profiler.export_chrome_trace(trace_path)
+    print(f"\n{Colors.BOLD}{Colors.BRIGHT_CYAN}Latency Profile:{Colors.RESET}")
+    print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}")
+    print(profiler.format_summary())
+    print(f"{Colors.GREEN}✅ Chrome trace written to {trace_path} (open in chrome://tracing or ui.perfetto.dev){Colors.RESET}\n")
+
+
 def print_stats(agent: Agent, session_start: datetime):
     """Print session statistics"""
     duration = datetime.now() - session_start
@@ -173,6 +190,10 @@ def print_stats(agent: Agent, session_start: datetime):
     print(f"    - Assistant Replies: {Colors.BRIGHT_BLUE}{assistant_msgs}{Colors.RESET}")
     print(f"    - Tool Calls: {Colors.BRIGHT_YELLOW}{tool_msgs}{Colors.RESET}")
     print(f"  Available Tools: {len(agent.tools)}")
+    for status in rate_limit_status():
+        requests = f"{status['requests']}/{status['request_limit'] or '∞'} requests"
+        tokens = f"{status['tokens']}/{status['token_limit'] or '∞'} tokens"
+        print(f"  Rate Limit {status['name']}: {requests}, {tokens} per {status['window']:g}s, {status['queued']} queued")
     print(f"{Colors.DIM}{'─' * 40}{Colors.RESET}\n")
 
 
@@ -189,6 +210,10 @@ def parse_args() -> argparse.Namespace:
 Examples:
   mini-agent                              # Use current directory as workspace
   mini-agent --workspace /path/to/dir     # Use specific workspace directory
+  mini-agent --resume SESSION_ID          # Resume a journaled session
+  mini-agent batch tasks.jsonl -c 8       # Run tasks from a JSONL file, 8 at a time
+  mini-agent --profile trace.json         # Record a latency trace (chrome://tracing, Perfetto)
+  mini-agent --record session.jsonl       # Record LLM calls to a cassette for offline replay
         """,
     )
     parser.add_argument(
@@ -198,6 +223,31 @@ Examples:
         default=None,
         help="Workspace directory (default: current directory)",
     )
+    parser.add_argument(
+        "--resume",
+        "-r",
+        type=str,
+        default=None,
+        metavar="SESSION_ID",
+        help="Resume a session from its journal (see enable_journal in config)",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="mini_agent_trace.json",
+        default=None,
+        metavar="PATH",
+        help="Profile LLM, tool, summary, logging and rendering latency; write a Chrome trace on exit "
+        "(default path: mini_agent_trace.json) and print a summary table",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Append every LLM request/response of the session to a cassette file (replayed by benchmarks/)",
+    )
     parser.add_argument(
         "--version",
         "-v",
@@ -205,6 +255,39 @@ Examples:
         version="mini-agent 0.1.0",
     )
 
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run tasks from a JSONL file concurrently",
+        description='Run tasks from a JSONL file ({"id": ..., "prompt": ...} per line) concurrently on one event loop.',
+    )
+    batch_parser.add_argument("tasks", type=str, help="JSONL file with one task per line")
+    batch_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="batch_results.jsonl",
+        help="Results JSONL file (default: batch_results.jsonl)",
+    )
+    batch_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Maximum number of tasks running at once (default: 4)",
+    )
+    batch_parser.add_argument(
+        "--workspace-root",
+        type=str,
+        default="./batch_workspaces",
+        help="Parent directory of per-task workspaces (default: ./batch_workspaces)",
+    )
+    batch_parser.add_argument(
+        "--events",
+        action="store_true",
+        help="Write each task's agent events to events.jsonl in its workspace",
+    )
+
     return parser.parse_args()
 
 
@@ -291,7 +374,182 @@ async def initialize_base_tools(config: Config):
     return tools, skill_loader
 
 
-def add_workspace_tools(tools: List[Tool], config: Config, workspace_dir: Path):
+def rate_limited(client: LLMClient, rate_limit: RateLimitConfig) -> LLMClient | RateLimitedClient:
+    """Wrap a client in the process-wide rate limiter of its endpoint and model"""
+    if not rate_limit.enabled:
+        return client
+    key = f"{client.api_base}:{client.model}"
+    limiter = shared_rate_limiter(key, requests=rate_limit.requests, tokens=rate_limit.tokens, window=rate_limit.window)
+    return RateLimitedClient(client, limiter)
+
+
+def create_llm_client(config: Config, verbose: bool = True) -> LLMClient | LLMClientBase:
+    """Create the LLM client described by the configuration
+
+    Retry attempts are reported in the terminal. Backends with a rate limit wait for
+    capacity in a limiter shared by all clients of the process. With extra backends
+    configured, the client is a RouterClient over the primary backend ("primary") and
+    the extra ones. With the response cache enabled, the client is wrapped in a CachingClient.
+
+    Args:
+        config: Configuration object
+        verbose: Print the client setup and retry attempts (off when stdout is a protocol stream)
+
+    Returns:
+        LLM client
+    """
+    from mini_agent.retry import RetryConfig as RetryConfigBase
+
+    # Convert configuration format
+    retry_config = RetryConfigBase(
+        enabled=config.llm.retry.enabled,
+        max_retries=config.llm.retry.max_retries,
+        initial_delay=config.llm.retry.initial_delay,
+        max_delay=config.llm.retry.max_delay,
+        exponential_base=config.llm.retry.exponential_base,
+        retryable_exceptions=(Exception,),
+        jitter=config.llm.retry.jitter,
+        circuit_breaker_threshold=config.llm.retry.circuit_breaker_threshold,
+        circuit_breaker_timeout=config.llm.retry.circuit_breaker_timeout,
+    )
+
+    # Create retry callback function to display retry information in terminal
+    def on_retry(exception: Exception, attempt: int):
+        """Retry callback function to display retry information"""
+        print(f"\n{Colors.BRIGHT_YELLOW}⚠️  LLM call failed (attempt {attempt}): {str(exception)}{Colors.RESET}")
+        print(f"{Colors.DIM}   Retrying (attempt {attempt + 1})...{Colors.RESET}")
+
+    # Convert provider string to LLMProvider enum
+    provider_map = {
+        "anthropic": LLMProvider.ANTHROPIC,
+        "openai": LLMProvider.OPENAI,
+        "zai": LLMProvider.ZAI,
+    }
+    
+    provider = provider_map.get(config.llm.provider.lower(), LLMProvider.OPENAI)
+
+    # With several backends, failing over beats retrying a browned-out one, so backends don't retry
+    routing = bool(config.llm.backends)
+    no_retry = RetryConfigBase(enabled=False)
+
+    llm_client = LLMClient(
+        api_key=config.llm.api_key,
+        provider=provider,
+        api_base=config.llm.api_base,
+        model=config.llm.model,
+        retry_config=no_retry if routing else (retry_config if config.llm.retry.enabled else None),
+        prompt_caching=config.llm.prompt_caching,
+    )
+
+    if config.llm.rate_limit.enabled and verbose:
+        print(f"{Colors.GREEN}✅ LLM rate limit: {config.llm.rate_limit.requests or '∞'} requests, {config.llm.rate_limit.tokens or '∞'} tokens per {config.llm.rate_limit.window:g}s{Colors.RESET}")
+    primary_client = rate_limited(llm_client, config.llm.rate_limit)
+
+    if routing:
+        backends = {"primary": primary_client}
+        for backend in config.llm.backends:
+            backend_client = LLMClient(
+                api_key=backend.api_key,
+                provider=provider_map.get(backend.provider.lower(), LLMProvider.OPENAI),
+                api_base=backend.api_base,
+                model=backend.model,
+                retry_config=no_retry,
+            )
+            backends[backend.name] = rate_limited(backend_client, backend.rate_limit)
+        llm_client = RouterClient(
+            backends,
+            strategy=config.llm.routing.strategy,
+            cooldown=config.llm.routing.cooldown,
+            window=config.llm.routing.window,
+        )
+        if verbose:
+            print(f"{Colors.GREEN}✅ Routing LLM requests over {len(backends)} backends ({config.llm.routing.strategy}){Colors.RESET}")
+    else:
+        if config.llm.retry.enabled and verbose:
+            # Set retry callback
+            llm_client.retry_callback = on_retry
+            print(f"{Colors.GREEN}✅ LLM retry mechanism enabled (max {config.llm.retry.max_retries} retries){Colors.RESET}")
+        llm_client = primary_client
+
+    cache_config = config.llm.response_cache
+    if cache_config.enabled:
+        cache = ResponseCache(
+            cache_config.path,
+            max_entries=cache_config.max_entries,
+            max_bytes=int(cache_config.max_mb * 1024 * 1024),
+            ttl=cache_config.ttl,
+        )
+        llm_client = CachingClient(llm_client, cache)
+        if verbose:
+            print(f"{Colors.GREEN}✅ LLM response cache enabled ({cache.path}, {len(cache)} entries){Colors.RESET}")
+
+    return llm_client
+
+
+def load_system_prompt(config: Config, skill_loader=None) -> str:
+    """Load the system prompt and inject skills metadata
+
+    Args:
+        config: Configuration object
+        skill_loader: Skill loader from initialize_base_tools (None if skills are disabled)
+
+    Returns:
+        System prompt text
+    """
+    # Load System Prompt (with priority search)
+    system_prompt_path = Config.find_config_file(config.agent.system_prompt_path)
+    if system_prompt_path and system_prompt_path.exists():
+        system_prompt = system_prompt_path.read_text(encoding="utf-8")
+        print(f"{Colors.GREEN}✅ Loaded system prompt (from: {system_prompt_path}){Colors.RESET}")
+    else:
+        system_prompt = "You are Mini-Agent, an intelligent assistant powered by MiniMax M2 that can help users complete various tasks."
+        print(f"{Colors.YELLOW}⚠️  System prompt not found, using default{Colors.RESET}")
+
+    # Inject Skills Metadata into System Prompt (Progressive Disclosure - Level 1)
+    if skill_loader:
+        skills_metadata = skill_loader.get_skills_metadata_prompt()
+        if skills_metadata:
+            # Replace placeholder with actual metadata
+            system_prompt = system_prompt.replace("{SKILLS_METADATA}", skills_metadata)
+            print(f"{Colors.GREEN}✅ Injected {len(skill_loader.loaded_skills)} skills metadata into system prompt{Colors.RESET}")
+        else:
+            # Remove placeholder if no skills
+            system_prompt = system_prompt.replace("{SKILLS_METADATA}", "")
+    else:
+        # Remove placeholder if skills not enabled
+        system_prompt = system_prompt.replace("{SKILLS_METADATA}", "")
+
+    return system_prompt
+
+
+def build_agent_options(config: Config) -> dict:
+    """Agent constructor arguments from the configuration (all but LLM, prompt, tools and workspace)
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Keyword arguments for Agent
+    """
+    return dict(
+        max_steps=config.agent.max_steps,
+        parallel_tool_calls=config.agent.parallel_tool_calls,
+        max_parallel_tools=config.agent.max_parallel_tools,
+        stream=config.agent.stream,
+        background_compaction=config.agent.background_compaction,
+        compaction_watermark=config.agent.compaction_watermark,
+        artifact_threshold=config.agent.artifact_threshold,
+        memoize_tools=config.agent.memoize_tools,
+        context_policies=[create_context_policy(spec) for spec in config.agent.context_policies],
+        llm_summarization=config.agent.llm_summarization,
+        time_budget=config.agent.time_budget,
+        token_budget=config.agent.token_budget,
+        max_subagents=config.agent.max_subagents,
+        subagent_max_steps=config.agent.subagent_max_steps,
+    )
+
+
+def add_workspace_tools(tools: List[Tool], config: Config, workspace_dir: Path, verbose: bool = True):
     """Add workspace-dependent tools
 
     These tools need to know the workspace directory.
@@ -300,6 +558,7 @@ def add_workspace_tools(tools: List[Tool], config: Config, workspace_dir: Path):
         tools: Existing tools list to add to
         config: Configuration object
         workspace_dir: Workspace directory path
+        verbose: Print which tools were loaded
     """
     # Ensure workspace directory exists
     workspace_dir.mkdir(parents=True, exist_ok=True)
@@ -313,19 +572,29 @@ def add_workspace_tools(tools: List[Tool], config: Config, workspace_dir: Path):
                 EditTool(workspace_dir=str(workspace_dir)),
             ]
         )
-        print(f"{Colors.GREEN}✅ Loaded file operation tools (workspace: {workspace_dir}){Colors.RESET}")
+        if verbose:
+            print(f"{Colors.GREEN}✅ Loaded file operation tools (workspace: {workspace_dir}){Colors.RESET}")
 
     # Session note tool - needs workspace to store memory file
     if config.tools.enable_note:
         tools.append(SessionNoteTool(memory_file=str(workspace_dir / ".agent_memory.json")))
-        print(f"{Colors.GREEN}✅ Loaded session note tool{Colors.RESET}")
+        if verbose:
+            print(f"{Colors.GREEN}✅ Loaded session note tool{Colors.RESET}")
 
 
-async def run_agent(workspace_dir: Path):
+async def run_agent(
+    workspace_dir: Path,
+    resume_session: str | None = None,
+    profile_path: str | None = None,
+    record_path: str | None = None,
+):
     """Run interactive Agent
 
     Args:
         workspace_dir: Workspace directory path
+        resume_session: Optional id of a journaled session to resume
+        profile_path: If set, profile every run and write a Chrome trace here on exit
+        record_path: If set, record every LLM call to this cassette file
     """
     session_start = datetime.now()
 
@@ -371,46 +640,11 @@ async def run_agent(workspace_dir: Path):
         return
 
     # 2. Initialize LLM client
-    from mini_agent.retry import RetryConfig as RetryConfigBase
-
-    # Convert configuration format
-    retry_config = RetryConfigBase(
-        enabled=config.llm.retry.enabled,
-        max_retries=config.llm.retry.max_retries,
-        initial_delay=config.llm.retry.initial_delay,
-        max_delay=config.llm.retry.max_delay,
-        exponential_base=config.llm.retry.exponential_base,
-        retryable_exceptions=(Exception,),
-    )
-
-    # Create retry callback function to display retry information in terminal
-    def on_retry(exception: Exception, attempt: int):
-        """Retry callback function to display retry information"""
-        print(f"\n{Colors.BRIGHT_YELLOW}⚠️  LLM call failed (attempt {attempt}): {str(exception)}{Colors.RESET}")
-        next_delay = retry_config.calculate_delay(attempt - 1)
-        print(f"{Colors.DIM}   Retrying in {next_delay:.1f}s (attempt {attempt + 1})...{Colors.RESET}")
-
-    # Convert provider string to LLMProvider enum
-    provider_map = {
-        "anthropic": LLMProvider.ANTHROPIC,
-        "openai": LLMProvider.OPENAI,
-        "zai": LLMProvider.ZAI,
-    }
-    
-    provider = provider_map.get(config.llm.provider.lower(), LLMProvider.OPENAI)
-
-    llm_client = LLMClient(
-        api_key=config.llm.api_key,
-        provider=provider,
-        api_base=config.llm.api_base,
-        model=config.llm.model,
-        retry_config=retry_config if config.llm.retry.enabled else None,
-    )
-
-    # Set retry callback
-    if config.llm.retry.enabled:
-        llm_client.retry_callback = on_retry
-        print(f"{Colors.GREEN}✅ LLM retry mechanism enabled (max {config.llm.retry.max_retries} retries){Colors.RESET}")
+    llm_client = create_llm_client(config)
+    response_cache = llm_client.cache if isinstance(llm_client, CachingClient) else None
+    if record_path:
+        llm_client = RecordingClient(llm_client, record_path)
+        print(f"{Colors.GREEN}✅ Recording LLM calls to {record_path}{Colors.RESET}")
 
     # 3. Initialize base tools (independent of workspace)
     tools, skill_loader = await initialize_base_tools(config)
@@ -418,43 +652,42 @@ async def run_agent(workspace_dir: Path):
     # 4. Add workspace-dependent tools
     add_workspace_tools(tools, config, workspace_dir)
 
-    # 5. Load System Prompt (with priority search)
-    system_prompt_path = Config.find_config_file(config.agent.system_prompt_path)
-    if system_prompt_path and system_prompt_path.exists():
-        system_prompt = system_prompt_path.read_text(encoding="utf-8")
-        print(f"{Colors.GREEN}✅ Loaded system prompt (from: {system_prompt_path}){Colors.RESET}")
-    else:
-        system_prompt = "You are Mini-Agent, an intelligent assistant powered by MiniMax M2 that can help users complete various tasks."
-        print(f"{Colors.YELLOW}⚠️  System prompt not found, using default{Colors.RESET}")
+    # 5. Load System Prompt and inject Skills Metadata
+    system_prompt = load_system_prompt(config, skill_loader)
 
-    # 6. Inject Skills Metadata into System Prompt (Progressive Disclosure - Level 1)
-    if skill_loader:
-        skills_metadata = skill_loader.get_skills_metadata_prompt()
-        if skills_metadata:
-            # Replace placeholder with actual metadata
-            system_prompt = system_prompt.replace("{SKILLS_METADATA}", skills_metadata)
-            print(f"{Colors.GREEN}✅ Injected {len(skill_loader.loaded_skills)} skills metadata into system prompt{Colors.RESET}")
-        else:
-            # Remove placeholder if no skills
-            system_prompt = system_prompt.replace("{SKILLS_METADATA}", "")
+    # 6. Create Agent (or rebuild it from a session journal)
+    agent_options = build_agent_options(config)
+    agent_options["workspace_dir"] = str(workspace_dir)
+    profiler = Profiler() if profile_path else None
+    agent_options["profiler"] = profiler
+    if resume_session:
+        try:
+            agent = Agent.resume(
+                resume_session,
+                llm_client=llm_client,
+                tools=tools,
+                journal_dir=config.agent.journal_dir,
+                **agent_options,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            print(f"{Colors.RED}❌ Cannot resume session: {e}{Colors.RESET}")
+            return
+        print(f"{Colors.GREEN}✅ Resumed session {resume_session} ({len(agent.messages)} messages){Colors.RESET}")
     else:
-        # Remove placeholder if skills not enabled
-        system_prompt = system_prompt.replace("{SKILLS_METADATA}", "")
-
-    # 7. Create Agent
-    agent = Agent(
-        llm_client=llm_client,
-        system_prompt=system_prompt,
-        tools=tools,
-        max_steps=config.agent.max_steps,
-        workspace_dir=str(workspace_dir),
-    )
+        journal = SessionJournal(journal_dir=config.agent.journal_dir) if config.agent.enable_journal else None
+        agent = Agent(
+            llm_client=llm_client,
+            system_prompt=system_prompt,
+            tools=tools,
+            journal=journal,
+            **agent_options,
+        )
 
-    # 8. Display welcome information
+    # 7. Display welcome information
     print_banner()
     print_session_info(agent, workspace_dir, config.llm.model)
 
-    # 9. Setup prompt_toolkit session
+    # 8. Setup prompt_toolkit session
     # Command completer
     command_completer = WordCompleter(
         ["/help", "/clear", "/history", "/stats", "/exit", "/quit", "/q"],
@@ -571,10 +804,23 @@ async def run_agent(workspace_dir: Path):
             print(f"\n{Colors.RED}❌ Error: {e}{Colors.RESET}")
             print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}\n")
 
-    # 10. Cleanup MCP connections
+    if agent.journal is not None:
+        agent.journal.close()
+        print(f"{Colors.DIM}Session journaled, resume with: mini-agent --resume {agent.journal.session_id}{Colors.RESET}")
+
+    if profiler is not None:
+        print_profile(profiler, profile_path)
+
+    if response_cache is not None:
+        stats = response_cache.stats
+        print(f"{Colors.DIM}LLM response cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.0%} hit rate){Colors.RESET}")
+        response_cache.close()
+
+    # 10. Cleanup MCP connections and pooled HTTP sessions
     try:
         print(f"{Colors.BRIGHT_CYAN}Cleaning up MCP connections...{Colors.RESET}")
         await cleanup_mcp_connections()
+        await close_http_sessions()
         print(f"{Colors.GREEN}✅ Cleanup complete{Colors.RESET}\n")
     except Exception as e:
         print(f"{Colors.YELLOW}Error during cleanup (can be ignored): {e}{Colors.RESET}\n")
@@ -585,6 +831,21 @@ def main():
     # Parse command line arguments
     args = parse_args()
 
+    if args.command == "batch":
+        from mini_agent.batch import run_batch_command
+
+        exit_code = asyncio.run(
+            run_batch_command(
+                args.tasks,
+                output_path=args.output,
+                workspace_root=args.workspace_root,
+                concurrency=args.concurrency,
+                record_events=args.events,
+                profile_path=args.profile,
+            )
+        )
+        raise SystemExit(exit_code)
+
     # Determine workspace directory
     if args.workspace:
         workspace_dir = Path(args.workspace).absolute()
@@ -596,7 +857,7 @@ def main():
     workspace_dir.mkdir(parents=True, exist_ok=True)
 
     # Run the agent (config always loaded from package directory)
-    asyncio.run(run_agent(workspace_dir))
+    asyncio.run(run_agent(workspace_dir, resume_session=args.resume, profile_path=args.profile, record_path=args.record))
 
 
 if __name__ == "__main__":
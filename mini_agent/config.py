@@ -5,10 +5,14 @@ Provides unified configuration loading and management functionality
 
 import os
 from pathlib import Path
+from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+from .context_policy import create_context_policy
+from .llm.router import ROUTING_STRATEGIES
+
 # Load .env file if it exists
 def load_env_file():
     """Load environment variables from .env file if it exists."""
@@ -33,6 +37,50 @@ class RetryConfig(BaseModel):
     initial_delay: float = 1.0
     max_delay: float = 60.0
     exponential_base: float = 2.0
+    jitter: bool = True
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_timeout: float = 30.0
+
+
+class ResponseCacheConfig(BaseModel):
+    """LLM response cache configuration"""
+
+    enabled: bool = False
+    path: str = "~/.mini-agent/cache/llm_responses.sqlite"
+    max_entries: int = 10000
+    max_mb: float = 256.0  # Maximum total size of cached responses
+    ttl: float | None = 604800.0  # Seconds a cached response stays valid (None: no expiry)
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side rate limit of one LLM backend, shared by all sessions of the process"""
+
+    requests: int | None = None  # Maximum requests per window (None: unlimited)
+    tokens: int | None = None  # Maximum input plus output tokens per window (None: unlimited)
+    window: float = 60.0  # Window length in seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests is not None or self.tokens is not None
+
+
+class LLMBackendConfig(BaseModel):
+    """Additional LLM backend for multi-provider routing"""
+
+    name: str
+    api_key: str
+    api_base: str = "https://api.minimax.io"
+    model: str = "MiniMax-M2"
+    provider: str = "openai"
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+
+
+class RoutingConfig(BaseModel):
+    """Multi-provider routing configuration"""
+
+    strategy: str = "latency"  # "latency" (fastest healthy backend) or "priority" (configured order)
+    cooldown: float = 30.0  # Seconds a failed backend is skipped, doubled per consecutive failure
+    window: int = 20  # Recent calls per backend the error rate is computed over
 
 
 class LLMConfig(BaseModel):
@@ -43,6 +91,11 @@ class LLMConfig(BaseModel):
     model: str = "MiniMax-M2"  # Primary: MiniMax-M2 for reasoning (300 prompts/5hrs)
     provider: str = "openai"   # Primary: OpenAI-compatible API for MiniMax
     retry: RetryConfig = Field(default_factory=RetryConfig)
+    prompt_caching: bool = False  # Cache the stable prompt prefix (anthropic provider)
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)  # Serve repeated requests from disk
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)  # Provider quota, enforced client-side
+    backends: list[LLMBackendConfig] = Field(default_factory=list)  # Extra backends; any set enables routing
+    routing: RoutingConfig = Field(default_factory=RoutingConfig)
 
 
 class AgentConfig(BaseModel):
@@ -51,6 +104,21 @@ class AgentConfig(BaseModel):
     max_steps: int = 50
     workspace_dir: str = "./workspace"
     system_prompt_path: str = "system_prompt.md"
+    parallel_tool_calls: bool = False  # Run parallel-safe tool calls of one step concurrently
+    max_parallel_tools: int = 4  # Concurrency cap for parallel tool dispatch
+    stream: bool = False  # Stream LLM output to the terminal/ACP client as it is generated
+    background_compaction: bool = False  # Summarize older rounds while tools execute
+    compaction_watermark: float = 0.7  # Fraction of the token limit that starts background compaction
+    artifact_threshold: int = 0  # Tool results longer than this many chars are stored as artifacts (0: off)
+    memoize_tools: bool = False  # Serve repeated read-only tool calls within a run from cache
+    context_policies: list[str | dict[str, Any]] = Field(default_factory=list)  # Local eviction strategies, tried in order
+    llm_summarization: bool = True  # Summarize with the LLM when context policies are not enough
+    time_budget: float | None = None  # Wall-clock limit per run in seconds (None: unlimited)
+    token_budget: int | None = None  # LLM input plus output token limit per run (None: unlimited)
+    max_subagents: int = 0  # Sub-agents run concurrently by spawn_subagents (0: tool disabled)
+    subagent_max_steps: int = 20  # Step limit of each sub-agent
+    enable_journal: bool = False  # Journal session history for crash-safe resume
+    journal_dir: str = "~/.mini-agent/sessions"
 
 
 class ToolsConfig(BaseModel):
@@ -151,7 +219,58 @@ class Config(BaseModel):
             initial_delay=retry_data.get("initial_delay", 1.0),
             max_delay=retry_data.get("max_delay", 60.0),
             exponential_base=retry_data.get("exponential_base", 2.0),
+            jitter=retry_data.get("jitter", True),
+            circuit_breaker_threshold=retry_data.get("circuit_breaker_threshold", 5),
+            circuit_breaker_timeout=retry_data.get("circuit_breaker_timeout", 30.0),
+        )
+
+        # Parse response cache configuration
+        cache_data = data.get("response_cache") or {}
+        response_cache_config = ResponseCacheConfig(
+            enabled=cache_data.get("enabled", False),
+            path=cache_data.get("path", "~/.mini-agent/cache/llm_responses.sqlite"),
+            max_entries=cache_data.get("max_entries", 10000),
+            max_mb=cache_data.get("max_mb", 256.0),
+            ttl=cache_data.get("ttl", 604800.0),
+        )
+
+        def parse_rate_limit(limit_data: dict[str, Any] | None) -> RateLimitConfig:
+            limit_data = limit_data or {}
+            limit_config = RateLimitConfig(
+                requests=limit_data.get("requests"),
+                tokens=limit_data.get("tokens"),
+                window=limit_data.get("window", 60.0),
+            )
+            if limit_config.window <= 0:
+                raise ValueError("rate_limit window must be positive")
+            return limit_config
+
+        # Parse multi-provider routing configuration
+        backends = []
+        for i, backend_data in enumerate(data.get("backends") or []):
+            if not backend_data.get("api_key"):
+                raise ValueError(f"LLM backend {backend_data.get('name', i + 1)} is missing api_key")
+            backends.append(
+                LLMBackendConfig(
+                    name=backend_data.get("name") or f"backend-{i + 1}",
+                    api_key=backend_data["api_key"],
+                    api_base=backend_data.get("api_base", "https://api.minimax.io"),
+                    model=backend_data.get("model", "MiniMax-M2"),
+                    provider=backend_data.get("provider", "openai"),
+                    rate_limit=parse_rate_limit(backend_data.get("rate_limit")),
+                )
+            )
+        names = [backend.name for backend in backends]
+        if "primary" in names or len(set(names)) != len(names):
+            raise ValueError("LLM backend names must be unique and not 'primary' (the main backend's name)")
+        routing_data = data.get("routing") or {}
+        routing_config = RoutingConfig(
+            strategy=routing_data.get("strategy", "latency"),
+            cooldown=routing_data.get("cooldown", 30.0),
+            window=routing_data.get("window", 20),
         )
+        if routing_config.strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown routing strategy: {routing_config.strategy} (available: {', '.join(ROUTING_STRATEGIES)})")
 
         llm_config = LLMConfig(
             api_key=data["api_key"],
@@ -159,6 +278,11 @@ class Config(BaseModel):
             model=data.get("model", "MiniMax-M2"),
             provider=data.get("provider", "openai"),  # Using OpenAI protocol for MiniMax
             retry=retry_config,
+            prompt_caching=data.get("prompt_caching", False),
+            response_cache=response_cache_config,
+            rate_limit=parse_rate_limit(data.get("rate_limit")),
+            backends=backends,
+            routing=routing_config,
         )
 
         # Parse Agent configuration
@@ -166,7 +290,25 @@ class Config(BaseModel):
             max_steps=data.get("max_steps", 50),
             workspace_dir=data.get("workspace_dir", "./workspace"),
             system_prompt_path=data.get("system_prompt_path", "system_prompt.md"),
+            parallel_tool_calls=data.get("parallel_tool_calls", False),
+            max_parallel_tools=data.get("max_parallel_tools", 4),
+            stream=data.get("stream", False),
+            background_compaction=data.get("background_compaction", False),
+            compaction_watermark=data.get("compaction_watermark", 0.7),
+            artifact_threshold=data.get("artifact_threshold", 0),
+            memoize_tools=data.get("memoize_tools", False),
+            context_policies=data.get("context_policies") or [],
+            llm_summarization=data.get("llm_summarization", True),
+            time_budget=data.get("time_budget"),
+            token_budget=data.get("token_budget"),
+            max_subagents=data.get("max_subagents", 0),
+            subagent_max_steps=data.get("subagent_max_steps", 20),
+            enable_journal=data.get("enable_journal", False),
+            journal_dir=data.get("journal_dir", "~/.mini-agent/sessions"),
         )
+        # Reject unknown context policies at load time rather than at the first overflow
+        for spec in agent_config.context_policies:
+            create_context_policy(spec)
 
         # Parse tools configuration
         tools_data = data.get("tools", {})
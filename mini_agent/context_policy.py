@@ -0,0 +1,185 @@
+"""Deterministic context eviction policies
+
+When message history grows over the token limit, the agent applies its context policies
+in order, until history fits; LLM summarization only runs if it still does not fit (or
+not at all, if disabled). Policies work locally on message contents, so they cost no LLM
+round-trip. Most overflows come from a few huge tool outputs, which these policies
+shrink first.
+
+Policies never remove or modify user messages other than by dropping them with the
+sliding window, and they keep every tool result paired with its tool call: elided tool
+outputs are replaced by a short marker instead of being removed.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from .schema import Message
+
+# Start of the placeholder left in place of an elided tool output
+ELIDED_MARKER = "[Tool output elided to save context"
+
+# Token count of a message history
+TokenCounter = Callable[[list[Message]], int]
+
+
+def _with_content(msg: Message, content: str) -> Message:
+    """Copy of a message with new content (history messages are never modified in place)"""
+    return msg.model_copy(update={"content": content})
+
+
+def _elided(msg: Message) -> Message:
+    return _with_content(msg, f"{ELIDED_MARKER}: {len(msg.content)} chars from {msg.name or 'tool'}]")
+
+
+def _tool_indices(messages: list[Message], keep_last: int) -> list[int]:
+    """Indices of tool messages that may be shrunk: all but the last keep_last, not yet elided"""
+    indices = [i for i, msg in enumerate(messages) if msg.role == "tool"]
+    if keep_last > 0:
+        indices = indices[:-keep_last]
+    return [i for i in indices if not messages[i].content.startswith(ELIDED_MARKER)]
+
+
+class ContextPolicy(ABC):
+    """Strategy that shrinks message history without calling the LLM"""
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def apply(self, messages: list[Message], token_limit: int, count_tokens: TokenCounter) -> list[Message]:
+        """Shrink history towards the token limit
+
+        Args:
+            messages: Current history (not modified; changed messages are replaced by copies)
+            token_limit: Token count history should fit in
+            count_tokens: Token counter for a history
+
+        Returns:
+            The new history
+        """
+
+
+class TruncateToolOutputs(ContextPolicy):
+    """Cut large tool outputs down to their head and tail"""
+
+    name = "truncate_tool_outputs"
+
+    def __init__(self, max_chars: int = 4000, keep_last: int = 0):
+        """Initialize policy.
+
+        Args:
+            max_chars: Tool outputs longer than this many chars are truncated
+            keep_last: Number of most recent tool outputs left intact
+        """
+        self.max_chars = max_chars
+        self.keep_last = keep_last
+
+    def apply(self, messages: list[Message], token_limit: int, count_tokens: TokenCounter) -> list[Message]:
+        result = list(messages)
+        half = self.max_chars // 2
+        for i in _tool_indices(messages, self.keep_last):
+            content = messages[i].content
+            if len(content) > self.max_chars:
+                omitted = len(content) - 2 * half
+                result[i] = _with_content(messages[i], f"{content[:half]}\n\n... [{omitted} chars truncated] ...\n\n{content[-half:]}")
+        return result
+
+
+class ElideOldToolOutputs(ContextPolicy):
+    """Replace tool outputs by a placeholder, oldest first, until history fits"""
+
+    name = "elide_old_tool_outputs"
+
+    def __init__(self, keep_last: int = 2):
+        """Initialize policy.
+
+        Args:
+            keep_last: Number of most recent tool outputs never elided
+        """
+        self.keep_last = keep_last
+
+    def apply(self, messages: list[Message], token_limit: int, count_tokens: TokenCounter) -> list[Message]:
+        result = list(messages)
+        for i in _tool_indices(messages, self.keep_last):
+            if count_tokens(result) <= token_limit:
+                break
+            result[i] = _elided(messages[i])
+        return result
+
+
+class KeepLastToolResults(ContextPolicy):
+    """Elide every tool output except the last N"""
+
+    name = "keep_last_tool_results"
+
+    def __init__(self, keep_last: int = 5):
+        """Initialize policy.
+
+        Args:
+            keep_last: Number of most recent tool outputs kept
+        """
+        self.keep_last = keep_last
+
+    def apply(self, messages: list[Message], token_limit: int, count_tokens: TokenCounter) -> list[Message]:
+        result = list(messages)
+        for i in _tool_indices(messages, self.keep_last):
+            result[i] = _elided(messages[i])
+        return result
+
+
+class SlidingWindow(ContextPolicy):
+    """Drop the oldest messages until history fits
+
+    The system prompt, the first user message (the original task) and the last user message
+    are always kept. The window starts at a user or assistant message, so no tool result is
+    separated from its tool call.
+    """
+
+    name = "sliding_window"
+
+    def apply(self, messages: list[Message], token_limit: int, count_tokens: TokenCounter) -> list[Message]:
+        user_indices = [i for i, msg in enumerate(messages) if msg.role == "user"]
+        if not user_indices:
+            return list(messages)
+
+        head_end = user_indices[0] + 1
+        head = messages[:head_end]
+        cut_points = [i for i in range(head_end + 1, user_indices[-1] + 1) if messages[i].role in ("user", "assistant")]
+
+        result = list(messages)
+        for cut in cut_points:
+            result = head + messages[cut:]
+            if count_tokens(result) <= token_limit:
+                break
+        return result
+
+
+CONTEXT_POLICIES: dict[str, type[ContextPolicy]] = {
+    policy.name: policy for policy in (TruncateToolOutputs, ElideOldToolOutputs, KeepLastToolResults, SlidingWindow)
+}
+
+
+def create_context_policy(spec: str | dict[str, Any]) -> ContextPolicy:
+    """Create a policy from its configuration
+
+    Args:
+        spec: Policy name, or a dict with the name and constructor arguments,
+            e.g. {"name": "truncate_tool_outputs", "max_chars": 2000}
+
+    Raises:
+        ValueError: Unknown policy name or invalid arguments
+    """
+    if isinstance(spec, str):
+        name, params = spec, {}
+    else:
+        params = dict(spec)
+        name = params.pop("name", None)
+
+    policy_cls = CONTEXT_POLICIES.get(name)
+    if policy_cls is None:
+        raise ValueError(f"Unknown context policy: {name} (available: {', '.join(CONTEXT_POLICIES)})")
+    try:
+        return policy_cls(**params)
+    except TypeError as e:
+        raise ValueError(f"Invalid arguments for context policy {name}: {e}") from e
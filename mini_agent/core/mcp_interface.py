@@ -12,6 +12,8 @@ import aiohttp
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from ..utils.http_pool import get_http_session
+
 class ZAIMCPSearchInterface:
     def __init__(self):
         self.zai_api_key = os.getenv('ZAI_API_KEY')
@@ -53,47 +55,47 @@ class ZAIMCPSearchInterface:
                 "Accept-Language": "en-US,en"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/web_search",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/web_search",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    search_results = result.get("search_result", [])
+                    
+                    # Format results for MCP consumption
+                    formatted_results = []
+                    for item in search_results:
+                        formatted_results.append({
+                            'title': item.get('title', 'N/A'),
+                            'url': item.get('link', ''),
+                            'snippet': item.get('content', '')[:200] + '...'  # Snippet for efficiency
+                        })
+                    
+                    # Increment quota usage
+                    self.search_count += 1
+                    
+                    return {
+                        'success': True,
+                        'query': query,
+                        'results': formatted_results,
+                        'result_count': len(formatted_results),
+                        'quota_used': self.search_count,
+                        'quota_remaining': self.max_searches - self.search_count,
+                        'mcp_mode': True,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'error': f"API error: {response.status}",
+                        'quota_used': self.search_count
+                    }
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        search_results = result.get("search_result", [])
-                        
-                        # Format results for MCP consumption
-                        formatted_results = []
-                        for item in search_results:
-                            formatted_results.append({
-                                'title': item.get('title', 'N/A'),
-                                'url': item.get('link', ''),
-                                'snippet': item.get('content', '')[:200] + '...'  # Snippet for efficiency
-                            })
-                        
-                        # Increment quota usage
-                        self.search_count += 1
-                        
-                        return {
-                            'success': True,
-                            'query': query,
-                            'results': formatted_results,
-                            'result_count': len(formatted_results),
-                            'quota_used': self.search_count,
-                            'quota_remaining': self.max_searches - self.search_count,
-                            'mcp_mode': True,
-                            'timestamp': datetime.now().isoformat()
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'error': f"API error: {response.status}",
-                            'quota_used': self.search_count
-                        }
-                        
         except Exception as e:
             return {
                 'success': False,
@@ -127,42 +129,42 @@ class ZAIMCPSearchInterface:
                 "Content-Type": "application/json"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/reader",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=45)
-                ) as response:
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/reader",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=45)
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    reader_result = result.get("web_page_reader_result", {})
+                    
+                    content = reader_result.get("content", "")
+                    if len(content) > max_length:
+                        content = content[:max_length] + "\n\n[Content truncated for quota efficiency]"
+                    
+                    # Increment quota usage
+                    self.reader_count += 1
+                    
+                    return {
+                        'success': True,
+                        'url': url,
+                        'content': content,
+                        'title': reader_result.get('title', 'N/A'),
+                        'quota_used': self.reader_count,
+                        'quota_remaining': self.max_readers - self.reader_count,
+                        'mcp_mode': True,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'error': f"Reader error: {response.status}",
+                        'quota_used': self.reader_count
+                    }
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        reader_result = result.get("web_page_reader_result", {})
-                        
-                        content = reader_result.get("content", "")
-                        if len(content) > max_length:
-                            content = content[:max_length] + "\n\n[Content truncated for quota efficiency]"
-                        
-                        # Increment quota usage
-                        self.reader_count += 1
-                        
-                        return {
-                            'success': True,
-                            'url': url,
-                            'content': content,
-                            'title': reader_result.get('title', 'N/A'),
-                            'quota_used': self.reader_count,
-                            'quota_remaining': self.max_readers - self.reader_count,
-                            'mcp_mode': True,
-                            'timestamp': datetime.now().isoformat()
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'error': f"Reader error: {response.status}",
-                            'quota_used': self.reader_count
-                        }
-                        
         except Exception as e:
             return {
                 'success': False,
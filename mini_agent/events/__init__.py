@@ -0,0 +1,44 @@
+"""Agent event stream: typed events emitted by the agent loop and the sinks consuming them."""
+
+from .base import (
+    AgentEvent,
+    AssistantMessage,
+    ContextTrimmed,
+    EventSink,
+    LLMDelta,
+    LLMError,
+    Notice,
+    RunFinished,
+    RunStarted,
+    StepStarted,
+    SummaryFinished,
+    SummaryRound,
+    SummaryStarted,
+    ToolFinished,
+    ToolStarted,
+)
+from .sinks import JsonlSink, MultiSink, NullSink
+from .terminal import Colors, TerminalSink
+
+__all__ = [
+    "AgentEvent",
+    "AssistantMessage",
+    "ContextTrimmed",
+    "EventSink",
+    "LLMDelta",
+    "LLMError",
+    "Notice",
+    "RunFinished",
+    "RunStarted",
+    "StepStarted",
+    "SummaryFinished",
+    "SummaryRound",
+    "SummaryStarted",
+    "ToolFinished",
+    "ToolStarted",
+    "Colors",
+    "JsonlSink",
+    "MultiSink",
+    "NullSink",
+    "TerminalSink",
+]
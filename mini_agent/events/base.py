@@ -0,0 +1,169 @@
+"""Typed agent events and the sink interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar
+
+from pydantic import BaseModel
+
+from ..schema import ToolCall
+from ..tools.base import ToolResult
+
+
+@dataclass(slots=True)
+class AgentEvent:
+    """Base class for events emitted by the agent loop"""
+
+    type: ClassVar[str] = "event"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert event to a JSON-serializable dict, tagged with its type"""
+        data: dict[str, Any] = {"type": self.type}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, BaseModel):
+                value = value.model_dump()
+            elif isinstance(value, list):
+                value = [item.model_dump() if isinstance(item, BaseModel) else item for item in value]
+            data[field.name] = value
+        return data
+
+
+@dataclass(slots=True)
+class RunStarted(AgentEvent):
+    """A run started; log_file is where AgentLogger writes this run"""
+
+    type: ClassVar[str] = "run_started"
+    log_file: str
+
+
+@dataclass(slots=True)
+class StepStarted(AgentEvent):
+    """A new step (one LLM call plus its tool calls) started; step is 1-based"""
+
+    type: ClassVar[str] = "step_started"
+    step: int
+    max_steps: int
+
+
+@dataclass(slots=True)
+class LLMDelta(AgentEvent):
+    """Incremental LLM output while streaming; kind is "thinking" or "text" """
+
+    type: ClassVar[str] = "llm_delta"
+    kind: str
+    delta: str
+
+
+@dataclass(slots=True)
+class AssistantMessage(AgentEvent):
+    """Complete assistant response; streamed is True if it was already sent as deltas"""
+
+    type: ClassVar[str] = "assistant_message"
+    content: str
+    thinking: str | None = None
+    tool_calls: list[ToolCall] | None = None
+    finish_reason: str | None = None
+    streamed: bool = False
+
+
+@dataclass(slots=True)
+class LLMError(AgentEvent):
+    """LLM call failed; attempts is set when retries were exhausted"""
+
+    type: ClassVar[str] = "llm_error"
+    message: str
+    attempts: int | None = None
+
+
+@dataclass(slots=True)
+class ToolStarted(AgentEvent):
+    """Tool call is about to be executed"""
+
+    type: ClassVar[str] = "tool_started"
+    tool_call: ToolCall
+
+
+@dataclass(slots=True)
+class ToolFinished(AgentEvent):
+    """Tool call finished (successfully or not)"""
+
+    type: ClassVar[str] = "tool_finished"
+    tool_call: ToolCall
+    result: ToolResult
+
+
+@dataclass(slots=True)
+class SummaryStarted(AgentEvent):
+    """History summarization started (background=True for watermark-triggered compaction)"""
+
+    type: ClassVar[str] = "summary_started"
+    tokens: int
+    token_limit: int
+    background: bool = False
+
+
+@dataclass(slots=True)
+class SummaryRound(AgentEvent):
+    """Summary for one round was generated, or fell back to plain text on error"""
+
+    type: ClassVar[str] = "summary_round"
+    round_num: int
+    success: bool
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class SummaryFinished(AgentEvent):
+    """Summarized history was swapped in"""
+
+    type: ClassVar[str] = "summary_finished"
+    tokens_before: int
+    tokens_after: int
+    spans: int
+    background: bool = False
+
+
+@dataclass(slots=True)
+class ContextTrimmed(AgentEvent):
+    """A context policy shrank history without calling the LLM"""
+
+    type: ClassVar[str] = "context_trimmed"
+    policy: str
+    tokens_before: int
+    tokens_after: int
+
+
+@dataclass(slots=True)
+class Notice(AgentEvent):
+    """Free-form status message; level is "info", "warning" or "error" """
+
+    type: ClassVar[str] = "notice"
+    level: str
+    message: str
+
+
+@dataclass(slots=True)
+class RunFinished(AgentEvent):
+    """Run ended; stop_reason is "end_turn", "max_steps", "error" or "cancelled" """
+
+    type: ClassVar[str] = "run_finished"
+    stop_reason: str
+    content: str
+
+
+class EventSink(ABC):
+    """Consumer of agent events"""
+
+    @abstractmethod
+    async def emit(self, event: AgentEvent) -> None:
+        """Handle one event
+
+        Args:
+            event: Event emitted by the agent loop
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the sink"""
+        pass
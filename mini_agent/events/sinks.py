@@ -0,0 +1,68 @@
+"""Headless event sinks: null, JSONL and fan-out."""
+
+import json
+import time
+from pathlib import Path
+from typing import IO
+
+from .base import AgentEvent, EventSink
+
+
+class NullSink(EventSink):
+    """Sink that discards all events (headless runs with no rendering cost)"""
+
+    async def emit(self, event: AgentEvent) -> None:
+        pass
+
+
+class JsonlSink(EventSink):
+    """Sink that appends one JSON object per event to a file
+
+    Each line is the event's fields plus "type" and a "timestamp" (seconds since epoch).
+    Streaming deltas are skipped unless include_deltas is set, since the complete
+    assistant message is recorded anyway.
+    """
+
+    def __init__(self, target: str | Path | IO[str], include_deltas: bool = False):
+        """Initialize JSONL sink.
+
+        Args:
+            target: File path (opened in append mode) or an already open text stream
+            include_deltas: Whether to record llm_delta events
+        """
+        if isinstance(target, (str, Path)):
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self.include_deltas = include_deltas
+
+    async def emit(self, event: AgentEvent) -> None:
+        if event.type == "llm_delta" and not self.include_deltas:
+            return
+        record = event.to_dict()
+        record["timestamp"] = time.time()
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+
+    async def close(self) -> None:
+        if self._owns_file and not self._file.closed:
+            self._file.close()
+
+
+class MultiSink(EventSink):
+    """Sink that forwards every event to several sinks, in order"""
+
+    def __init__(self, *sinks: EventSink):
+        self.sinks = list(sinks)
+
+    async def emit(self, event: AgentEvent) -> None:
+        for sink in self.sinks:
+            await sink.emit(event)
+
+    async def close(self) -> None:
+        for sink in self.sinks:
+            await sink.close()
@@ -0,0 +1,181 @@
+"""Terminal renderer for agent events."""
+
+import json
+
+from ..utils import calculate_display_width
+from .base import (
+    AgentEvent,
+    AssistantMessage,
+    ContextTrimmed,
+    EventSink,
+    LLMDelta,
+    LLMError,
+    Notice,
+    RunFinished,
+    RunStarted,
+    StepStarted,
+    SummaryFinished,
+    SummaryRound,
+    SummaryStarted,
+    ToolFinished,
+    ToolStarted,
+)
+
+
+# ANSI color codes
+class Colors:
+    """Terminal color definitions"""
+
+    RESET = "\033[0m"
+    BOLD = "\033[1m"
+    DIM = "\033[2m"
+
+    # Foreground colors
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+
+    # Bright colors
+    BRIGHT_BLACK = "\033[90m"
+    BRIGHT_RED = "\033[91m"
+    BRIGHT_GREEN = "\033[92m"
+    BRIGHT_YELLOW = "\033[93m"
+    BRIGHT_BLUE = "\033[94m"
+    BRIGHT_MAGENTA = "\033[95m"
+    BRIGHT_CYAN = "\033[96m"
+    BRIGHT_WHITE = "\033[97m"
+
+
+NOTICE_STYLES = {
+    "info": (Colors.DIM, ""),
+    "warning": (Colors.BRIGHT_YELLOW, "⚠️  "),
+    "error": (Colors.BRIGHT_RED, "✗ "),
+}
+
+
+class TerminalSink(EventSink):
+    """Render agent events to stdout with colors and box drawing (interactive CLI)"""
+
+    def __init__(self):
+        self._section: str | None = None  # Streaming section being printed: "thinking" or "text"
+
+    async def emit(self, event: AgentEvent) -> None:
+        if isinstance(event, LLMDelta):
+            self._print_delta(event)
+        elif isinstance(event, AssistantMessage):
+            self._print_assistant_message(event)
+        elif isinstance(event, ToolStarted):
+            self._print_tool_call(event)
+        elif isinstance(event, ToolFinished):
+            self._print_tool_result(event)
+        elif isinstance(event, StepStarted):
+            self._print_step_header(event)
+        elif isinstance(event, RunStarted):
+            print(f"{Colors.DIM}📝 Log file: {event.log_file}{Colors.RESET}")
+        elif isinstance(event, SummaryStarted):
+            if event.background:
+                print(f"{Colors.DIM}🔄 Background compaction started (tokens {event.tokens}/{event.token_limit}){Colors.RESET}")
+            else:
+                print(f"\n{Colors.BRIGHT_YELLOW}📊 Token estimate: {event.tokens}/{event.token_limit}{Colors.RESET}")
+                print(f"{Colors.BRIGHT_YELLOW}🔄 Triggering message history summarization...{Colors.RESET}")
+        elif isinstance(event, SummaryRound):
+            if event.success:
+                print(f"{Colors.BRIGHT_GREEN}✓ Summary for round {event.round_num} generated successfully{Colors.RESET}")
+            else:
+                print(f"{Colors.BRIGHT_RED}✗ Summary generation failed for round {event.round_num}: {event.error}{Colors.RESET}")
+        elif isinstance(event, SummaryFinished):
+            label = "Background compaction applied" if event.background else "Summary completed"
+            print(f"{Colors.BRIGHT_GREEN}✓ {label}, tokens reduced from {event.tokens_before} to {event.tokens_after}{Colors.RESET}")
+            print(f"{Colors.DIM}  Summarized {event.spans} new span(s){Colors.RESET}")
+        elif isinstance(event, ContextTrimmed):
+            print(f"{Colors.BRIGHT_GREEN}✓ Context policy {event.policy}: tokens reduced from {event.tokens_before} to {event.tokens_after}{Colors.RESET}")
+        elif isinstance(event, Notice):
+            color, icon = NOTICE_STYLES.get(event.level, NOTICE_STYLES["info"])
+            print(f"{color}{icon}{event.message}{Colors.RESET}")
+        elif isinstance(event, LLMError):
+            self._end_section()
+            if event.attempts is not None:
+                print(f"\n{Colors.BRIGHT_RED}❌ Retry failed:{Colors.RESET} {event.message}")
+            else:
+                print(f"\n{Colors.BRIGHT_RED}❌ Error:{Colors.RESET} {event.message}")
+        elif isinstance(event, RunFinished) and event.stop_reason in ("max_steps", "cancelled", "time_budget", "token_budget"):
+            print(f"\n{Colors.BRIGHT_YELLOW}⚠️  {event.content}{Colors.RESET}")
+
+    def _print_step_header(self, event: StepStarted):
+        """Print step header with proper width calculation"""
+        BOX_WIDTH = 58
+        step_text = f"{Colors.BOLD}{Colors.BRIGHT_CYAN}💭 Step {event.step}/{event.max_steps}{Colors.RESET}"
+        step_display_width = calculate_display_width(step_text)
+        padding = max(0, BOX_WIDTH - 1 - step_display_width)  # -1 for leading space
+
+        print(f"\n{Colors.DIM}╭{'─' * BOX_WIDTH}╮{Colors.RESET}")
+        print(f"{Colors.DIM}│{Colors.RESET} {step_text}{' ' * padding}{Colors.DIM}│{Colors.RESET}")
+        print(f"{Colors.DIM}╰{'─' * BOX_WIDTH}╯{Colors.RESET}")
+
+    def _print_delta(self, event: LLMDelta):
+        """Print a streamed thinking/text delta, opening a section header on change"""
+        if event.kind == "thinking":
+            if self._section != "thinking":
+                print(f"\n{Colors.BOLD}{Colors.MAGENTA}🧠 Thinking:{Colors.RESET}")
+                self._section = "thinking"
+            print(f"{Colors.DIM}{event.delta}{Colors.RESET}", end="", flush=True)
+        elif event.kind == "text":
+            if self._section != "text":
+                if self._section:
+                    print()
+                print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}🤖 Assistant:{Colors.RESET}")
+                self._section = "text"
+            print(event.delta, end="", flush=True)
+
+    def _end_section(self):
+        """Terminate the line of an open streaming section"""
+        if self._section:
+            print()
+            self._section = None
+
+    def _print_assistant_message(self, event: AssistantMessage):
+        """Print thinking and assistant response (already printed while streaming)"""
+        if event.streamed:
+            self._end_section()
+            return
+
+        if event.thinking:
+            print(f"\n{Colors.BOLD}{Colors.MAGENTA}🧠 Thinking:{Colors.RESET}")
+            print(f"{Colors.DIM}{event.thinking}{Colors.RESET}")
+
+        if event.content:
+            print(f"\n{Colors.BOLD}{Colors.BRIGHT_BLUE}🤖 Assistant:{Colors.RESET}")
+            print(f"{event.content}")
+
+    def _print_tool_call(self, event: ToolStarted):
+        """Print tool call header and (truncated) arguments"""
+        tool_call = event.tool_call
+        print(f"\n{Colors.BRIGHT_YELLOW}🔧 Tool Call:{Colors.RESET} {Colors.BOLD}{Colors.CYAN}{tool_call.function.name}{Colors.RESET}")
+
+        # Arguments (formatted display)
+        print(f"{Colors.DIM}   Arguments:{Colors.RESET}")
+        # Truncate each argument value to avoid overly long output
+        truncated_args = {}
+        for key, value in tool_call.function.arguments.items():
+            value_str = str(value)
+            if len(value_str) > 200:
+                truncated_args[key] = value_str[:200] + "..."
+            else:
+                truncated_args[key] = value
+        args_json = json.dumps(truncated_args, indent=2, ensure_ascii=False)
+        for line in args_json.split("\n"):
+            print(f"   {Colors.DIM}{line}{Colors.RESET}")
+
+    def _print_tool_result(self, event: ToolFinished):
+        """Print tool result (truncated) or error"""
+        result = event.result
+        if result.success:
+            result_text = result.content
+            if len(result_text) > 300:
+                result_text = result_text[:300] + f"{Colors.DIM}...{Colors.RESET}"
+            print(f"{Colors.BRIGHT_GREEN}✓ Result:{Colors.RESET} {result_text}")
+        else:
+            print(f"{Colors.BRIGHT_RED}✗ Error:{Colors.RESET} {Colors.RED}{result.error}{Colors.RESET}")
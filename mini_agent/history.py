@@ -0,0 +1,110 @@
+"""Compact message history for idle sessions
+
+A `Message` is a pydantic model: every instance (and every tool call inside it) carries a
+per-instance dict plus pydantic bookkeeping. That is fine for the history an agent is
+working on, but a server holding hundreds of idle sessions pays it for every message of
+every session. CompactHistory stores the same history as immutable slotted records with
+interned role, name and tool call id strings; content strings are shared with the
+messages they came from, not copied. Token counts are kept alongside, so restoring a
+history does not re-encode it.
+
+Records are converted back to `Message` objects only when the session becomes active again.
+"""
+
+import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .schema import FunctionCall, Message, ToolCall
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class MessageRecord:
+    """Immutable, compact form of a Message"""
+
+    role: str
+    content: str | tuple[dict[str, Any], ...]
+    thinking: str | None = None
+    tool_calls: tuple[tuple[str, str, dict[str, Any]], ...] | None = None  # (id, name, arguments)
+    tool_call_id: str | None = None
+    name: str | None = None
+    tokens: int | None = None  # Token count of the message, if known
+
+    @classmethod
+    def from_message(cls, msg: Message, tokens: int | None = None) -> "MessageRecord":
+        tool_calls = None
+        if msg.tool_calls:
+            tool_calls = tuple((_intern(tc.id), _intern(tc.function.name), tc.function.arguments) for tc in msg.tool_calls)
+        return cls(
+            role=sys.intern(msg.role),
+            content=msg.content if isinstance(msg.content, str) else tuple(msg.content),
+            thinking=msg.thinking,
+            tool_calls=tool_calls,
+            tool_call_id=_intern(msg.tool_call_id),
+            name=_intern(msg.name),
+            tokens=tokens,
+        )
+
+    def to_message(self) -> Message:
+        tool_calls = None
+        if self.tool_calls is not None:
+            tool_calls = [
+                ToolCall(id=call_id, type="function", function=FunctionCall(name=name, arguments=arguments))
+                for call_id, name, arguments in self.tool_calls
+            ]
+        return Message(
+            role=self.role,
+            content=self.content if isinstance(self.content, str) else list(self.content),
+            thinking=self.thinking,
+            tool_calls=tool_calls,
+            tool_call_id=self.tool_call_id,
+            name=self.name,
+        )
+
+
+class CompactHistory(Sequence[MessageRecord]):
+    """Immutable sequence of message records
+
+    Being immutable, a CompactHistory is its own snapshot: it can be shared or kept
+    around without copying. `extend()` returns a new history sharing the existing records.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: tuple[MessageRecord, ...] = ()):
+        self._records = records
+
+    @classmethod
+    def from_messages(cls, messages: list[Message], token_counts: list[int | None] | None = None) -> "CompactHistory":
+        """Build a compact history
+
+        Args:
+            messages: Message history
+            token_counts: Token count per message, kept for restoring without re-encoding
+        """
+        counts = token_counts or [None] * len(messages)
+        return cls(tuple(MessageRecord.from_message(msg, tokens) for msg, tokens in zip(messages, counts)))
+
+    def extend(self, messages: list[Message]) -> "CompactHistory":
+        """New history with messages appended"""
+        return CompactHistory(self._records + tuple(MessageRecord.from_message(msg) for msg in messages))
+
+    def to_messages(self) -> list[Message]:
+        """Rebuild the history as Message objects"""
+        return [record.to_message() for record in self._records]
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return CompactHistory(self._records[index])
+        return self._records[index]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[MessageRecord]:
+        return iter(self._records)
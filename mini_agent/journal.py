@@ -0,0 +1,172 @@
+"""Append-only session journal
+
+Agent history is written incrementally to a JSONL file, one record per line:
+
+- {"op": "session", ...}: header with session id and creation time
+- {"op": "append", "message": {...}}: a message added to the end of history
+- {"op": "reset", "messages": [...]}: history was replaced (summarization, /clear)
+
+Replaying the records rebuilds the history in one pass over the file, without re-running
+any LLM or tool calls. A torn last line (crash mid-write) is ignored on load.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+from uuid import uuid4
+
+from .schema import Message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_DIR = Path.home() / ".mini-agent" / "sessions"
+
+
+def is_valid_session_id(session_id: str) -> bool:
+    """Whether a session id can name a journal file: a plain file name, without any path"""
+    return session_id not in ("", "..") and Path(session_id).name == session_id and "\\" not in session_id
+
+
+class SessionJournal:
+    """Incremental, crash-safe journal of one agent session"""
+
+    def __init__(
+        self,
+        session_id: str | None = None,
+        journal_dir: str | Path | None = None,
+        fsync: bool = False,
+    ):
+        """Initialize session journal.
+
+        Args:
+            session_id: Session id (default: timestamp plus random suffix)
+            journal_dir: Directory holding journal files (default: ~/.mini-agent/sessions)
+            fsync: Force each write to disk, not just to the OS page cache
+
+        Raises:
+            ValueError: The session id is not a plain file name
+        """
+        if session_id is not None and not is_valid_session_id(session_id):
+            raise ValueError(f"Invalid session id {session_id!r}")
+        self.session_id = session_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}-{uuid4().hex[:8]}"
+        self.journal_dir = Path(journal_dir).expanduser() if journal_dir else DEFAULT_JOURNAL_DIR
+        self.path = self.journal_dir / f"{self.session_id}.jsonl"
+        self.fsync = fsync
+        self._file: IO[str] | None = None
+        # Messages already journaled, compared by identity to detect appends vs replacement
+        self._written: list[Message] = []
+
+    @classmethod
+    def open(cls, session_id: str, journal_dir: str | Path | None = None, fsync: bool = False) -> "SessionJournal":
+        """Open an existing journal for resuming; its history is available as `messages`
+
+        Raises:
+            FileNotFoundError: No journal exists for the session id
+        """
+        journal = cls(session_id=session_id, journal_dir=journal_dir, fsync=fsync)
+        if not journal.path.exists():
+            raise FileNotFoundError(f"Session journal not found: {journal.path}")
+        journal._written = cls.load(journal.path)
+        journal._drop_torn_tail()
+        return journal
+
+    @property
+    def messages(self) -> list[Message]:
+        """History as of the last sync (or as loaded by open())"""
+        return list(self._written)
+
+    def sync(self, messages: list[Message]):
+        """Journal changes to the message history since the last sync
+
+        Messages appended since the last sync are written as append records. If history
+        was replaced instead, a single reset record with the full history is written.
+
+        Args:
+            messages: Current message history
+        """
+        written = self._written
+        is_append = len(messages) >= len(written) and all(a is b for a, b in zip(messages, written))
+        if is_append:
+            if len(messages) == len(written):
+                return
+            records = [{"op": "append", "message": self._dump(msg)} for msg in messages[len(written) :]]
+        else:
+            records = [{"op": "reset", "messages": [self._dump(msg) for msg in messages]}]
+
+        self._write(records)
+        self._written = list(messages)
+
+    def rebind(self, messages: list[Message]):
+        """Treat messages as already journaled, without writing anything
+
+        Used when the history is rebuilt as new Message objects with the same content
+        (e.g. an agent restored from a parked history), so the next sync only appends.
+        """
+        self._written = list(messages)
+
+    def close(self):
+        """Close the journal file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _drop_torn_tail(self):
+        """Truncate an incomplete last line so new records start on a fresh line"""
+        data = self.path.read_bytes()
+        if data and not data.endswith(b"\n"):
+            with open(self.path, "r+b") as f:
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def _write(self, records: list[dict[str, Any]]):
+        if self._file is None:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            is_new = not self.path.exists()
+            self._file = open(self.path, "a", encoding="utf-8")
+            if is_new:
+                records = [{"op": "session", "session_id": self.session_id, "created": datetime.now().isoformat()}] + records
+
+        self._file.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    @staticmethod
+    def _dump(msg: Message) -> dict[str, Any]:
+        return msg.model_dump(exclude_none=True)
+
+    @staticmethod
+    def load(path: str | Path) -> list[Message]:
+        """Rebuild message history by replaying a journal file
+
+        Args:
+            path: Journal file path
+
+        Returns:
+            Message history at the time of the last complete record
+        """
+        messages: list[Message] = []
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+
+        for line_num, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if line_num == len(lines):
+                    # Torn write from a crash: the last record never completed
+                    logger.warning(f"Ignoring incomplete last record in {path}")
+                    break
+                raise ValueError(f"Corrupt session journal {path} at line {line_num}")
+
+            op = record.get("op")
+            if op == "append":
+                messages.append(Message.model_validate(record["message"]))
+            elif op == "reset":
+                messages = [Message.model_validate(data) for data in record["messages"]]
+
+        return messages
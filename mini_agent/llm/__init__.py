@@ -5,12 +5,24 @@ from .base import LLMClientBase
 from .glm_client import GLMClient
 from .llm_wrapper import LLMClient
 from .openai_client import OpenAIClient
+from .rate_limit import RateLimitedClient, RateLimiter
+from .replay import RecordingClient, ReplayClient
+from .response_cache import CachingClient, ResponseCache
+from .router import AllBackendsFailedError, RouterClient
 from .zai_client import ZAIClient, get_zai_api_key
 
 __all__ = [
     "LLMClientBase", 
+    "AllBackendsFailedError",
     "AnthropicClient", 
+    "CachingClient",
     "OpenAIClient", 
+    "RateLimitedClient",
+    "RateLimiter",
+    "RecordingClient",
+    "ReplayClient",
+    "ResponseCache",
+    "RouterClient",
     "GLMClient", 
     "LLMClient", 
     "ZAIClient", 
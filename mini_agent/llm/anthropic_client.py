@@ -1,16 +1,24 @@
 """Anthropic LLM client implementation."""
 
+import json
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import anthropic
 
 from ..retry import RetryConfig, async_retry
-from ..schema import FunctionCall, LLMResponse, Message, ToolCall
+from ..schema import FunctionCall, LLMResponse, Message, StreamChunk, ToolCall
+from ..tools.registry import ToolRegistry
 from .base import LLMClientBase
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a cacheable prompt prefix
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Usage fields copied into LLMResponse.usage
+USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+
 
 class AnthropicClient(LLMClientBase):
     """LLM client using Anthropic's protocol.
@@ -18,7 +26,9 @@ class AnthropicClient(LLMClientBase):
     This client uses the official Anthropic SDK and supports:
     - Extended thinking content
     - Tool calling
+    - Streaming
     - Retry logic
+    - Prompt caching (cache breakpoints on system prompt, tools and history)
     """
 
     def __init__(
@@ -27,6 +37,7 @@ class AnthropicClient(LLMClientBase):
         api_base: str = "https://api.minimax.io",
         model: str = "MiniMax-M2",
         retry_config: RetryConfig | None = None,
+        prompt_caching: bool = False,
     ):
         """Initialize Anthropic client.
 
@@ -35,8 +46,10 @@ class AnthropicClient(LLMClientBase):
             api_base: Base URL for the API (default: MiniMax Anthropic endpoint)
             model: Model name to use (default: MiniMax-M2)
             retry_config: Optional retry configuration
+            prompt_caching: Mark the stable request prefix with cache_control breakpoints
         """
         super().__init__(api_key, api_base, model, retry_config)
+        self.prompt_caching = prompt_caching
 
         # Initialize Anthropic async client with proper headers for MiniMax
         self.client = anthropic.AsyncAnthropic(
@@ -54,6 +67,7 @@ class AnthropicClient(LLMClientBase):
         system_message: str | None,
         api_messages: list[dict[str, Any]],
         tools: list[Any] | None = None,
+        max_tokens: int | None = None,
     ) -> anthropic.types.Message:
         """Execute API request (core method that can be retried).
 
@@ -61,6 +75,7 @@ class AnthropicClient(LLMClientBase):
             system_message: Optional system message
             api_messages: List of messages in Anthropic format
             tools: Optional list of tools
+            max_tokens: Optional output token limit
 
         Returns:
             Anthropic Message response
@@ -68,9 +83,40 @@ class AnthropicClient(LLMClientBase):
         Raises:
             Exception: API call failed
         """
+        params = self._build_params(system_message, api_messages, tools, max_tokens)
+
+        # Use Anthropic SDK's async messages.create
+        response = await self.client.messages.create(**params)
+        return response
+
+    async def _make_stream_request(
+        self,
+        system_message: str | None,
+        api_messages: list[dict[str, Any]],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> Any:
+        """Open a streaming API request (core method that can be retried).
+
+        Only opening the stream is retried; once events start arriving, errors propagate.
+
+        Returns:
+            Anthropic async stream of raw message events
+        """
+        params = self._build_params(system_message, api_messages, tools, max_tokens)
+        return await self.client.messages.create(**params, stream=True)
+
+    def _build_params(
+        self,
+        system_message: str | None,
+        api_messages: list[dict[str, Any]],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> dict[str, Any]:
+        """Build keyword arguments for messages.create."""
         params = {
             "model": self.model,
-            "max_tokens": 16384,
+            "max_tokens": max_tokens or 16384,
             "messages": api_messages,
         }
 
@@ -80,9 +126,64 @@ class AnthropicClient(LLMClientBase):
         if tools:
             params["tools"] = self._convert_tools(tools)
 
-        # Use Anthropic SDK's async messages.create
-        response = await self.client.messages.create(**params)
-        return response
+        if self.prompt_caching:
+            self._add_cache_breakpoints(params)
+
+        return params
+
+    def _add_cache_breakpoints(self, params: dict[str, Any]):
+        """Place cache_control breakpoints on the stable prefix of a request.
+
+        Breakpoints go on the system prompt, the last tool definition and the last
+        content block of history. Tools are rendered before the system prompt, so the
+        first two cover the prefix shared by every step; the history breakpoint caches
+        the conversation so far, which the next step extends by appending. That is 3 of
+        the 4 breakpoints the API allows. Inputs are copied, never modified.
+        """
+        if params.get("system"):
+            params["system"] = [{"type": "text", "text": params["system"], "cache_control": CACHE_CONTROL}]
+
+        if params.get("tools"):
+            # Copy the last schema: registry schemas are shared across requests
+            params["tools"] = params["tools"][:-1] + [{**params["tools"][-1], "cache_control": CACHE_CONTROL}]
+
+        messages = params["messages"]
+        if not messages:
+            return
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            if not content:
+                return
+            blocks = [{"type": "text", "text": content}]
+        else:
+            blocks = list(content)
+
+        # Thinking blocks and empty text blocks cannot carry cache_control
+        for i in range(len(blocks) - 1, -1, -1):
+            block = blocks[i]
+            if block.get("type") != "thinking" and not (block.get("type") == "text" and not block.get("text")):
+                blocks[i] = {**block, "cache_control": CACHE_CONTROL}
+                params["messages"] = messages[:-1] + [{**last, "content": blocks}]
+                return
+
+    @staticmethod
+    def _parse_usage(usage: Any, into: dict[str, int] | None = None) -> dict[str, int] | None:
+        """Copy token counts (including cache reads and writes) from an API usage object.
+
+        Args:
+            usage: Usage object from a response or stream event (may be None)
+            into: Existing usage dict to update; fields missing from `usage` are kept
+
+        Returns:
+            Usage dict, or None if there is no usage information at all
+        """
+        result = dict(into or {})
+        for name in USAGE_FIELDS:
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                result[name] = value
+        return result or None
 
     def _convert_tools(self, tools: list[Any]) -> list[dict[str, Any]]:
         """Convert tools to Anthropic format.
@@ -99,11 +200,14 @@ class AnthropicClient(LLMClientBase):
         }
 
         Args:
-            tools: List of Tool objects or dicts
+            tools: List of Tool objects or dicts, or a ToolRegistry (schemas precomputed)
 
         Returns:
             List of tools in Anthropic dict format
         """
+        if isinstance(tools, ToolRegistry):
+            return list(tools.anthropic_schemas())
+
         result = []
         for tool in tools:
             if isinstance(tool, dict):
@@ -240,18 +344,21 @@ class AnthropicClient(LLMClientBase):
             thinking=thinking_content if thinking_content else None,
             tool_calls=tool_calls if tool_calls else None,
             finish_reason=response.stop_reason or "stop",
+            usage=self._parse_usage(getattr(response, "usage", None)),
         )
 
     async def generate(
         self,
         messages: list[Message],
         tools: list[Any] | None = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """Generate response from Anthropic LLM.
 
         Args:
             messages: List of conversation messages
             tools: Optional list of available tools
+            max_tokens: Optional output token limit (default: 16384)
 
         Returns:
             LLMResponse containing the generated content
@@ -262,12 +369,13 @@ class AnthropicClient(LLMClientBase):
         # Make API request with retry logic
         if self.retry_config.enabled:
             # Apply retry logic
-            retry_decorator = async_retry(config=self.retry_config, on_retry=self.retry_callback)
+            retry_decorator = async_retry(config=self.retry_config, on_retry=self.retry_callback, endpoint=self.api_base)
             api_call = retry_decorator(self._make_api_request)
             response = await api_call(
                 request_params["system_message"],
                 request_params["api_messages"],
                 request_params["tools"],
+                max_tokens,
             )
         else:
             # Don't use retry
@@ -275,7 +383,125 @@ class AnthropicClient(LLMClientBase):
                 request_params["system_message"],
                 request_params["api_messages"],
                 request_params["tools"],
+                max_tokens,
             )
 
         # Parse and return response
-        return self._parse_response(response)
\ No newline at end of file
+        return self._parse_response(response)
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream response from Anthropic LLM.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of available tools
+            max_tokens: Optional output token limit (default: 16384)
+
+        Yields:
+            StreamChunk objects, ending with a "done" chunk carrying the full LLMResponse
+        """
+        request_params = self._prepare_request(messages, tools)
+        args = (request_params["system_message"], request_params["api_messages"], request_params["tools"], max_tokens)
+
+        if self.retry_config.enabled:
+            retry_decorator = async_retry(config=self.retry_config, on_retry=self.retry_callback, endpoint=self.api_base)
+            stream = await retry_decorator(self._make_stream_request)(*args)
+        else:
+            stream = await self._make_stream_request(*args)
+
+        # Accumulated content blocks by index: {"type", "parts", "id", "name"}
+        blocks: dict[int, dict[str, Any]] = {}
+        tool_indices: dict[int, int] = {}  # block index -> tool call position
+        finish_reason = "stop"
+        usage = None
+
+        async for event in stream:
+            if event.type == "message_start":
+                # Input and cache token counts arrive up front
+                usage = self._parse_usage(getattr(event.message, "usage", None), usage)
+
+            elif event.type == "content_block_start":
+                block = event.content_block
+                blocks[event.index] = {
+                    "type": block.type,
+                    "parts": [],
+                    "id": getattr(block, "id", None),
+                    "name": getattr(block, "name", None),
+                }
+                if block.type == "tool_use":
+                    position = len(tool_indices)
+                    tool_indices[event.index] = position
+                    yield StreamChunk(type="tool_call_delta", index=position, tool_call_id=block.id, tool_name=block.name)
+
+            elif event.type == "content_block_delta":
+                delta = event.delta
+                block = blocks.setdefault(event.index, {"type": None, "parts": [], "id": None, "name": None})
+                if delta.type == "text_delta":
+                    block["parts"].append(delta.text)
+                    yield StreamChunk(type="text", delta=delta.text)
+                elif delta.type == "thinking_delta":
+                    block["parts"].append(delta.thinking)
+                    yield StreamChunk(type="thinking", delta=delta.thinking)
+                elif delta.type == "input_json_delta":
+                    block["parts"].append(delta.partial_json)
+                    yield StreamChunk(type="tool_call_delta", delta=delta.partial_json, index=tool_indices.get(event.index))
+
+            elif event.type == "message_delta":
+                if event.delta.stop_reason:
+                    finish_reason = event.delta.stop_reason
+                # Output token count arrives at the end
+                usage = self._parse_usage(getattr(event, "usage", None), usage)
+
+        yield StreamChunk(type="done", response=self._assemble_stream_response(blocks, finish_reason, usage))
+
+    def _assemble_stream_response(
+        self,
+        blocks: dict[int, dict[str, Any]],
+        finish_reason: str,
+        usage: dict[str, int] | None = None,
+    ) -> LLMResponse:
+        """Build the final LLMResponse from accumulated stream blocks.
+
+        Args:
+            blocks: Content blocks by index, as accumulated by generate_stream
+            finish_reason: Stop reason reported by the stream
+            usage: Token usage reported by the stream
+
+        Returns:
+            LLMResponse object
+        """
+        text_content = ""
+        thinking_content = ""
+        tool_calls = []
+
+        for index in sorted(blocks):
+            block = blocks[index]
+            joined = "".join(block["parts"])
+            if block["type"] == "text":
+                text_content += joined
+            elif block["type"] == "thinking":
+                thinking_content += joined
+            elif block["type"] == "tool_use":
+                tool_calls.append(
+                    ToolCall(
+                        id=block["id"],
+                        type="function",
+                        function=FunctionCall(
+                            name=block["name"],
+                            arguments=json.loads(joined) if joined else {},
+                        ),
+                    )
+                )
+
+        return LLMResponse(
+            content=text_content,
+            thinking=thinking_content if thinking_content else None,
+            tool_calls=tool_calls if tool_calls else None,
+            finish_reason=finish_reason,
+            usage=usage,
+        )
@@ -1,10 +1,11 @@
 """Base class for LLM clients."""
 
+import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
 from ..retry import RetryConfig
-from ..schema import LLMResponse, Message
+from ..schema import LLMResponse, Message, StreamChunk
 
 
 class LLMClientBase(ABC):
@@ -42,18 +43,68 @@ class LLMClientBase(ABC):
         self,
         messages: list[Message],
         tools: list[Any] | None = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """Generate response from LLM.
 
         Args:
             messages: List of conversation messages
             tools: Optional list of Tool objects or dicts
+            max_tokens: Optional output token limit (default: the client's own limit)
 
         Returns:
             LLMResponse containing the generated content, thinking, and tool calls
         """
         pass
 
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Generate response from LLM as a stream of chunks.
+
+        Yields thinking, text and tool_call_delta chunks as they arrive, followed by a
+        final "done" chunk carrying the complete LLMResponse. Clients without native
+        streaming support fall back to a single generate() call.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of Tool objects or dicts
+            max_tokens: Optional output token limit (default: the client's own limit)
+
+        Yields:
+            StreamChunk objects
+        """
+        if max_tokens is None:
+            response = await self.generate(messages, tools)
+        else:
+            response = await self.generate(messages, tools, max_tokens=max_tokens)
+        for chunk in self._response_chunks(response):
+            yield chunk
+
+    @staticmethod
+    def _response_chunks(response: LLMResponse) -> list[StreamChunk]:
+        """Stream chunks equivalent to a complete response, ending with the "done" chunk"""
+        chunks = []
+        if response.thinking:
+            chunks.append(StreamChunk(type="thinking", delta=response.thinking))
+        if response.content:
+            chunks.append(StreamChunk(type="text", delta=response.content))
+        for index, tool_call in enumerate(response.tool_calls or []):
+            chunks.append(
+                StreamChunk(
+                    type="tool_call_delta",
+                    delta=json.dumps(tool_call.function.arguments, ensure_ascii=False),
+                    index=index,
+                    tool_call_id=tool_call.id,
+                    tool_name=tool_call.function.name,
+                )
+            )
+        chunks.append(StreamChunk(type="done", response=response))
+        return chunks
+
     @abstractmethod
     def _prepare_request(
         self,
@@ -13,6 +13,7 @@ from typing import Any, Optional
 
 try:
     import aiohttp
+    from ..utils.http_pool import get_http_session
     AIOHTTP_AVAILABLE = True
 except ImportError:
     AIOHTTP_AVAILABLE = False
@@ -89,45 +90,45 @@ class CodingPlanZAIClient:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp is not installed. Please install it with: pip install aiohttp")
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/web_search",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    response_text = await response.text()
-                    logger.info(f"Coding Plan API Response Status: {response.status}")
-                    logger.info(f"Coding Plan API Response: {response_text}")
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        return {
-                            "success": True,
-                            "id": result.get("id"),
-                            "created": result.get("created"),
-                            "request_id": result.get("request_id"),
-                            "search_result": result.get("search_result", []),
-                            "search_intent": result.get("search_intent", []),
-                            "query": query,
-                            "count": len(result.get("search_result", [])),
-                            "timestamp": datetime.now().isoformat(),
-                            "api_endpoint": self.base_url,
-                        }
-                    elif response.status == 429:
-                        return {
-                            "success": False,
-                            "error": f"Billing Error: {response_text}",
-                            "api_endpoint": self.base_url,
-                            "recommendation": "Check Coding Plan subscription and billing"
-                        }
-                    else:
-                        logger.error(f"Coding Plan web search error {response.status}: {response_text}")
-                        return {
-                            "success": False,
-                            "error": f"API error {response.status}: {response_text}",
-                            "api_endpoint": self.base_url,
-                        }
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/web_search",
+                headers=self.headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                response_text = await response.text()
+                logger.info(f"Coding Plan API Response Status: {response.status}")
+                logger.info(f"Coding Plan API Response: {response_text}")
+                
+                if response.status == 200:
+                    result = await response.json()
+                    return {
+                        "success": True,
+                        "id": result.get("id"),
+                        "created": result.get("created"),
+                        "request_id": result.get("request_id"),
+                        "search_result": result.get("search_result", []),
+                        "search_intent": result.get("search_intent", []),
+                        "query": query,
+                        "count": len(result.get("search_result", [])),
+                        "timestamp": datetime.now().isoformat(),
+                        "api_endpoint": self.base_url,
+                    }
+                elif response.status == 429:
+                    return {
+                        "success": False,
+                        "error": f"Billing Error: {response_text}",
+                        "api_endpoint": self.base_url,
+                        "recommendation": "Check Coding Plan subscription and billing"
+                    }
+                else:
+                    logger.error(f"Coding Plan web search error {response.status}: {response_text}")
+                    return {
+                        "success": False,
+                        "error": f"API error {response.status}: {response_text}",
+                        "api_endpoint": self.base_url,
+                    }
         except Exception as e:
             logger.exception("Coding Plan web search failed")
             return {"success": False, "error": str(e), "api_endpoint": self.base_url}
@@ -160,55 +161,55 @@ class CodingPlanZAIClient:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp is not installed. Please install it with: pip install aiohttp")
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/web_page_reader",  # CORRECT endpoint
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    response_text = await response.text()
-                    logger.info(f"Coding Plan Reader Response Status: {response.status}")
-                    logger.info(f"Coding Plan Reader Response: {response_text}")
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/web_page_reader",  # CORRECT endpoint
+                headers=self.headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                response_text = await response.text()
+                logger.info(f"Coding Plan Reader Response Status: {response.status}")
+                logger.info(f"Coding Plan Reader Response: {response_text}")
+                
+                if response.status == 200:
+                    result = await response.json()
+                    reader_result = result.get("web_page_reader_result", {})
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        reader_result = result.get("web_page_reader_result", {})
-                        
-                        return {
-                            "success": True,
-                            "id": result.get("id"),
-                            "created": result.get("created"),
-                            "request_id": result.get("request_id"),
-                            "model": result.get("model"),
-                            "url": url,
-                            "title": reader_result.get("title", "N/A"),
-                            "description": reader_result.get("description", "N/A"),
-                            "content": reader_result.get("content", ""),
-                            "metadata": reader_result.get("metadata", {}),
-                            "external": reader_result.get("external", {}),
-                            "format": format_type,
-                            "word_count": len(reader_result.get("content", "").split()),
-                            "timestamp": datetime.now().isoformat(),
-                            "api_endpoint": self.base_url,
-                        }
-                    elif response.status == 404:
-                        # The /web_page_reader endpoint might not exist in Coding Plan API
-                        return {
-                            "success": False,
-                            "error": f"Endpoint not available in Coding Plan API: {response_text}",
-                            "url": url,
-                            "api_endpoint": self.base_url,
-                            "recommendation": "Use web search fallback for content extraction"
-                        }
-                    else:
-                        logger.error(f"Coding Plan web reading error {response.status}: {response_text}")
-                        return {
-                            "success": False,
-                            "error": f"API error {response.status}: {response_text}",
-                            "url": url,
-                            "api_endpoint": self.base_url,
-                        }
+                    return {
+                        "success": True,
+                        "id": result.get("id"),
+                        "created": result.get("created"),
+                        "request_id": result.get("request_id"),
+                        "model": result.get("model"),
+                        "url": url,
+                        "title": reader_result.get("title", "N/A"),
+                        "description": reader_result.get("description", "N/A"),
+                        "content": reader_result.get("content", ""),
+                        "metadata": reader_result.get("metadata", {}),
+                        "external": reader_result.get("external", {}),
+                        "format": format_type,
+                        "word_count": len(reader_result.get("content", "").split()),
+                        "timestamp": datetime.now().isoformat(),
+                        "api_endpoint": self.base_url,
+                    }
+                elif response.status == 404:
+                    # The /web_page_reader endpoint might not exist in Coding Plan API
+                    return {
+                        "success": False,
+                        "error": f"Endpoint not available in Coding Plan API: {response_text}",
+                        "url": url,
+                        "api_endpoint": self.base_url,
+                        "recommendation": "Use web search fallback for content extraction"
+                    }
+                else:
+                    logger.error(f"Coding Plan web reading error {response.status}: {response_text}")
+                    return {
+                        "success": False,
+                        "error": f"API error {response.status}: {response_text}",
+                        "url": url,
+                        "api_endpoint": self.base_url,
+                    }
         except Exception as e:
             logger.exception("Coding Plan web reading failed")
             return {"success": False, "url": url, "error": str(e), "api_endpoint": self.base_url}
@@ -246,44 +247,44 @@ class CodingPlanZAIClient:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp is not installed. Please install it with: pip install aiohttp")
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",  # OpenAI-compatible endpoint
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    response_text = await response.text()
-                    logger.info(f"GLM Chat Response Status: {response.status}")
-                    logger.info(f"GLM Chat Response: {response_text}")
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        return {
-                            "success": True,
-                            "id": result.get("id"),
-                            "object": result.get("object"),
-                            "created": result.get("created"),
-                            "model": result.get("model"),
-                            "choices": result.get("choices", []),
-                            "usage": result.get("usage", {}),
-                            "timestamp": datetime.now().isoformat(),
-                            "api_endpoint": self.base_url,
-                        }
-                    elif response.status == 429:
-                        return {
-                            "success": False,
-                            "error": f"Billing Error: {response_text}",
-                            "api_endpoint": self.base_url,
-                            "recommendation": "Check Coding Plan subscription and billing"
-                        }
-                    else:
-                        logger.error(f"GLM chat completion error {response.status}: {response_text}")
-                        return {
-                            "success": False,
-                            "error": f"API error {response.status}: {response_text}",
-                            "api_endpoint": self.base_url,
-                        }
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/chat/completions",  # OpenAI-compatible endpoint
+                headers=self.headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                response_text = await response.text()
+                logger.info(f"GLM Chat Response Status: {response.status}")
+                logger.info(f"GLM Chat Response: {response_text}")
+                
+                if response.status == 200:
+                    result = await response.json()
+                    return {
+                        "success": True,
+                        "id": result.get("id"),
+                        "object": result.get("object"),
+                        "created": result.get("created"),
+                        "model": result.get("model"),
+                        "choices": result.get("choices", []),
+                        "usage": result.get("usage", {}),
+                        "timestamp": datetime.now().isoformat(),
+                        "api_endpoint": self.base_url,
+                    }
+                elif response.status == 429:
+                    return {
+                        "success": False,
+                        "error": f"Billing Error: {response_text}",
+                        "api_endpoint": self.base_url,
+                        "recommendation": "Check Coding Plan subscription and billing"
+                    }
+                else:
+                    logger.error(f"GLM chat completion error {response.status}: {response_text}")
+                    return {
+                        "success": False,
+                        "error": f"API error {response.status}: {response_text}",
+                        "api_endpoint": self.base_url,
+                    }
         except Exception as e:
             logger.exception("GLM chat completion failed")
             return {"success": False, "error": str(e), "api_endpoint": self.base_url}
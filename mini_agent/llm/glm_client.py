@@ -136,12 +136,14 @@ class GLMClient(LLMClientBase):
         self,
         messages: list[Message],
         tools: list[Any] | None = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """Generate response using GLM model.
         
         Args:
             messages: List of conversation messages
             tools: Optional tools to enable
+            max_tokens: Optional output token limit (default: 2048)
             
         Returns:
             LLMResponse containing the generated content
@@ -166,7 +168,7 @@ class GLMClient(LLMClientBase):
                 messages=glm_messages,
                 model=self.model,
                 temperature=0.7,
-                max_tokens=2048
+                max_tokens=max_tokens or 2048
             )
             
             if result["success"]:
@@ -177,7 +179,8 @@ class GLMClient(LLMClientBase):
                     content=content,
                     thinking=None,
                     tool_calls=None,
-                    finish_reason="stop"
+                    finish_reason="stop",
+                    usage=usage or None
                 )
             else:
                 error_msg = result.get("error", "Unknown error")
@@ -5,9 +5,10 @@ This module provides a unified interface for different AI models
 """
 
 import logging
+from typing import AsyncIterator
 
 from ..retry import RetryConfig
-from ..schema import LLMProvider, LLMResponse, Message
+from ..schema import LLMProvider, LLMResponse, Message, StreamChunk
 from .anthropic_client import AnthropicClient
 from .base import LLMClientBase
 from .glm_client import GLMClient
@@ -35,6 +36,7 @@ class LLMClient:
         api_base: str = "https://api.minimax.io",
         model: str = "MiniMax-M2",
         retry_config: RetryConfig | None = None,
+        prompt_caching: bool = False,
     ):
         """Initialize LLM client with specified provider.
 
@@ -45,6 +47,7 @@ class LLMClient:
                      Will be automatically suffixed with /anthropic or /v1 based on provider
             model: Model name to use
             retry_config: Optional retry configuration
+            prompt_caching: Add prompt cache breakpoints to requests (anthropic provider only)
         """
         self.provider = provider
         self.api_key = api_key
@@ -74,6 +77,7 @@ class LLMClient:
                 api_base=full_api_base,
                 model=model,
                 retry_config=retry_config,
+                prompt_caching=prompt_caching,
             )
         elif provider == "openai":  # OpenAI SDK format
             self._client = OpenAIClient(
@@ -108,14 +112,35 @@ class LLMClient:
         self,
         messages: list[Message],
         tools: list | None = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """Generate response from LLM.
 
         Args:
             messages: List of conversation messages
             tools: Optional list of Tool objects or dicts
+            max_tokens: Optional output token limit (default: the provider client's limit)
 
         Returns:
             LLMResponse containing the generated content
         """
-        return await self._client.generate(messages, tools)
\ No newline at end of file
+        return await self._client.generate(messages, tools, max_tokens=max_tokens)
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream response from LLM.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of Tool objects or dicts
+            max_tokens: Optional output token limit (default: the provider client's limit)
+
+        Yields:
+            StreamChunk objects, ending with a "done" chunk carrying the full LLMResponse
+        """
+        async for chunk in self._client.generate_stream(messages, tools, max_tokens=max_tokens):
+            yield chunk
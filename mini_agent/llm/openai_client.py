@@ -2,16 +2,20 @@
 
 import json
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 from openai import AsyncOpenAI
 
 from ..retry import RetryConfig, async_retry
-from ..schema import FunctionCall, LLMResponse, Message, ToolCall
+from ..schema import FunctionCall, LLMResponse, Message, StreamChunk, ToolCall
+from ..tools.registry import ToolRegistry
 from .base import LLMClientBase
 
 logger = logging.getLogger(__name__)
 
+# Usage fields copied into LLMResponse.usage (prompt_tokens includes cached prompt tokens)
+USAGE_FIELDS = ("prompt_tokens", "completion_tokens")
+
 
 class OpenAIClient(LLMClientBase):
     """LLM client using OpenAI's protocol.
@@ -19,6 +23,7 @@ class OpenAIClient(LLMClientBase):
     This client uses the official OpenAI SDK format and supports:
     - Reasoning content (via reasoning_split=True)
     - Tool calling
+    - Streaming
     - Retry logic
     """
 
@@ -49,19 +54,50 @@ class OpenAIClient(LLMClientBase):
         self,
         api_messages: list[dict[str, Any]],
         tools: list[Any] | None = None,
+        max_tokens: int | None = None,
     ) -> Any:
         """Execute API request (core method that can be retried).
 
         Args:
             api_messages: List of messages in OpenAI format
             tools: Optional list of tools
+            max_tokens: Optional output token limit
 
         Returns:
-            OpenAI ChatCompletion message
+            OpenAI ChatCompletion
 
         Raises:
             Exception: API call failed
         """
+        params = self._build_params(api_messages, tools, max_tokens)
+
+        # Use OpenAI SDK format's chat.completions.create
+        return await self.client.chat.completions.create(**params)
+
+    async def _make_stream_request(
+        self,
+        api_messages: list[dict[str, Any]],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> Any:
+        """Open a streaming API request (core method that can be retried).
+
+        Only opening the stream is retried; once chunks start arriving, errors propagate.
+
+        Returns:
+            OpenAI async stream of ChatCompletionChunk objects
+        """
+        params = self._build_params(api_messages, tools, max_tokens)
+        # Ask for a final chunk with the token usage of the whole response
+        return await self.client.chat.completions.create(**params, stream=True, stream_options={"include_usage": True})
+
+    def _build_params(
+        self,
+        api_messages: list[dict[str, Any]],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> dict[str, Any]:
+        """Build keyword arguments for chat.completions.create."""
         params = {
             "model": self.model,
             "messages": api_messages,
@@ -72,19 +108,23 @@ class OpenAIClient(LLMClientBase):
         if tools:
             params["tools"] = self._convert_tools(tools)
 
-        # Use OpenAI SDK format's chat.completions.create
-        response = await self.client.chat.completions.create(**params)
-        return response.choices[0].message
+        if max_tokens:
+            params["max_tokens"] = max_tokens
+
+        return params
 
     def _convert_tools(self, tools: list[Any]) -> list[dict[str, Any]]:
         """Convert tools to OpenAI format.
 
         Args:
-            tools: List of Tool objects or dicts
+            tools: List of Tool objects or dicts, or a ToolRegistry (schemas precomputed)
 
         Returns:
             List of tools in OpenAI dict format
         """
+        if isinstance(tools, ToolRegistry):
+            return list(tools.openai_schemas())
+
         result = []
         for tool in tools:
             if isinstance(tool, dict):
@@ -199,15 +239,34 @@ class OpenAIClient(LLMClientBase):
             "tools": tools,
         }
 
-    def _parse_response(self, response: Any) -> LLMResponse:
+    @staticmethod
+    def _parse_usage(usage: Any) -> dict[str, int] | None:
+        """Copy token counts from an API usage object.
+
+        Args:
+            usage: Usage object from a completion or the final stream chunk (may be None)
+
+        Returns:
+            Usage dict, or None if there is no usage information
+        """
+        result = {}
+        for name in USAGE_FIELDS:
+            value = getattr(usage, name, None)
+            if isinstance(value, int):
+                result[name] = value
+        return result or None
+
+    def _parse_response(self, completion: Any) -> LLMResponse:
         """Parse OpenAI response into LLMResponse.
 
         Args:
-            response: OpenAI ChatCompletionMessage response
+            completion: OpenAI ChatCompletion response
 
         Returns:
             LLMResponse object
         """
+        response = completion.choices[0].message
+
         # Extract text content
         text_content = response.content or ""
 
@@ -242,18 +301,21 @@ class OpenAIClient(LLMClientBase):
             thinking=thinking_content if thinking_content else None,
             tool_calls=tool_calls if tool_calls else None,
             finish_reason="stop",  # OpenAI doesn't provide finish_reason in the message
+            usage=self._parse_usage(getattr(completion, "usage", None)),
         )
 
     async def generate(
         self,
         messages: list[Message],
         tools: list[Any] | None = None,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """Generate response from OpenAI LLM.
 
         Args:
             messages: List of conversation messages
             tools: Optional list of available tools
+            max_tokens: Optional output token limit (default: the server's limit)
 
         Returns:
             LLMResponse containing the generated content
@@ -264,18 +326,139 @@ class OpenAIClient(LLMClientBase):
         # Make API request with retry logic
         if self.retry_config.enabled:
             # Apply retry logic
-            retry_decorator = async_retry(config=self.retry_config, on_retry=self.retry_callback)
+            retry_decorator = async_retry(config=self.retry_config, on_retry=self.retry_callback, endpoint=self.api_base)
             api_call = retry_decorator(self._make_api_request)
             response = await api_call(
                 request_params["api_messages"],
                 request_params["tools"],
+                max_tokens,
             )
         else:
             # Don't use retry
             response = await self._make_api_request(
                 request_params["api_messages"],
                 request_params["tools"],
+                max_tokens,
             )
 
         # Parse and return response
         return self._parse_response(response)
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream response from OpenAI LLM.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of available tools
+            max_tokens: Optional output token limit (default: the server's limit)
+
+        Yields:
+            StreamChunk objects, ending with a "done" chunk carrying the full LLMResponse
+        """
+        request_params = self._prepare_request(messages, tools)
+        args = (request_params["api_messages"], request_params["tools"], max_tokens)
+
+        if self.retry_config.enabled:
+            retry_decorator = async_retry(config=self.retry_config, on_retry=self.retry_callback, endpoint=self.api_base)
+            stream = await retry_decorator(self._make_stream_request)(*args)
+        else:
+            stream = await self._make_stream_request(*args)
+
+        text_parts: list[str] = []
+        thinking_parts: list[str] = []
+        # Tool calls by stream index: {"id", "name", "arguments": [fragments]}
+        tool_calls: dict[int, dict[str, Any]] = {}
+        finish_reason = "stop"
+        usage = None
+
+        async for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                usage = self._parse_usage(chunk.usage)
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+            if delta is None:
+                continue
+
+            # Thinking arrives as reasoning_details (MiniMax reasoning_split) or reasoning_content
+            for thinking in self._extract_reasoning_deltas(delta):
+                thinking_parts.append(thinking)
+                yield StreamChunk(type="thinking", delta=thinking)
+
+            if delta.content:
+                text_parts.append(delta.content)
+                yield StreamChunk(type="text", delta=delta.content)
+
+            for tool_delta in delta.tool_calls or []:
+                call = tool_calls.get(tool_delta.index)
+                is_new = call is None
+                if is_new:
+                    call = tool_calls[tool_delta.index] = {"id": None, "name": None, "arguments": []}
+                if tool_delta.id:
+                    call["id"] = tool_delta.id
+                fragment = ""
+                if tool_delta.function:
+                    if tool_delta.function.name:
+                        call["name"] = tool_delta.function.name
+                    fragment = tool_delta.function.arguments or ""
+                    call["arguments"].append(fragment)
+                yield StreamChunk(
+                    type="tool_call_delta",
+                    delta=fragment,
+                    index=tool_delta.index,
+                    tool_call_id=call["id"] if is_new else None,
+                    tool_name=call["name"] if is_new else None,
+                )
+
+        parsed_tool_calls = []
+        for index in sorted(tool_calls):
+            call = tool_calls[index]
+            arguments = "".join(call["arguments"])
+            parsed_tool_calls.append(
+                ToolCall(
+                    id=call["id"],
+                    type="function",
+                    function=FunctionCall(
+                        name=call["name"],
+                        arguments=json.loads(arguments) if arguments else {},
+                    ),
+                )
+            )
+
+        thinking_content = "".join(thinking_parts)
+        response = LLMResponse(
+            content="".join(text_parts),
+            thinking=thinking_content if thinking_content else None,
+            tool_calls=parsed_tool_calls if parsed_tool_calls else None,
+            finish_reason=finish_reason,
+            usage=usage,
+        )
+        yield StreamChunk(type="done", response=response)
+
+    @staticmethod
+    def _extract_reasoning_deltas(delta: Any) -> list[str]:
+        """Extract thinking text from a streamed delta.
+
+        Args:
+            delta: ChoiceDelta from a ChatCompletionChunk
+
+        Returns:
+            List of thinking text fragments (possibly empty)
+        """
+        fragments = []
+        for detail in getattr(delta, "reasoning_details", None) or []:
+            text = detail.get("text") if isinstance(detail, dict) else getattr(detail, "text", None)
+            if text:
+                fragments.append(text)
+        reasoning_content = getattr(delta, "reasoning_content", None)
+        if reasoning_content:
+            fragments.append(reasoning_content)
+        return fragments
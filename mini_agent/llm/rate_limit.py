@@ -0,0 +1,281 @@
+"""Client-side rate limiting of LLM requests.
+
+Providers enforce quotas over time windows: MiniMax-M2 allows 300 prompts per 5 hours,
+GLM about 120 prompts per 5 hours. Without a limiter, concurrent sessions burst into
+those limits and each 429 costs a retry. A RateLimiter enforces a request limit and a
+token limit over a sliding window. Requests over the limit queue until capacity frees
+up, and higher priority requests are served first.
+
+Limiters are shared per key within a process (see `shared_rate_limiter`), so every
+session and sub-agent calling the same provider draws from one quota. The token cost
+of a request is estimated up front and corrected to the reported usage afterwards.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Any, AsyncIterator
+
+from ..schema import LLMResponse, Message, StreamChunk
+from ..token_ledger import FALLBACK_CHARS_PER_TOKEN
+from .base import LLMClientBase
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("rate_limit_priority", default=0)
+
+
+@contextlib.contextmanager
+def rate_limit_priority(priority: int) -> Iterator[None]:
+    """Set the queueing priority of LLM requests made in this context (higher is served first)"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def usage_tokens(usage: dict[str, Any] | None) -> int | None:
+    """Input plus output tokens reported for a call, or None if not reported"""
+    if not usage:
+        return None
+    input_tokens = usage.get("input_tokens", usage.get("prompt_tokens"))
+    output_tokens = usage.get("output_tokens", usage.get("completion_tokens"))
+    if input_tokens is None and output_tokens is None:
+        return None
+    cached = usage.get("cache_read_input_tokens", 0) + usage.get("cache_creation_input_tokens", 0)
+    return (input_tokens or 0) + cached + (output_tokens or 0)
+
+
+def estimate_request_tokens(messages: list[Message], max_tokens: int | None = None) -> int:
+    """Rough token cost of a request: its messages by length, plus the output limit"""
+    chars = 0
+    for msg in messages:
+        chars += len(msg.content) if isinstance(msg.content, str) else len(str(msg.content))
+        if msg.thinking:
+            chars += len(msg.thinking)
+        if msg.tool_calls:
+            chars += len(str(msg.tool_calls))
+    return int(chars / FALLBACK_CHARS_PER_TOKEN) + (max_tokens or 0)
+
+
+class Reservation:
+    """Capacity granted to one request; `settle()` corrects its token count to actual usage"""
+
+    __slots__ = ("_limiter", "_entry")
+
+    def __init__(self, limiter: "RateLimiter", entry: list[float]):
+        self._limiter = limiter
+        self._entry = entry
+
+    @property
+    def tokens(self) -> int:
+        return int(self._entry[1])
+
+    def settle(self, tokens: int | None):
+        """Replace the estimated token count with the actual one (None keeps the estimate)"""
+        if tokens is not None:
+            self._entry[1] = tokens
+            self._limiter._wake()
+
+
+class RateLimiter:
+    """Sliding-window limit on requests and tokens, with a priority queue of waiting requests"""
+
+    def __init__(
+        self,
+        requests: int | None = None,
+        tokens: int | None = None,
+        window: float = 60.0,
+        name: str = "",
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            requests: Maximum requests per window (None: unlimited)
+            tokens: Maximum input plus output tokens per window (None: unlimited)
+            window: Window length in seconds
+            name: Name shown in status()
+        """
+        if window <= 0:
+            raise ValueError("Rate limit window must be positive")
+        self.requests = requests
+        self.tokens = tokens
+        self.window = window
+        self.name = name
+        self._granted: deque[list[float]] = deque()  # [time, tokens] per granted request, oldest first
+        self._waiters: list[tuple[int, int, asyncio.Future, int]] = []  # (-priority, seq, future, tokens)
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _purge(self, now: float):
+        while self._granted and self._granted[0][0] <= now - self.window:
+            self._granted.popleft()
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a request of this many tokens fits in the window (0: fits now)"""
+        self._purge(now)
+        wait = 0.0
+        if self.requests is not None and len(self._granted) >= self.requests:
+            # The request fits once enough of the oldest grants have left the window
+            wait = self._granted[len(self._granted) - self.requests][0] + self.window - now
+        if self.tokens is not None and self._granted:
+            excess = sum(entry[1] for entry in self._granted) + tokens - self.tokens
+            for entry in self._granted:
+                if excess <= 0:
+                    break
+                excess -= entry[1]
+                wait = max(wait, entry[0] + self.window - now)
+        return max(0.0, wait)
+
+    def _grant(self, tokens: int, now: float) -> Reservation:
+        entry = [now, float(tokens)]
+        self._granted.append(entry)
+        return Reservation(self, entry)
+
+    def _bind_loop(self):
+        """Limiters outlive event loops (e.g. across asyncio.run calls); waiters do not"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._waiters = []
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def acquire(self, tokens: int = 0, priority: int | None = None) -> Reservation:
+        """Wait for capacity for one request
+
+        Args:
+            tokens: Estimated token cost of the request
+            priority: Higher is served first (default: the rate_limit_priority() context, 0)
+
+        Returns:
+            Reservation for the request
+        """
+        self._bind_loop()
+        priority = _priority.get() if priority is None else priority
+        now = time.monotonic()
+        if not self._waiters and self._wait_time(tokens, now) == 0:
+            return self._grant(tokens, now)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._seq), future, tokens))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        else:
+            self._wake()
+        return await future
+
+    async def _dispatch(self):
+        """Grant queued requests in priority order as capacity frees up"""
+        while self._waiters:
+            _, _, future, tokens = self._waiters[0]
+            if future.done():  # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            now = time.monotonic()
+            wait = self._wait_time(tokens, now)
+            if wait == 0 or not self._granted:
+                # An empty window always admits a request, even one larger than the token limit
+                heapq.heappop(self._waiters)
+                future.set_result(self._grant(tokens, now))
+                continue
+            self._wakeup.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+
+    def status(self) -> dict[str, Any]:
+        """Current usage of the window and the queue"""
+        now = time.monotonic()
+        self._purge(now)
+        return {
+            "name": self.name,
+            "window": self.window,
+            "requests": len(self._granted),
+            "request_limit": self.requests,
+            "tokens": int(sum(entry[1] for entry in self._granted)),
+            "token_limit": self.tokens,
+            "queued": sum(1 for waiter in self._waiters if not waiter[2].done()),
+            "next_slot_in": round(self._wait_time(1, now), 3),  # Seconds until a minimal request fits
+        }
+
+
+_shared: dict[str, RateLimiter] = {}
+
+
+def shared_rate_limiter(key: str, requests: int | None = None, tokens: int | None = None, window: float = 60.0) -> RateLimiter:
+    """Process-wide limiter for a key (e.g. provider and model), created on first use
+
+    Later calls with the same key return the existing limiter unchanged.
+    """
+    limiter = _shared.get(key)
+    if limiter is None:
+        limiter = RateLimiter(requests=requests, tokens=tokens, window=window, name=key)
+        _shared[key] = limiter
+    return limiter
+
+
+def rate_limit_status() -> list[dict[str, Any]]:
+    """Status of every shared limiter in this process"""
+    return [limiter.status() for limiter in _shared.values()]
+
+
+class RateLimitedClient(LLMClientBase):
+    """Wraps an LLM client and waits for rate limiter capacity before every request"""
+
+    def __init__(self, client: Any, limiter: RateLimiter):
+        """Initialize rate limited client.
+
+        Args:
+            client: Client to limit (an LLMClientBase or the LLMClient wrapper)
+            limiter: Limiter, usually shared with other clients of the same provider
+        """
+        super().__init__(
+            api_key=getattr(client, "api_key", ""),
+            api_base=getattr(client, "api_base", ""),
+            model=getattr(client, "model", ""),
+            retry_config=getattr(client, "retry_config", None),
+        )
+        self.client = client
+        self.limiter = limiter
+
+    def _kwargs(self, max_tokens: int | None) -> dict[str, Any]:
+        return {} if max_tokens is None else {"max_tokens": max_tokens}
+
+    async def generate(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        reservation = await self.limiter.acquire(estimate_request_tokens(messages, max_tokens))
+        response = await self.client.generate(messages=messages, tools=tools, **self._kwargs(max_tokens))
+        reservation.settle(usage_tokens(response.usage))
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        reservation = await self.limiter.acquire(estimate_request_tokens(messages, max_tokens))
+        async for chunk in self.client.generate_stream(messages=messages, tools=tools, **self._kwargs(max_tokens)):
+            if chunk.type == "done" and chunk.response is not None:
+                reservation.settle(usage_tokens(chunk.response.usage))
+            yield chunk
+
+    def _prepare_request(self, messages: list[Message], tools: list[Any] | None = None) -> dict[str, Any]:
+        return self.client._prepare_request(messages, tools)
+
+    def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict[str, Any]]]:
+        return self.client._convert_messages(messages)
@@ -0,0 +1,181 @@
+"""Record/replay LLM clients for offline runs and benchmarks.
+
+RecordingClient wraps a live client and appends every call to a cassette file: the
+request (messages, tool names, max_tokens), the response and the call latency.
+ReplayClient serves the recorded responses in order without any network access,
+optionally sleeping for a synthetic latency, so the agent loop, logging and tool
+plumbing can be exercised and timed deterministically.
+
+Cassettes are JSONL files with one call per line.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from ..schema import LLMResponse, Message, StreamChunk
+from .base import LLMClientBase
+
+
+class CassetteMismatchError(Exception):
+    """Raised when a replayed request does not match the recording, or the cassette ran out"""
+
+
+def request_fingerprint(messages: list[Message]) -> str:
+    """Stable hash of a request's message history"""
+    dumped = json.dumps([msg.model_dump(exclude_none=True) for msg in messages], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()[:16]
+
+
+def _tool_names(tools: Any) -> list[str]:
+    """Names of the tools offered to the LLM (Tool objects, schema dicts or a tool registry)"""
+    if tools is None:
+        return []
+    if hasattr(tools, "keys"):
+        return list(tools.keys())
+    names = []
+    for tool in tools:
+        if isinstance(tool, dict):
+            names.append(tool.get("name") or tool.get("function", {}).get("name", ""))
+        else:
+            names.append(tool.name)
+    return names
+
+
+def load_cassette(path: str | Path) -> list[dict[str, Any]]:
+    """Read the recorded calls of a cassette file"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class RecordingClient(LLMClientBase):
+    """Wraps an LLM client and records every call to a cassette file"""
+
+    def __init__(self, client: Any, cassette_path: str | Path):
+        """Initialize recording client.
+
+        Args:
+            client: Client to record (an LLMClientBase or the LLMClient wrapper)
+            cassette_path: Cassette file; calls are appended to it
+        """
+        super().__init__(
+            api_key=getattr(client, "api_key", ""),
+            api_base=getattr(client, "api_base", ""),
+            model=getattr(client, "model", ""),
+            retry_config=getattr(client, "retry_config", None),
+        )
+        self.client = client
+        self.cassette_path = Path(cassette_path)
+        self.cassette_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _record(self, messages: list[Message], tools: Any, max_tokens: int | None, response: LLMResponse, latency: float):
+        record = {
+            "request": {
+                "fingerprint": request_fingerprint(messages),
+                "messages": len(messages),
+                "tools": _tool_names(tools),
+                "max_tokens": max_tokens,
+            },
+            "response": response.model_dump(exclude_none=True),
+            "latency": round(latency, 6),
+        }
+        with open(self.cassette_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _kwargs(self, max_tokens: int | None) -> dict[str, Any]:
+        return {} if max_tokens is None else {"max_tokens": max_tokens}
+
+    async def generate(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        started = time.perf_counter()
+        response = await self.client.generate(messages=messages, tools=tools, **self._kwargs(max_tokens))
+        self._record(messages, tools, max_tokens, response, time.perf_counter() - started)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        started = time.perf_counter()
+        async for chunk in self.client.generate_stream(messages=messages, tools=tools, **self._kwargs(max_tokens)):
+            if chunk.type == "done" and chunk.response is not None:
+                self._record(messages, tools, max_tokens, chunk.response, time.perf_counter() - started)
+            yield chunk
+
+    def _prepare_request(self, messages: list[Message], tools: list[Any] | None = None) -> dict[str, Any]:
+        return self.client._prepare_request(messages, tools)
+
+    def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict[str, Any]]]:
+        return self.client._convert_messages(messages)
+
+
+class ReplayClient(LLMClientBase):
+    """Serves recorded responses from a cassette, in recording order"""
+
+    def __init__(
+        self,
+        cassette: str | Path | list[dict[str, Any]],
+        latency: float = 0.0,
+        latency_scale: float = 0.0,
+        strict: bool = False,
+    ):
+        """Initialize replay client.
+
+        Args:
+            cassette: Cassette file, or its already loaded calls
+            latency: Synthetic latency per call in seconds
+            latency_scale: Factor applied to the recorded latency and added to `latency`
+                (0: ignore recorded latency, 1: replay in real time)
+            strict: Check that each request has the recorded message history; off by
+                default, because histories embed machine-specific details like the workspace path
+        """
+        super().__init__(api_key="", api_base="", model="replay")
+        self.calls = load_cassette(cassette) if isinstance(cassette, (str, Path)) else list(cassette)
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.position = 0
+        self.replay_time = 0.0  # Total synthetic latency slept, to subtract from timings
+
+    def reset(self):
+        """Rewind to the first recorded call"""
+        self.position = 0
+        self.replay_time = 0.0
+
+    async def _next_response(self, messages: list[Message]) -> LLMResponse:
+        if self.position >= len(self.calls):
+            raise CassetteMismatchError(f"Cassette exhausted after {len(self.calls)} calls")
+        call = self.calls[self.position]
+        if self.strict and call["request"]["fingerprint"] != request_fingerprint(messages):
+            raise CassetteMismatchError(f"Request {self.position + 1} does not match the recording")
+        self.position += 1
+
+        delay = self.latency + self.latency_scale * call.get("latency", 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+            self.replay_time += delay
+        return LLMResponse.model_validate(call["response"])
+
+    async def generate(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        return await self._next_response(messages)
+
+    def _prepare_request(self, messages: list[Message], tools: list[Any] | None = None) -> dict[str, Any]:
+        return {"messages": [msg.model_dump(exclude_none=True) for msg in messages], "tools": _tool_names(tools)}
+
+    def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict[str, Any]]]:
+        system = next((msg.content for msg in messages if msg.role == "system"), None)
+        return system, [msg.model_dump(exclude_none=True) for msg in messages if msg.role != "system"]
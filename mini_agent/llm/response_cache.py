@@ -0,0 +1,246 @@
+"""Disk-backed LLM response cache.
+
+CachingClient wraps an LLM client and serves repeated requests from a ResponseCache
+instead of calling the provider. A request is identified by a hash of its canonical
+form: provider, endpoint, model, messages, tool schemas and max_tokens, serialized
+as JSON with sorted keys. Any change to the request is a miss.
+
+The cache is a SQLite file bounded by entry count and total size. The least recently
+used entries are evicted first, and entries older than the TTL are treated as misses.
+It is meant for workloads that repeat requests exactly: evaluation replays, retried
+batch tasks, regression runs. In interactive use the history differs on every call,
+so the cache would only miss.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from ..schema import LLMResponse, Message, StreamChunk
+from .base import LLMClientBase
+
+DEFAULT_CACHE_PATH = Path.home() / ".mini-agent" / "cache" / "llm_responses.sqlite"
+
+
+def _tool_schemas(tools: Any) -> list[dict[str, Any]]:
+    """Schemas of the tools offered to the LLM (Tool objects, schema dicts or a tool registry)"""
+    if tools is None:
+        return []
+    if hasattr(tools, "anthropic_schemas"):
+        return list(tools.anthropic_schemas())
+    return [tool if isinstance(tool, dict) else tool.to_schema() for tool in tools]
+
+
+def request_key(
+    messages: list[Message],
+    tools: Any = None,
+    max_tokens: int | None = None,
+    model: str = "",
+    provider: str = "",
+    api_base: str = "",
+) -> str:
+    """Stable hash of everything that determines an LLM response"""
+    canonical = {
+        "provider": str(provider),
+        "api_base": api_base,
+        "model": model,
+        "messages": [msg.model_dump(exclude_none=True) for msg in messages],
+        "tools": _tool_schemas(tools),
+        "max_tokens": max_tokens,
+    }
+    dumped = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters of a response cache since it was opened"""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0  # Misses on entries older than the TTL (included in misses)
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of LLM responses in a SQLite file, with TTL"""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float | None = 7 * 24 * 3600,
+    ):
+        """Open (or create) a response cache.
+
+        Args:
+            path: SQLite file holding the cache
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses (serialized JSON)
+            ttl: Seconds a response stays valid (None: no expiry)
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+        self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Cached response for a request key, or None (expired entries are dropped)"""
+        row = self._db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        if self.ttl is not None and now - row[1] > self.ttl:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.stats.misses += 1
+            self.stats.expired += 1
+            return None
+
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return LLMResponse.model_validate_json(row[0])
+
+    def put(self, key: str, response: LLMResponse):
+        """Store a response, evicting least recently used entries beyond the bounds"""
+        dumped = response.model_dump_json(exclude_none=True)
+        size = len(dumped.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, response, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, dumped, size, now, now),
+        )
+        self.stats.stores += 1
+        self._evict()
+
+    def _evict(self):
+        count, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.stats.evictions += len(evicted)
+
+    def clear(self):
+        """Remove all cached responses"""
+        self._db.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        """Close the cache file"""
+        self._db.close()
+
+
+class CachingClient(LLMClientBase):
+    """Wraps an LLM client and serves repeated requests from a response cache"""
+
+    def __init__(self, client: Any, cache: ResponseCache):
+        """Initialize caching client.
+
+        Args:
+            client: Client to cache (an LLMClientBase or the LLMClient wrapper)
+            cache: Response cache shared by every call
+        """
+        super().__init__(
+            api_key=getattr(client, "api_key", ""),
+            api_base=getattr(client, "api_base", ""),
+            model=getattr(client, "model", ""),
+            retry_config=getattr(client, "retry_config", None),
+        )
+        self.client = client
+        self.cache = cache
+        self.provider = getattr(client, "provider", "")
+
+    def _key(self, messages: list[Message], tools: Any, max_tokens: int | None) -> str:
+        return request_key(messages, tools, max_tokens, model=self.model, provider=self.provider, api_base=self.api_base)
+
+    def _kwargs(self, max_tokens: int | None) -> dict[str, Any]:
+        return {} if max_tokens is None else {"max_tokens": max_tokens}
+
+    def _store(self, key: str, response: LLMResponse):
+        """Cache a response, unless it reports a failure (some clients return errors instead of raising)"""
+        if response.finish_reason != "error":
+            self.cache.put(key, response)
+
+    async def generate(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        key = self._key(messages, tools, max_tokens)
+        response = self.cache.get(key)
+        if response is None:
+            response = await self.client.generate(messages=messages, tools=tools, **self._kwargs(max_tokens))
+            self._store(key, response)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        key = self._key(messages, tools, max_tokens)
+        response = self.cache.get(key)
+        if response is not None:
+            for chunk in self._response_chunks(response):
+                yield chunk
+            return
+
+        done: LLMResponse | None = None
+        async for chunk in self.client.generate_stream(messages=messages, tools=tools, **self._kwargs(max_tokens)):
+            if chunk.type == "done":
+                done = chunk.response
+            yield chunk
+        # Stored only once the stream has ended cleanly after its "done" chunk
+        if done is not None:
+            self._store(key, done)
+
+    def _prepare_request(self, messages: list[Message], tools: list[Any] | None = None) -> dict[str, Any]:
+        return self.client._prepare_request(messages, tools)
+
+    def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict[str, Any]]]:
+        return self.client._convert_messages(messages)
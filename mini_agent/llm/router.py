@@ -0,0 +1,226 @@
+"""Router client that spreads requests over several LLM backends.
+
+Each backend is a complete LLM client, for example MiniMax over the Anthropic protocol,
+MiniMax over the OpenAI protocol and GLM over Z.AI. The router keeps per-backend health:
+a moving average of latency and the error rate over the most recent calls. Each request
+goes to the best-ranked backend. A request that fails is retried on the next backend.
+Messages are provider-neutral, so the conversation carries over unchanged.
+
+A backend that fails is put in cooldown, which doubles with each consecutive failure.
+Backends in cooldown are only tried after all healthy ones. Only backend failures cause
+failover: transient errors (see retry.is_retryable) and auth or availability errors.
+Other errors, such as a bad request, would fail on every backend and are raised as is.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+from ..retry import CircuitOpenError, RetryExhaustedError, error_status, is_retryable
+from ..schema import LLMResponse, Message, StreamChunk
+from .base import LLMClientBase
+
+logger = logging.getLogger(__name__)
+
+ROUTING_STRATEGIES = ("latency", "priority")
+
+# Statuses meaning this backend cannot serve the request (bad key, no access, unknown model)
+BACKEND_STATUSES = frozenset({401, 403, 404})
+
+
+def is_backend_failure(error: BaseException) -> bool:
+    """Whether an error is the backend's fault, so another backend may succeed"""
+    if isinstance(error, (RetryExhaustedError, CircuitOpenError)) or is_retryable(error):
+        return True
+    return error_status(error) in BACKEND_STATUSES
+
+
+class AllBackendsFailedError(Exception):
+    """Raised when a request failed on every backend"""
+
+    def __init__(self, errors: dict[str, Exception]):
+        self.errors = errors
+        details = "; ".join(f"{name}: {error}" for name, error in errors.items())
+        super().__init__(f"All LLM backends failed ({details})")
+
+
+@dataclass
+class BackendHealth:
+    """Rolling latency and error statistics of one backend"""
+
+    window: int = 20
+    latency: float | None = None  # Exponential moving average of successful call latency (s)
+    outcomes: deque = field(default_factory=deque)  # True for success, most recent last
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+
+    def record(self, success: bool, latency: float | None = None, smoothing: float = 0.3):
+        self.requests += 1
+        self.outcomes.append(success)
+        if len(self.outcomes) > self.window:
+            self.outcomes.popleft()
+        if success:
+            self.consecutive_failures = 0
+            if latency is not None:
+                self.latency = latency if self.latency is None else smoothing * latency + (1 - smoothing) * self.latency
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def available(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+
+class RouterClient(LLMClientBase):
+    """LLM client that routes each request to the healthiest backend and fails over on errors"""
+
+    def __init__(
+        self,
+        backends: dict[str, Any],
+        strategy: str = "latency",
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        window: int = 20,
+    ):
+        """Initialize router client.
+
+        Args:
+            backends: Backend name -> LLM client, in priority order
+            strategy: "latency" (lowest latency adjusted for error rate first) or "priority"
+                (configured order; later backends are only used for failover)
+            cooldown: Seconds a backend is skipped after a failure, doubled per consecutive failure
+            max_cooldown: Upper limit of the cooldown
+            window: Number of recent calls the error rate is computed over
+        """
+        if not backends:
+            raise ValueError("RouterClient needs at least one backend")
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown routing strategy: {strategy} (available: {', '.join(ROUTING_STRATEGIES)})")
+        primary = next(iter(backends.values()))
+        super().__init__(
+            api_key=getattr(primary, "api_key", ""),
+            api_base=getattr(primary, "api_base", ""),
+            model=getattr(primary, "model", ""),
+            retry_config=getattr(primary, "retry_config", None),
+        )
+        self.backends = dict(backends)
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.health = {name: BackendHealth(window=window) for name in self.backends}
+        self.last_backend: str | None = None  # Backend that served the most recent request
+
+    def ranked_backends(self) -> list[str]:
+        """Backend names in the order the next request will try them"""
+        now = time.monotonic()
+        order = list(self.backends)
+        available = [name for name in order if self.health[name].available(now)]
+        cooling = sorted((name for name in order if not self.health[name].available(now)), key=lambda name: self.health[name].cooldown_until)
+        if self.strategy == "latency":
+            available.sort(key=self._score)
+        return available + cooling
+
+    def _score(self, name: str) -> float:
+        """Expected latency, inflated by the error rate; untried backends rank first"""
+        health = self.health[name]
+        if health.latency is None:
+            return 0.0
+        return health.latency / max(0.05, 1.0 - health.error_rate)
+
+    def _succeeded(self, name: str, started: float):
+        self.health[name].record(True, time.monotonic() - started)
+        self.last_backend = name
+
+    def _failed(self, name: str, error: Exception):
+        health = self.health[name]
+        health.record(False)
+        delay = min(self.max_cooldown, self.cooldown * 2 ** (health.consecutive_failures - 1))
+        health.cooldown_until = time.monotonic() + delay
+        logger.warning("LLM backend %s failed (%s), cooling down for %.0fs", name, error, delay)
+
+    @staticmethod
+    def _kwargs(max_tokens: int | None) -> dict[str, Any]:
+        return {} if max_tokens is None else {"max_tokens": max_tokens}
+
+    async def generate(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        errors: dict[str, Exception] = {}
+        for name in self.ranked_backends():
+            started = time.monotonic()
+            try:
+                response = await self.backends[name].generate(messages=messages, tools=tools, **self._kwargs(max_tokens))
+            except Exception as e:
+                if not is_backend_failure(e):
+                    raise
+                self._failed(name, e)
+                errors[name] = e
+                continue
+            self._succeeded(name, started)
+            return response
+        raise AllBackendsFailedError(errors)
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+        tools: list[Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream from the best-ranked backend
+
+        Failover happens only before the first chunk: once output has been streamed to the
+        caller, a failure is raised rather than restarting the response elsewhere.
+        """
+        errors: dict[str, Exception] = {}
+        for name in self.ranked_backends():
+            started = time.monotonic()
+            streamed = False
+            try:
+                async for chunk in self.backends[name].generate_stream(messages=messages, tools=tools, **self._kwargs(max_tokens)):
+                    streamed = True
+                    yield chunk
+            except Exception as e:
+                if not is_backend_failure(e):
+                    raise
+                self._failed(name, e)
+                if streamed:
+                    raise
+                errors[name] = e
+                continue
+            self._succeeded(name, started)
+            return
+        raise AllBackendsFailedError(errors)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Health of every backend, in routing order"""
+        now = time.monotonic()
+        return [
+            {
+                "backend": name,
+                "requests": self.health[name].requests,
+                "failures": self.health[name].failures,
+                "error_rate": round(self.health[name].error_rate, 4),
+                "latency_ms": None if self.health[name].latency is None else round(self.health[name].latency * 1000, 1),
+                "available": self.health[name].available(now),
+            }
+            for name in self.ranked_backends()
+        ]
+
+    def _prepare_request(self, messages: list[Message], tools: list[Any] | None = None) -> dict[str, Any]:
+        return self.backends[self.ranked_backends()[0]]._prepare_request(messages, tools)
+
+    def _convert_messages(self, messages: list[Message]) -> tuple[str | None, list[dict[str, Any]]]:
+        return self.backends[self.ranked_backends()[0]]._convert_messages(messages)
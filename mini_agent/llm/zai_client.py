@@ -15,6 +15,7 @@ from typing import Any, Optional
 
 try:
     import aiohttp
+    from ..utils.http_pool import get_http_session
     AIOHTTP_AVAILABLE = True
 except ImportError:
     AIOHTTP_AVAILABLE = False
@@ -93,33 +94,33 @@ class ZAIClient:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp is not installed. Please install it with: pip install aiohttp")
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/web_search",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return {
-                            "success": True,
-                            "id": result.get("id"),
-                            "created": result.get("created"),
-                            "request_id": result.get("request_id"),
-                            "search_result": result.get("search_result", []),
-                            "search_intent": result.get("search_intent", []),
-                            "query": query,
-                            "count": len(result.get("search_result", [])),
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Z.AI web search error {response.status}: {error_text}")
-                        return {
-                            "success": False,
-                            "error": f"API error {response.status}: {error_text}",
-                        }
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/web_search",
+                headers=self.headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    return {
+                        "success": True,
+                        "id": result.get("id"),
+                        "created": result.get("created"),
+                        "request_id": result.get("request_id"),
+                        "search_result": result.get("search_result", []),
+                        "search_intent": result.get("search_intent", []),
+                        "query": query,
+                        "count": len(result.get("search_result", [])),
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Z.AI web search error {response.status}: {error_text}")
+                    return {
+                        "success": False,
+                        "error": f"API error {response.status}: {error_text}",
+                    }
         except Exception as e:
             logger.exception("Z.AI web search failed")
             return {"success": False, "error": str(e)}
@@ -152,73 +153,73 @@ class ZAIClient:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp is not installed. Please install it with: pip install aiohttp")
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/reader",  # Use correct /reader endpoint for Lite Plan
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        reader_result = result.get("web_page_reader_result", {})
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/reader",  # Use correct /reader endpoint for Lite Plan
+                headers=self.headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    reader_result = result.get("web_page_reader_result", {})
+                    
+                    return {
+                        "success": True,
+                        "id": result.get("id"),
+                        "created": result.get("created"),
+                        "request_id": result.get("request_id"),
+                        "model": result.get("model"),
+                        "url": url,
+                        "title": reader_result.get("title", "N/A"),
+                        "description": reader_result.get("description", "N/A"),
+                        "content": reader_result.get("content", ""),
+                        "metadata": reader_result.get("metadata", {}),
+                        "external": reader_result.get("external", {}),
+                        "format": format_type,
+                        "word_count": len(reader_result.get("content", "").split()),
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Z.AI web reading error {response.status}: {error_text}")
+                    
+                    # Fallback: use web search for information about the URL
+                    logger.info(f"Falling back to web search for URL: {url}")
+                    search_result = await self.web_search(
+                        query=f"content summary {url}",
+                        count=3,
+                        recency_filter="noLimit"
+                    )
+                    
+                    if search_result["success"]:
+                        # Format as reader result
+                        results = search_result.get("search_result", [])
+                        combined_content = "\n\n".join([
+                            f"**{r.get('title', 'N/A')}**\n{r.get('content', 'N/A')}"
+                            for r in results
+                        ])
                         
                         return {
                             "success": True,
-                            "id": result.get("id"),
-                            "created": result.get("created"),
-                            "request_id": result.get("request_id"),
-                            "model": result.get("model"),
                             "url": url,
-                            "title": reader_result.get("title", "N/A"),
-                            "description": reader_result.get("description", "N/A"),
-                            "content": reader_result.get("content", ""),
-                            "metadata": reader_result.get("metadata", {}),
-                            "external": reader_result.get("external", {}),
+                            "title": f"Content from {url} (via search fallback)",
+                            "description": "Content extracted using web search fallback",
+                            "content": combined_content,
+                            "metadata": {
+                                "extraction_method": "web_search_fallback",
+                                "original_error": error_text,
+                            },
                             "format": format_type,
-                            "word_count": len(reader_result.get("content", "").split()),
+                            "word_count": len(combined_content.split()),
                             "timestamp": datetime.now().isoformat(),
                         }
                     else:
-                        error_text = await response.text()
-                        logger.error(f"Z.AI web reading error {response.status}: {error_text}")
-                        
-                        # Fallback: use web search for information about the URL
-                        logger.info(f"Falling back to web search for URL: {url}")
-                        search_result = await self.web_search(
-                            query=f"content summary {url}",
-                            count=3,
-                            recency_filter="noLimit"
-                        )
-                        
-                        if search_result["success"]:
-                            # Format as reader result
-                            results = search_result.get("search_result", [])
-                            combined_content = "\n\n".join([
-                                f"**{r.get('title', 'N/A')}**\n{r.get('content', 'N/A')}"
-                                for r in results
-                            ])
-                            
-                            return {
-                                "success": True,
-                                "url": url,
-                                "title": f"Content from {url} (via search fallback)",
-                                "description": "Content extracted using web search fallback",
-                                "content": combined_content,
-                                "metadata": {
-                                    "extraction_method": "web_search_fallback",
-                                    "original_error": error_text,
-                                },
-                                "format": format_type,
-                                "word_count": len(combined_content.split()),
-                                "timestamp": datetime.now().isoformat(),
-                            }
-                        else:
-                            return {
-                                "success": False,
-                                "url": url,
-                                "error": f"Reader API error {response.status} and fallback failed: {error_text}",
-                            }
+                        return {
+                            "success": False,
+                            "url": url,
+                            "error": f"Reader API error {response.status} and fallback failed: {error_text}",
+                        }
         except Exception as e:
             logger.exception("Z.AI web reading failed")
             return {"success": False, "url": url, "error": str(e)}
@@ -256,45 +257,45 @@ class ZAIClient:
             if not AIOHTTP_AVAILABLE:
                 raise ImportError("aiohttp is not installed. Please install it with: pip install aiohttp")
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",  # OpenAI-compatible endpoint
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    response_text = await response.text()
-                    logger.info(f"GLM Chat Response Status: {response.status}")
-                    logger.info(f"GLM Chat Response: {response_text}")
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        choice = result.get("choices", [{}])[0]
-                        return {
-                            "success": True,
-                            "id": result.get("id"),
-                            "object": result.get("object"),
-                            "created": result.get("created"),
-                            "model": result.get("model"),
-                            "content": choice.get("message", {}).get("content", ""),
-                            "usage": result.get("usage", {}),
-                            "timestamp": datetime.now().isoformat(),
-                            "api_endpoint": self.base_url,
-                        }
-                    elif response.status == 429:
-                        return {
-                            "success": False,
-                            "error": f"Billing Error: {response_text}",
-                            "api_endpoint": self.base_url,
-                            "recommendation": "Check Coding Plan subscription and billing"
-                        }
-                    else:
-                        logger.error(f"GLM chat completion error {response.status}: {response_text}")
-                        return {
-                            "success": False,
-                            "error": f"API error {response.status}: {response_text}",
-                            "api_endpoint": self.base_url,
-                        }
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/chat/completions",  # OpenAI-compatible endpoint
+                headers=self.headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                response_text = await response.text()
+                logger.info(f"GLM Chat Response Status: {response.status}")
+                logger.info(f"GLM Chat Response: {response_text}")
+                
+                if response.status == 200:
+                    result = await response.json()
+                    choice = result.get("choices", [{}])[0]
+                    return {
+                        "success": True,
+                        "id": result.get("id"),
+                        "object": result.get("object"),
+                        "created": result.get("created"),
+                        "model": result.get("model"),
+                        "content": choice.get("message", {}).get("content", ""),
+                        "usage": result.get("usage", {}),
+                        "timestamp": datetime.now().isoformat(),
+                        "api_endpoint": self.base_url,
+                    }
+                elif response.status == 429:
+                    return {
+                        "success": False,
+                        "error": f"Billing Error: {response_text}",
+                        "api_endpoint": self.base_url,
+                        "recommendation": "Check Coding Plan subscription and billing"
+                    }
+                else:
+                    logger.error(f"GLM chat completion error {response.status}: {response_text}")
+                    return {
+                        "success": False,
+                        "error": f"API error {response.status}: {response_text}",
+                        "api_endpoint": self.base_url,
+                    }
         except Exception as e:
             logger.exception("GLM chat completion failed")
             return {"success": False, "error": str(e), "api_endpoint": self.base_url}
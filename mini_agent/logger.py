@@ -32,6 +32,11 @@ class AgentLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_filename = f"agent_run_{timestamp}.log"
         self.log_file = self.log_dir / log_filename
+        # Agents started within the same second (batch runs) must not share a log file
+        suffix = 1
+        while self.log_file.exists():
+            self.log_file = self.log_dir / f"agent_run_{timestamp}_{suffix}.log"
+            suffix += 1
         self.log_index = 0
 
         # Write log header
@@ -0,0 +1,392 @@
+"""Mock LLM server for offline load testing
+
+Serves the Anthropic Messages API (`/v1/messages`, also under `/anthropic`) and the
+OpenAI Chat Completions API (`/v1/chat/completions`), both plain and streaming, with
+scripted replies, configurable latency and injected errors. Point `LLMClient` (or any
+client) at it to measure connection pooling, retries and concurrency without network
+access or API costs.
+
+Replies are scripted per conversation turn: the Nth assistant turn of a conversation
+gets the Nth script entry (the last entry repeats), so hundreds of concurrent sessions
+can be served without per-session server state.
+
+Usage:
+    python -m mini_agent.mock_server --port 8765 --latency 0.5 --error-rate 0.05
+    # then set api_base: "http://127.0.0.1:8765" in config.yaml
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+# Error types by HTTP status, per API surface
+ANTHROPIC_ERRORS = {429: "rate_limit_error", 500: "api_error", 529: "overloaded_error"}
+OPENAI_ERRORS = {429: "rate_limit_exceeded", 500: "server_error", 529: "server_error"}
+
+
+@dataclass(slots=True)
+class MockReply:
+    """One scripted assistant turn"""
+
+    text: str = ""
+    thinking: str = ""
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)  # {"name": ..., "arguments": {...}}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MockReply":
+        return cls(text=data.get("text", ""), thinking=data.get("thinking", ""), tool_calls=list(data.get("tool_calls", [])))
+
+
+@dataclass(slots=True)
+class MockServerStats:
+    """Request counters of a mock server"""
+
+    requests: int = 0
+    streamed: int = 0
+    errors: int = 0
+    active: int = 0
+    peak_active: int = 0
+    peers: set[tuple[str, int]] = field(default_factory=set)  # Distinct client (host, port) pairs
+
+    @property
+    def connections(self) -> int:
+        """Number of distinct TCP connections seen"""
+        return len(self.peers)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "streamed": self.streamed,
+            "errors": self.errors,
+            "active": self.active,
+            "peak_active": self.peak_active,
+            "connections": self.connections,
+        }
+
+
+def _chunks(text: str, size: int = 16) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _estimate_tokens(data: Any) -> int:
+    return max(1, len(json.dumps(data, ensure_ascii=False)) // 4)
+
+
+class MockLLMServer:
+    """Scriptable Anthropic/OpenAI-compatible server"""
+
+    def __init__(
+        self,
+        script: list[MockReply | dict[str, Any]] | None = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        chunk_delay: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (429, 500, 529),
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize mock server.
+
+        Args:
+            script: Replies by assistant turn (default: a single text reply)
+            latency: Mean delay before a response starts, in seconds
+            latency_jitter: Latency varies uniformly by up to this many seconds either way
+            chunk_delay: Delay between streamed events, in seconds
+            error_rate: Probability that a request fails with one of error_statuses
+            error_statuses: HTTP statuses of injected errors, chosen uniformly
+            seed: Random seed for reproducible latency and errors
+            host: Interface to listen on
+            port: Port to listen on (0: any free port)
+        """
+        replies = script or [MockReply(text="OK")]
+        self.script = [reply if isinstance(reply, MockReply) else MockReply.from_dict(reply) for reply in replies]
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.chunk_delay = chunk_delay
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.host = host
+        self.port = port
+        self.stats = MockServerStats()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+
+        self.app = web.Application()
+        self.app.router.add_post("/v1/messages", self._anthropic)
+        self.app.router.add_post("/anthropic/v1/messages", self._anthropic)
+        self.app.router.add_post("/v1/chat/completions", self._openai)
+        self.app.router.add_get("/stats", self._stats)
+
+    @property
+    def url(self) -> str:
+        """Base URL (use as api_base; the LLMClient wrapper appends /anthropic or /v1)"""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """Start serving; returns the base URL"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self.url
+
+    async def stop(self):
+        """Stop serving and close connections"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockLLMServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        await self.stop()
+
+    def _reply_for(self, messages: list[dict[str, Any]]) -> MockReply:
+        turn = sum(1 for msg in messages if msg.get("role") == "assistant")
+        return self.script[min(turn, len(self.script) - 1)]
+
+    async def _handle(self, request: web.Request, surface: str) -> web.StreamResponse:
+        stats = self.stats
+        stats.requests += 1
+        stats.active += 1
+        stats.peak_active = max(stats.peak_active, stats.active)
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        if peer:
+            stats.peers.add((peer[0], peer[1]))
+        try:
+            body = await request.json()
+            delay = self.latency + self._random.uniform(-self.latency_jitter, self.latency_jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self.error_rate > 0 and self._random.random() < self.error_rate:
+                stats.errors += 1
+                return self._error(surface, self._random.choice(self.error_statuses))
+
+            reply = self._reply_for(body.get("messages", []))
+            model = body.get("model", "mock")
+            input_tokens = _estimate_tokens(body.get("messages", []))
+            if body.get("stream"):
+                stats.streamed += 1
+                if surface == "anthropic":
+                    return await self._anthropic_stream(request, reply, model, input_tokens)
+                include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+                return await self._openai_stream(request, reply, model, input_tokens, include_usage)
+            if surface == "anthropic":
+                return web.json_response(self._anthropic_message(reply, model, input_tokens))
+            return web.json_response(self._openai_completion(reply, model, input_tokens))
+        finally:
+            stats.active -= 1
+
+    async def _anthropic(self, request: web.Request) -> web.StreamResponse:
+        return await self._handle(request, "anthropic")
+
+    async def _openai(self, request: web.Request) -> web.StreamResponse:
+        return await self._handle(request, "openai")
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats.to_dict())
+
+    def _error(self, surface: str, status: int) -> web.Response:
+        message = f"Injected mock error ({status})"
+        if surface == "anthropic":
+            body = {"type": "error", "error": {"type": ANTHROPIC_ERRORS.get(status, "api_error"), "message": message}}
+        else:
+            body = {"error": {"message": message, "type": OPENAI_ERRORS.get(status, "server_error"), "code": status}}
+        headers = {"retry-after": "0"} if status == 429 else None
+        return web.json_response(body, status=status, headers=headers)
+
+    # ----- Anthropic Messages API -----
+
+    def _anthropic_blocks(self, reply: MockReply) -> list[dict[str, Any]]:
+        blocks: list[dict[str, Any]] = []
+        if reply.thinking:
+            blocks.append({"type": "thinking", "thinking": reply.thinking, "signature": "mock"})
+        if reply.text:
+            blocks.append({"type": "text", "text": reply.text})
+        for call in reply.tool_calls:
+            blocks.append({"type": "tool_use", "id": f"toolu_{uuid.uuid4().hex[:20]}", "name": call["name"], "input": call.get("arguments", {})})
+        return blocks
+
+    def _anthropic_message(self, reply: MockReply, model: str, input_tokens: int) -> dict[str, Any]:
+        blocks = self._anthropic_blocks(reply)
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": blocks,
+            "stop_reason": "tool_use" if reply.tool_calls else "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": _estimate_tokens(blocks)},
+        }
+
+    async def _anthropic_stream(self, request: web.Request, reply: MockReply, model: str, input_tokens: int) -> web.StreamResponse:
+        message = self._anthropic_message(reply, model, input_tokens)
+        response = await self._open_stream(request)
+
+        async def send(event: str, data: dict[str, Any]):
+            await response.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+            if self.chunk_delay > 0:
+                await asyncio.sleep(self.chunk_delay)
+
+        start = dict(message, content=[], stop_reason=None, usage={"input_tokens": input_tokens, "output_tokens": 1})
+        await send("message_start", {"type": "message_start", "message": start})
+        for index, block in enumerate(message["content"]):
+            if block["type"] == "thinking":
+                await send("content_block_start", {"type": "content_block_start", "index": index, "content_block": {"type": "thinking", "thinking": ""}})
+                for part in _chunks(block["thinking"]):
+                    await send("content_block_delta", {"type": "content_block_delta", "index": index, "delta": {"type": "thinking_delta", "thinking": part}})
+                await send("content_block_delta", {"type": "content_block_delta", "index": index, "delta": {"type": "signature_delta", "signature": "mock"}})
+            elif block["type"] == "text":
+                await send("content_block_start", {"type": "content_block_start", "index": index, "content_block": {"type": "text", "text": ""}})
+                for part in _chunks(block["text"]):
+                    await send("content_block_delta", {"type": "content_block_delta", "index": index, "delta": {"type": "text_delta", "text": part}})
+            else:
+                start_block = {"type": "tool_use", "id": block["id"], "name": block["name"], "input": {}}
+                await send("content_block_start", {"type": "content_block_start", "index": index, "content_block": start_block})
+                for part in _chunks(json.dumps(block["input"])):
+                    await send("content_block_delta", {"type": "content_block_delta", "index": index, "delta": {"type": "input_json_delta", "partial_json": part}})
+            await send("content_block_stop", {"type": "content_block_stop", "index": index})
+
+        delta = {"stop_reason": message["stop_reason"], "stop_sequence": None}
+        await send("message_delta", {"type": "message_delta", "delta": delta, "usage": {"output_tokens": message["usage"]["output_tokens"]}})
+        await send("message_stop", {"type": "message_stop"})
+        await response.write_eof()
+        return response
+
+    # ----- OpenAI Chat Completions API -----
+
+    def _openai_tool_calls(self, reply: MockReply) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {"name": call["name"], "arguments": json.dumps(call.get("arguments", {}))},
+            }
+            for call in reply.tool_calls
+        ]
+
+    def _openai_completion(self, reply: MockReply, model: str, input_tokens: int) -> dict[str, Any]:
+        message: dict[str, Any] = {"role": "assistant", "content": reply.text or None}
+        if reply.thinking:
+            message["reasoning_details"] = [{"type": "reasoning.text", "text": reply.thinking}]
+        tool_calls = self._openai_tool_calls(reply)
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        output_tokens = _estimate_tokens(message)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": message, "finish_reason": "tool_calls" if tool_calls else "stop"}],
+            "usage": {"prompt_tokens": input_tokens, "completion_tokens": output_tokens, "total_tokens": input_tokens + output_tokens},
+        }
+
+    async def _openai_stream(
+        self, request: web.Request, reply: MockReply, model: str, input_tokens: int, include_usage: bool = False
+    ) -> web.StreamResponse:
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        response = await self._open_stream(request)
+
+        async def send(delta: dict[str, Any] | None, finish_reason: str | None = None, usage: dict[str, int] | None = None):
+            chunk: dict[str, Any] = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [] if delta is None else [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            if usage is not None:
+                chunk["usage"] = usage
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            if self.chunk_delay > 0:
+                await asyncio.sleep(self.chunk_delay)
+
+        await send({"role": "assistant", "content": ""})
+        for part in _chunks(reply.thinking):
+            await send({"reasoning_details": [{"type": "reasoning.text", "text": part}]})
+        for part in _chunks(reply.text):
+            await send({"content": part})
+        tool_calls = self._openai_tool_calls(reply)
+        for index, call in enumerate(tool_calls):
+            first = {"index": index, "id": call["id"], "type": "function", "function": {"name": call["function"]["name"], "arguments": ""}}
+            await send({"tool_calls": [first]})
+            for part in _chunks(call["function"]["arguments"]):
+                await send({"tool_calls": [{"index": index, "function": {"arguments": part}}]})
+        await send({}, finish_reason="tool_calls" if tool_calls else "stop")
+        if include_usage:
+            # Usage arrives in a final chunk without choices, as with the OpenAI API
+            output_tokens = _estimate_tokens({"content": reply.text, "tool_calls": tool_calls})
+            await send(None, usage={"prompt_tokens": input_tokens, "completion_tokens": output_tokens, "total_tokens": input_tokens + output_tokens})
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def _open_stream(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+        return response
+
+
+def load_script(path: str | Path) -> list[MockReply]:
+    """Load replies from a JSON file: a list of {"text", "thinking", "tool_calls"} objects"""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [MockReply.from_dict(item) for item in data]
+
+
+async def serve(server: MockLLMServer):
+    """Run a mock server until cancelled, printing its URL"""
+    url = await server.start()
+    print(f"Mock LLM server listening on {url} (stats: {url}/stats)", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Anthropic/OpenAI-compatible mock LLM server for load testing")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--script", type=str, default=None, help="JSON file with scripted replies by assistant turn")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response latency in seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Uniform latency jitter in seconds")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Delay between streamed events in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 429/500/529")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for latency and errors")
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        script=load_script(args.script) if args.script else None,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        chunk_delay=args.chunk_delay,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    )
+    try:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Latency profiler for the agent loop
+
+Records timed spans (LLM calls, tool calls, summarization, logging, rendering) and
+instant events (retry attempts), then exports them as Chrome trace-event JSON
+(open in chrome://tracing or https://ui.perfetto.dev) or as a summary table.
+
+Concurrent work (parallel tool calls, background compaction, batch tasks) runs in
+separate asyncio tasks and is drawn on separate lanes of the trace.
+"""
+
+import asyncio
+import json
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+# Profiler of the agent run executing in the current context (read by async_retry)
+_active_profiler: ContextVar["Profiler | None"] = ContextVar("active_profiler", default=None)
+
+
+def get_active_profiler() -> "Profiler | None":
+    """Get the profiler activated for the current context, if any"""
+    return _active_profiler.get()
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed phase; duration is None for instant events and unfinished spans"""
+
+    name: str
+    category: str
+    start: float
+    lane: int
+    args: dict[str, Any] = field(default_factory=dict)
+    duration: float | None = None
+    instant: bool = False
+
+
+class Profiler:
+    """Collects spans and exports them as a Chrome trace or a summary table"""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._lanes: weakref.WeakKeyDictionary[asyncio.Task, int] = weakref.WeakKeyDictionary()
+        self._next_lane = 1
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def _lane(self) -> int:
+        """Lane of the current asyncio task (0 outside of any task)"""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            return 0
+        lane = self._lanes.get(task)
+        if lane is None:
+            lane = self._lanes[task] = self._next_lane
+            self._next_lane += 1
+        return lane
+
+    def share_lane(self, task: asyncio.Task):
+        """Draw a task on the current task's lane, for work the current task just waits on"""
+        self._lanes[task] = self._lane()
+
+    def begin(self, name: str, category: str, **args: Any) -> Span:
+        """Start a span; finish it with end()"""
+        span = Span(name=name, category=category, start=self._now(), lane=self._lane(), args=args)
+        self.spans.append(span)
+        return span
+
+    def end(self, span: Span, **args: Any):
+        """Finish a span, optionally adding arguments"""
+        if span.duration is None:
+            span.duration = self._now() - span.start
+        span.args.update(args)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; yields the span's args dict for adding results"""
+        span = self.begin(name, category, **args)
+        try:
+            yield span.args
+        finally:
+            self.end(span)
+
+    def instant(self, name: str, category: str, **args: Any):
+        """Record a point-in-time event (e.g. a retry attempt)"""
+        self.spans.append(Span(name=name, category=category, start=self._now(), lane=self._lane(), args=args, instant=True))
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """Make this the active profiler for the current context (and tasks it creates)"""
+        token = _active_profiler.set(self)
+        try:
+            yield self
+        finally:
+            _active_profiler.reset(token)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Convert spans to Chrome trace-event format (timestamps in microseconds)"""
+        events = []
+        for span in self.spans:
+            event = {
+                "name": span.name,
+                "cat": span.category,
+                "ts": round(span.start * 1e6, 3),
+                "pid": 1,
+                "tid": span.lane,
+                "args": span.args,
+            }
+            if span.instant:
+                event.update(ph="i", s="t")
+            else:
+                duration = span.duration if span.duration is not None else self._now() - span.start
+                event.update(ph="X", dur=round(duration * 1e6, 3))
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path):
+        """Write the Chrome trace JSON to a file"""
+        Path(path).write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Aggregate finished spans and instant events by category and name
+
+        Returns:
+            Rows with category, name, count, total_ms, mean_ms and max_ms, by descending total time
+        """
+        groups: dict[tuple[str, str], list[float]] = {}
+        for span in self.spans:
+            if span.instant or span.duration is not None:
+                groups.setdefault((span.category, span.name), []).append(span.duration or 0.0)
+
+        rows = []
+        for (category, name), durations in groups.items():
+            total = sum(durations)
+            rows.append(
+                {
+                    "category": category,
+                    "name": name,
+                    "count": len(durations),
+                    "total_ms": total * 1000,
+                    "mean_ms": total / len(durations) * 1000,
+                    "max_ms": max(durations) * 1000,
+                }
+            )
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def format_summary(self) -> str:
+        """Format the summary as a plain-text table"""
+        header = f"{'Category':<10} {'Name':<28} {'Count':>6} {'Total ms':>11} {'Mean ms':>10} {'Max ms':>10}"
+        lines = [header, "-" * len(header)]
+        for row in self.summary():
+            lines.append(
+                f"{row['category']:<10} {row['name'][:28]:<28} {row['count']:>6} "
+                f"{row['total_ms']:>11.1f} {row['mean_ms']:>10.1f} {row['max_ms']:>10.1f}"
+            )
+        return "\n".join(lines)
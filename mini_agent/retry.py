@@ -3,18 +3,26 @@
 Provides decorators and utility functions to support retry logic for async functions.
 
 Features:
-- Supports exponential backoff strategy
+- Supports exponential backoff strategy, with decorrelated jitter
 - Configurable retry count and intervals
-- Supports specifying retryable exception types
+- Classifies errors: rate limits, server errors, timeouts and connection errors are
+  retried; other client errors (auth, bad request) fail immediately
+- Honors Retry-After headers
+- Per-endpoint circuit breaker that fails fast while a backend is down
 - Detailed logging
 - Fully decoupled, non-invasive to business code
 """
 
 import asyncio
+import email.utils
 import functools
 import logging
+import random
+import time
 from typing import Any, Callable, Type, TypeVar
 
+from .profiler import get_active_profiler
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -31,6 +39,9 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         retryable_exceptions: tuple[Type[Exception], ...] = (Exception,),
+        jitter: bool = True,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_timeout: float = 30.0,
     ):
         """
         Args:
@@ -39,7 +50,12 @@ class RetryConfig:
             initial_delay: Initial delay time (seconds)
             max_delay: Maximum delay time (seconds)
             exponential_base: Exponential backoff base
-            retryable_exceptions: Tuple of retryable exception types
+            retryable_exceptions: Tuple of exception types that may be retried; within
+                these, only errors classified as transient are (see is_retryable)
+            jitter: Randomize delays (decorrelated jitter) so concurrent callers do not retry in lockstep
+            circuit_breaker_threshold: Consecutive calls failing despite retries that open an
+                endpoint's circuit breaker (0: no circuit breaker)
+            circuit_breaker_timeout: Seconds an open circuit fails fast before a trial call is let through
         """
         self.enabled = enabled
         self.max_retries = max_retries
@@ -47,6 +63,9 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.retryable_exceptions = retryable_exceptions
+        self.jitter = jitter
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_timeout = circuit_breaker_timeout
 
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay time (exponential backoff)
@@ -60,6 +79,176 @@ class RetryConfig:
         delay = self.initial_delay * (self.exponential_base**attempt)
         return min(delay, self.max_delay)
 
+    def should_retry(self, error: BaseException) -> bool:
+        """Whether an error caught by retryable_exceptions is retried
+
+        Errors with an HTTP status are classified by status. Other errors are classified
+        by type, unless retryable_exceptions was narrowed from the catch-all Exception:
+        the types listed then are retried as configured.
+        """
+        if is_retryable(error):
+            return True
+        return error_status(error) is None and Exception not in self.retryable_exceptions
+
+    def next_delay(self, attempt: int, previous: float | None = None) -> float:
+        """Delay before the next attempt: exponential backoff, or decorrelated jitter
+
+        With jitter, the delay is drawn between initial_delay and three times the previous
+        delay (capped at max_delay), so concurrent callers spread out instead of retrying
+        together.
+
+        Args:
+            attempt: Current attempt number (starting from 0)
+            previous: Previous delay (None on the first retry)
+        """
+        if not self.jitter:
+            return self.calculate_delay(attempt)
+        upper = max(self.initial_delay, (previous or self.initial_delay) * 3)
+        return min(self.max_delay, random.uniform(self.initial_delay, upper))
+
+
+RETRYABLE_STATUSES = frozenset({408, 409, 425, 429})
+
+# Network-level failures of the SDKs and HTTP libraries in use, matched by class name so
+# none of them has to be imported here
+TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",  # anthropic / openai (APITimeoutError derives from it)
+        "ClientConnectionError",  # aiohttp
+        "ClientPayloadError",  # aiohttp
+        "TimeoutException",  # httpx
+        "NetworkError",  # httpx
+        "RemoteProtocolError",  # httpx
+    }
+)
+
+
+def error_status(error: BaseException) -> int | None:
+    """HTTP status of an API error (SDK status errors, aiohttp response errors), if any"""
+    for attribute in ("status_code", "status"):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is transient: 408/409/425/429, 5xx, timeouts and connection errors
+
+    Other 4xx errors (bad request, auth, not found) and errors without a status, such as
+    bugs in request handling, are not retried.
+    """
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES or status >= 500
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Delay requested by the server in Retry-After (or retry-after-ms), in seconds"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return max(0.0, float(milliseconds) / 1000)
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            when = email.utils.parsedate_to_datetime(value)
+            return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open"""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {endpoint}: too many consecutive failures, next attempt allowed in {retry_in:.1f}s")
+
+
+class CircuitBreaker:
+    """Fails calls to an endpoint fast after repeated transient failures
+
+    Closed: calls pass. After `threshold` consecutive calls failed (with retries exhausted)
+    the circuit opens and calls fail with CircuitOpenError for `timeout` seconds. Then one
+    trial call is let through (half open): success closes the circuit, a failure opens it
+    again right away.
+    """
+
+    def __init__(self, endpoint: str = "", threshold: int = 5, timeout: float = 30.0):
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.timeout = timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.timeout:
+            return "half_open"
+        return "open"
+
+    @property
+    def probing(self) -> bool:
+        """Whether the call in flight is the trial call of a half-open circuit"""
+        return self._trial_in_flight
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call must not be made"""
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        retry_in = max(0.0, self.opened_at + self.timeout - time.monotonic()) if state == "open" else self.timeout
+        raise CircuitOpenError(self.endpoint, retry_in)
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.threshold:
+            if self.opened_at is None or self._trial_in_flight:
+                logger.warning(f"Circuit breaker for {self.endpoint or 'endpoint'} opened after {self.failures} consecutive failures")
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release(self):
+        """End a call that neither succeeded nor failed transiently (e.g. a fatal 4xx)"""
+        self._trial_in_flight = False
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(endpoint: str, config: RetryConfig) -> CircuitBreaker | None:
+    """Process-wide circuit breaker of an endpoint, or None if the config disables it"""
+    if config.circuit_breaker_threshold <= 0:
+        return None
+    breaker = _circuit_breakers.get(endpoint)
+    if breaker is None:
+        breaker = CircuitBreaker(endpoint, config.circuit_breaker_threshold, config.circuit_breaker_timeout)
+        _circuit_breakers[endpoint] = breaker
+    return breaker
+
 
 class RetryExhaustedError(Exception):
     """Retry exhausted exception"""
@@ -73,12 +262,18 @@ class RetryExhaustedError(Exception):
 def async_retry(
     config: RetryConfig | None = None,
     on_retry: Callable[[Exception, int], None] | None = None,
+    endpoint: str | None = None,
 ) -> Callable:
     """Async function retry decorator
 
+    Only transient errors are retried (see is_retryable); others are raised immediately.
+    The delay honors the server's Retry-After, capped at max_delay.
+
     Args:
         config: Retry configuration object, uses default config if None
         on_retry: Callback function on retry, receives exception and current attempt number
+        endpoint: Endpoint called (e.g. the API base URL); calls to the same endpoint share a
+            circuit breaker. None: no circuit breaker
 
     Returns:
         Decorator function
@@ -97,23 +292,39 @@ def async_retry(
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            breaker = get_circuit_breaker(endpoint, config) if endpoint is not None else None
             last_exception: Exception | None = None
+            delay: float | None = None
 
             for attempt in range(config.max_retries + 1):
+                if breaker is not None:
+                    breaker.before_call()
                 try:
                     # Try to execute function
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
 
                 except config.retryable_exceptions as e:
                     last_exception = e
 
+                    if not config.should_retry(e):
+                        if breaker is not None:
+                            breaker.release()
+                        logger.warning(f"Function {func.__name__} failed with a non-retryable error: {str(e)}")
+                        raise
+
+                    # A call counts against the circuit once it has run out of retries; a
+                    # trial call of a half-open circuit gets no second chance
+                    if breaker is not None and (breaker.probing or attempt >= config.max_retries):
+                        breaker.record_failure()
+
                     # If this is the last attempt, don't retry
                     if attempt >= config.max_retries:
                         logger.error(f"Function {func.__name__} retry failed, reached maximum retry count {config.max_retries}")
                         raise RetryExhaustedError(e, attempt + 1)
 
-                    # Calculate delay time
-                    delay = config.calculate_delay(attempt)
+                    # Calculate delay time: the server's Retry-After if given, else backoff
+                    requested = retry_after(e)
+                    delay = min(requested, config.max_delay) if requested is not None else config.next_delay(attempt, delay)
 
                     # Log
                     logger.warning(
@@ -125,9 +336,25 @@ def async_retry(
                     if on_retry:
                         on_retry(e, attempt + 1)
 
+                    # Mark the attempt on the trace of the agent run being profiled, if any
+                    profiler = get_active_profiler()
+                    if profiler is not None:
+                        profiler.instant("retry", "llm", function=func.__name__, attempt=attempt + 1, delay=delay, error=str(e))
+
                     # Wait before retry
                     await asyncio.sleep(delay)
 
+                except BaseException:
+                    # Errors outside retryable_exceptions (and cancellation) say nothing about the endpoint
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
+
             # Should not reach here in theory
             if last_exception:
                 raise last_exception
@@ -135,4 +362,4 @@ def async_retry(
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
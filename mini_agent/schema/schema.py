@@ -46,3 +46,14 @@ class LLMResponse(BaseModel):
     tool_calls: list[ToolCall] | None = None
     finish_reason: str
     usage: dict | None = None  # Token usage information
+
+
+class StreamChunk(BaseModel):
+    """Incremental piece of a streamed LLM response."""
+
+    type: str  # "thinking", "text", "tool_call_delta", "done"
+    delta: str = ""  # Text, thinking or tool arguments (JSON fragment) delta
+    index: int | None = None  # Tool call position within the response (tool_call_delta)
+    tool_call_id: str | None = None  # Set on the first delta of each tool call
+    tool_name: str | None = None  # Set on the first delta of each tool call
+    response: LLMResponse | None = None  # Complete response (done)
@@ -0,0 +1,130 @@
+"""Incremental token accounting for message history
+
+Token counts are cached per message so that each step only encodes messages that are
+new or were modified since the last count, instead of re-encoding the whole history.
+"""
+
+import functools
+import logging
+from typing import Any
+
+import tiktoken
+
+from .schema import Message
+
+logger = logging.getLogger(__name__)
+
+# Metadata overhead per message (approximately 4 tokens)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Rough estimation used when tiktoken is unavailable: average 2.5 characters = 1 token
+FALLBACK_CHARS_PER_TOKEN = 2.5
+
+
+@functools.lru_cache(maxsize=1)
+def get_encoding() -> Any | None:
+    """Get the shared cl100k_base encoder (GLM-4.6 (via Z.AI)/MiniMax-M2/M2 compatible)
+
+    The encoder is created once per process. Failures are cached as well, so an offline
+    host does not retry loading the encoding on every call.
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken could not be initialized
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, falling back to character-based estimation: {e}")
+        return None
+
+
+def count_text_tokens(text: str) -> int:
+    """Count tokens in text, using the character-based estimate if tiktoken is unavailable"""
+    encoding = get_encoding()
+    if encoding is None:
+        return int(len(text) / FALLBACK_CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+
+class TokenLedger:
+    """Per-message token cache with a running total
+
+    Entries are keyed by message identity and remember the field objects they were computed
+    from (content, thinking, tool_calls). A message is re-encoded only if it is new or one of
+    those fields has been reassigned, so counting a history is O(new messages) encoding work.
+    """
+
+    def __init__(self):
+        # id(message) -> (message, content, thinking, tool_calls, token_count)
+        self._entries: dict[int, tuple[Message, Any, Any, Any, int]] = {}
+        self.total = 0
+
+    def count_message(self, msg: Message) -> int:
+        """Get token count for a single message, encoding it only on a cache miss"""
+        entry = self._entries.get(id(msg))
+        if (
+            entry is not None
+            and entry[0] is msg
+            and entry[1] is msg.content
+            and entry[2] is msg.thinking
+            and entry[3] is msg.tool_calls
+        ):
+            return entry[4]
+
+        tokens = self._encode_message(msg)
+        self._entries[id(msg)] = (msg, msg.content, msg.thinking, msg.tool_calls, tokens)
+        return tokens
+
+    def count(self, messages: list[Message]) -> int:
+        """Count tokens for a message history and update the running total
+
+        Args:
+            messages: Message history
+
+        Returns:
+            Total token count
+        """
+        self.total = sum(self.count_message(msg) for msg in messages)
+
+        # Drop entries for messages no longer in history (e.g. after summarization)
+        if len(self._entries) > len(messages):
+            live = {id(msg) for msg in messages}
+            self._entries = {key: entry for key, entry in self._entries.items() if key in live}
+
+        return self.total
+
+    def remember(self, msg: Message, tokens: int):
+        """Seed the cached count of a message, e.g. one restored from a parked history"""
+        self._entries[id(msg)] = (msg, msg.content, msg.thinking, msg.tool_calls, tokens)
+
+    def clear(self):
+        """Forget all cached counts"""
+        self._entries.clear()
+        self.total = 0
+
+    @staticmethod
+    def _encode_message(msg: Message) -> int:
+        """Encode one message: content, thinking, tool_calls and per-message overhead"""
+        total_tokens = 0
+
+        # Count text content
+        if isinstance(msg.content, str):
+            total_tokens += count_text_tokens(msg.content)
+        elif isinstance(msg.content, list):
+            for block in msg.content:
+                if isinstance(block, dict):
+                    # Convert dict to string for calculation
+                    total_tokens += count_text_tokens(str(block))
+
+        # Count thinking
+        if msg.thinking:
+            total_tokens += count_text_tokens(msg.thinking)
+
+        # Count tool_calls
+        if msg.tool_calls:
+            total_tokens += count_text_tokens(str(msg.tool_calls))
+
+        if get_encoding() is not None:
+            total_tokens += MESSAGE_OVERHEAD_TOKENS
+
+        return total_tokens
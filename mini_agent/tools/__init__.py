@@ -3,10 +3,14 @@
 Core tools are always available. Z.AI tools require explicit config enablement for credit protection.
 """
 
+from .artifact_tool import ArtifactStore, ReadArtifactTool
 from .base import Tool, ToolResult
 from .bash_tool import BashTool
 from .file_tools import EditTool, ReadTool, WriteTool
 from .note_tool import RecallNoteTool, SessionNoteTool
+from .registry import ToolRegistry
+from .result_cache import ToolResultCache
+from .subagent_tool import SpawnSubagentsTool
 
 # Z.AI tools - CRITICAL: Import only if explicitly enabled in config for credit protection
 _zai_tools_available = False
@@ -67,6 +71,11 @@ __all__ = [
     "BashTool",
     "SessionNoteTool",
     "RecallNoteTool",
+    "ArtifactStore",
+    "ReadArtifactTool",
+    "ToolRegistry",
+    "ToolResultCache",
+    "SpawnSubagentsTool",
 ]
 
 # Add Z.AI tools to __all__ only if explicitly enabled and successfully imported
@@ -0,0 +1,150 @@
+"""Artifact store for large tool results.
+
+Large tool outputs are written to disk under a content-hash key, and only a bounded
+preview plus the artifact id is kept in message history. The agent pages through the
+full output with the read_artifact tool when it needs more than the preview.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Any
+
+from .base import Tool, ToolResult
+
+# Artifact ids are the first 16 hex chars of the content's SHA-256
+ARTIFACT_ID_PATTERN = re.compile(r"^[0-9a-f]{16}$")
+
+
+class ArtifactStore:
+    """Content-addressed store of tool outputs in the workspace
+
+    Identical outputs map to the same artifact and are written only once.
+    """
+
+    def __init__(self, root_dir: str | Path, preview_chars: int = 2000):
+        """Initialize artifact store.
+
+        Args:
+            root_dir: Directory holding artifact files (created lazily)
+            preview_chars: Size of the entry kept in history: the artifact handle, plus head and
+                tail halves filling the rest
+        """
+        self.root_dir = Path(root_dir)
+        self.preview_chars = preview_chars
+
+    def _path(self, artifact_id: str) -> Path:
+        if not ARTIFACT_ID_PATTERN.match(artifact_id):
+            raise ValueError(f"Invalid artifact id: {artifact_id}")
+        return self.root_dir / f"{artifact_id}.txt"
+
+    def put(self, content: str) -> str:
+        """Store content and return its artifact id"""
+        artifact_id = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        path = self._path(artifact_id)
+        if not path.exists():
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a partial artifact behind
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            tmp_path.replace(path)
+        return artifact_id
+
+    def get(self, artifact_id: str) -> str:
+        """Get full artifact content
+
+        Raises:
+            FileNotFoundError: Unknown artifact id
+        """
+        return self._path(artifact_id).read_text(encoding="utf-8")
+
+    def preview(self, content: str, artifact_id: str) -> str:
+        """Build the bounded history entry for a stored artifact: head, tail and a handle
+
+        Content that fits in the preview is returned unchanged, and so is content shorter
+        than the handle alone.
+        """
+        if len(content) <= self.preview_chars:
+            return content
+        handle = (
+            f"\n\n... [Output of {len(content)} chars stored as artifact {artifact_id}; "
+            f"use read_artifact with artifact_id=\"{artifact_id}\" and an offset to read the rest] ...\n\n"
+        )
+        half = max(0, self.preview_chars - len(handle)) // 2
+        preview = f"{content[:half]}{handle}{content[len(content) - half:]}"
+        return preview if len(preview) < len(content) else content
+
+
+class ReadArtifactTool(Tool):
+    """Page through a stored tool output by character offset."""
+
+    def __init__(self, store: ArtifactStore, max_chars: int = 8000):
+        """Initialize ReadArtifactTool.
+
+        Args:
+            store: Artifact store to read from
+            max_chars: Maximum characters returned per call
+        """
+        self.store = store
+        self.max_chars = max_chars
+
+    @property
+    def name(self) -> str:
+        return "read_artifact"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Read part of a large tool output that was stored as an artifact. "
+            "Tool results that are too large show only a preview and an artifact id; "
+            f"use this tool with a character offset to page through the full output (up to {self.max_chars} chars per call)."
+        )
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "artifact_id": {
+                    "type": "string",
+                    "description": "Artifact id from the truncated tool result",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Character offset to start reading from (default: 0)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Number of characters to read (default and maximum: {self.max_chars})",
+                },
+            },
+            "required": ["artifact_id"],
+        }
+
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    def read_paths(self, **arguments: Any) -> list[Path] | None:
+        # Artifacts are content-addressed and never change
+        return []
+
+    async def execute(self, artifact_id: str, offset: int = 0, limit: int | None = None) -> ToolResult:
+        """Execute read artifact."""
+        try:
+            content = self.store.get(artifact_id)
+        except (FileNotFoundError, ValueError):
+            return ToolResult(success=False, content="", error=f"Artifact not found: {artifact_id}")
+
+        start = max(0, offset)
+        size = min(limit or self.max_chars, self.max_chars)
+        end = min(start + size, len(content))
+        page = content[start:end]
+
+        footer = f"\n\n[Artifact {artifact_id}: chars {start}-{end} of {len(content)}"
+        footer += f"; continue with offset={end}]" if end < len(content) else "; end of artifact]"
+        return ToolResult(success=True, content=page + footer)
@@ -1,5 +1,6 @@
 """Base tool classes."""
 
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
@@ -31,6 +32,31 @@ class Tool:
         """Tool parameters schema (JSON Schema format)."""
         raise NotImplementedError
 
+    @property
+    def parallel_safe(self) -> bool:
+        """Whether this tool may run concurrently with other parallel-safe calls.
+
+        Tools without side effects (reads, lookups) should override this to return True.
+        """
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether repeated identical calls within a run may be served from the result cache.
+
+        Only for read-only tools whose result depends on nothing but the arguments and the
+        files reported by read_paths().
+        """
+        return False
+
+    def read_paths(self, **arguments: Any) -> list[Path] | None:
+        """Files a cacheable call's result depends on; None if unknown (any write invalidates it)"""
+        return None
+
+    def written_paths(self, **arguments: Any) -> list[Path] | None:
+        """Files a call may modify; None if unknown (invalidates every cached result)"""
+        return [] if self.parallel_safe else None
+
     async def execute(self, *args, **kwargs) -> ToolResult:  # type: ignore
         """Execute the tool with arbitrary arguments."""
         raise NotImplementedError
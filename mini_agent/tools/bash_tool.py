@@ -4,8 +4,10 @@ Supports both bash (Unix/Linux/macOS) and PowerShell (Windows).
 """
 
 import asyncio
+import os
 import platform
 import re
+import signal
 import time
 import uuid
 from typing import Any
@@ -222,10 +224,27 @@ class BashTool(Tool):
     - Unix/Linux/macOS: bash
     """
 
-    def __init__(self):
-        """Initialize BashTool with OS-specific shell detection."""
+    def __init__(self, workspace_dir: str | None = None):
+        """Initialize BashTool with OS-specific shell detection.
+
+        Args:
+            workspace_dir: Working directory for commands (default: current process directory)
+        """
         self.is_windows = platform.system() == "Windows"
         self.shell_name = "PowerShell" if self.is_windows else "bash"
+        self.workspace_dir = workspace_dir
+
+    def _kill(self, process: "asyncio.subprocess.Process"):
+        """Kill a foreground process (and on Unix, its process group)"""
+        if process.returncode is not None:
+            return
+        try:
+            if self.is_windows:
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
     @property
     def name(self) -> str:
@@ -341,12 +360,14 @@ Examples:
                         *shell_cmd,
                         stdout=asyncio.subprocess.PIPE,
                         stderr=asyncio.subprocess.STDOUT,
+                        cwd=self.workspace_dir,
                     )
                 else:
                     process = await asyncio.create_subprocess_shell(
                         shell_cmd,
                         stdout=asyncio.subprocess.PIPE,
                         stderr=asyncio.subprocess.STDOUT,
+                        cwd=self.workspace_dir,
                     )
 
                 # Create background shell and add to manager
@@ -376,18 +397,26 @@ Examples:
                         *shell_cmd,
                         stdout=asyncio.subprocess.PIPE,
                         stderr=asyncio.subprocess.PIPE,
+                        cwd=self.workspace_dir,
                     )
                 else:
+                    # Own process group, so a kill also reaches the command's children
                     process = await asyncio.create_subprocess_shell(
                         shell_cmd,
                         stdout=asyncio.subprocess.PIPE,
                         stderr=asyncio.subprocess.PIPE,
+                        cwd=self.workspace_dir,
+                        start_new_session=True,
                     )
 
                 try:
                     stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+                except asyncio.CancelledError:
+                    # The agent run was cancelled: do not leave the command running
+                    self._kill(process)
+                    raise
                 except asyncio.TimeoutError:
-                    process.kill()
+                    self._kill(process)
                     error_msg = f"Command timed out after {timeout} seconds"
                     return BashOutputResult(
                         success=False,
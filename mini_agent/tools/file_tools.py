@@ -3,8 +3,7 @@
 from pathlib import Path
 from typing import Any
 
-import tiktoken
-
+from ..token_ledger import count_text_tokens
 from .base import Tool, ToolResult
 
 
@@ -29,8 +28,7 @@ def truncate_text_by_tokens(
         >>> truncated = truncate_text_by_tokens(text, 64000)
         >>> print(truncated)
     """
-    encoding = tiktoken.get_encoding("cl100k_base")
-    token_count = len(encoding.encode(text))
+    token_count = count_text_tokens(text)
 
     # Return original text if under limit
     if token_count <= max_tokens:
@@ -60,6 +58,14 @@ def truncate_text_by_tokens(
     return head_part + truncation_note + tail_part
 
 
+def _resolve_path(workspace_dir: Path, path: str) -> Path:
+    """Resolve a tool path argument the way the file tools do (relative to the workspace)"""
+    file_path = Path(path)
+    if not file_path.is_absolute():
+        file_path = workspace_dir / file_path
+    return file_path.resolve()
+
+
 class ReadTool(Tool):
     """Read file content."""
 
@@ -105,6 +111,17 @@ class ReadTool(Tool):
             "required": ["path"],
         }
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    def read_paths(self, path: str, **arguments: Any) -> list[Path] | None:
+        return [_resolve_path(self.workspace_dir, path)]
+
     async def execute(self, path: str, offset: int | None = None, limit: int | None = None) -> ToolResult:
         """Execute read file."""
         try:
@@ -192,6 +209,9 @@ class WriteTool(Tool):
             "required": ["path", "content"],
         }
 
+    def written_paths(self, path: str, **arguments: Any) -> list[Path] | None:
+        return [_resolve_path(self.workspace_dir, path)]
+
     async def execute(self, path: str, content: str) -> ToolResult:
         """Execute write file."""
         try:
@@ -253,6 +273,9 @@ class EditTool(Tool):
             "required": ["path", "old_str", "new_str"],
         }
 
+    def written_paths(self, path: str, **arguments: Any) -> list[Path] | None:
+        return [_resolve_path(self.workspace_dir, path)]
+
     async def execute(self, path: str, old_str: str, new_str: str) -> ToolResult:
         """Execute edit file."""
         try:
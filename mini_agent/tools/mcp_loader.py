@@ -20,11 +20,13 @@ class MCPTool(Tool):
         description: str,
         parameters: dict[str, Any],
         session: ClientSession,
+        parallel_safe: bool = False,
     ):
         self._name = name
         self._description = description
         self._parameters = parameters
         self._session = session
+        self._parallel_safe = parallel_safe
 
     @property
     def name(self) -> str:
@@ -38,6 +40,15 @@ class MCPTool(Tool):
     def parameters(self) -> dict[str, Any]:
         return self._parameters
 
+    @property
+    def parallel_safe(self) -> bool:
+        return self._parallel_safe
+
+    @property
+    def cacheable(self) -> bool:
+        # Read-only MCP tools are treated as pure lookups
+        return self._parallel_safe
+
     async def execute(self, **kwargs) -> ToolResult:
         """Execute MCP tool via the session."""
         try:
@@ -114,11 +125,18 @@ class MCPServerConnection:
                 # Convert MCP tool schema to our format
                 parameters = tool.inputSchema if hasattr(tool, 'inputSchema') else {}
 
+                # Servers that mark a tool read-only allow it to run in parallel
+                annotations = getattr(tool, 'annotations', None)
+                read_only = bool(
+                    getattr(annotations, 'readOnlyHint', None) or getattr(annotations, 'read_only_hint', None)
+                )
+
                 mcp_tool = MCPTool(
                     name=tool.name,
                     description=tool.description or "",
                     parameters=parameters,
-                    session=session
+                    session=session,
+                    parallel_safe=read_only,
                 )
                 self.tools.append(mcp_tool)
 
@@ -66,6 +66,9 @@ class SessionNoteTool(Tool):
             "required": ["content"],
         }
 
+    def written_paths(self, **arguments: Any) -> list[Path] | None:
+        return [self.memory_file.resolve()]
+
     def _load_from_file(self) -> list:
         """Load notes from file.
         
@@ -160,6 +163,17 @@ class RecallNoteTool(Tool):
             },
         }
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    def read_paths(self, **arguments: Any) -> list[Path] | None:
+        return [self.memory_file.resolve()]
+
     async def execute(self, category: str = None) -> ToolResult:
         """Recall session notes.
 
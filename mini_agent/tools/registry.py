@@ -0,0 +1,83 @@
+"""Tool registry with precomputed provider schemas.
+
+Tool schemas are static for the lifetime of a tool, but building them is not free:
+every `to_schema()` call rebuilds descriptions and parameter dicts. The registry builds
+each tool's Anthropic and OpenAI schemas once, when the tool is added, and keeps the
+assembled schema lists until the tool set changes, so LLM clients can reuse them on
+every step.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from .base import Tool
+
+
+class ToolRegistry(Mapping[str, Tool]):
+    """Tools by name, with cached provider schemas
+
+    Reads like a dict (`registry["bash"]`, `"bash" in registry`, `registry.values()`);
+    changes go through `add()` and `remove()`, which invalidate the cached schema lists.
+    Returned schemas are shared between calls and must not be modified.
+    """
+
+    def __init__(self, tools: Iterable[Tool] = ()):
+        """Initialize tool registry.
+
+        Args:
+            tools: Initial tools; a later tool replaces an earlier one with the same name
+        """
+        self._tools: dict[str, Tool] = {}
+        self._tool_schemas: dict[str, dict[str, dict[str, Any]]] = {}  # name -> format -> schema
+        self._schema_lists: dict[str, tuple[dict[str, Any], ...]] = {}  # format -> schemas of all tools
+        for tool in tools:
+            self.add(tool)
+
+    def __getitem__(self, name: str) -> Tool:
+        return self._tools[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tools)
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def add(self, tool: Tool):
+        """Register a tool (replacing any tool with the same name) and build its schemas"""
+        self._tools[tool.name] = tool
+        self._tool_schemas[tool.name] = {
+            "anthropic": tool.to_schema(),
+            "openai": tool.to_openai_schema(),
+        }
+        self._schema_lists.clear()
+
+    def remove(self, name: str) -> Tool:
+        """Unregister a tool
+
+        Raises:
+            KeyError: No tool with this name
+        """
+        tool = self._tools.pop(name)
+        del self._tool_schemas[name]
+        self._schema_lists.clear()
+        return tool
+
+    def schemas(self, schema_format: str) -> tuple[dict[str, Any], ...]:
+        """Schemas of all tools in registration order
+
+        Args:
+            schema_format: "anthropic" or "openai"
+        """
+        schemas = self._schema_lists.get(schema_format)
+        if schemas is None:
+            schemas = tuple(tool_schemas[schema_format] for tool_schemas in self._tool_schemas.values())
+            self._schema_lists[schema_format] = schemas
+        return schemas
+
+    def anthropic_schemas(self) -> tuple[dict[str, Any], ...]:
+        """Schemas of all tools in Anthropic format"""
+        return self.schemas("anthropic")
+
+    def openai_schemas(self) -> tuple[dict[str, Any], ...]:
+        """Schemas of all tools in OpenAI format"""
+        return self.schemas("openai")
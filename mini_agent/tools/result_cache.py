@@ -0,0 +1,71 @@
+"""Memoization of read-only tool results within an agent run.
+
+Calls to cacheable tools are keyed by tool name and canonical (sorted-key JSON)
+arguments. Each entry remembers the files its result was read from, so a write only
+drops the entries it can affect; a write to unknown files (e.g. bash) drops everything.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .base import ToolResult
+
+
+@dataclass(slots=True)
+class _Entry:
+    result: ToolResult
+    read_paths: frozenset[Path] | None  # None: depends on unknown files
+
+
+class ToolResultCache:
+    """Results of cacheable tool calls, invalidated by writes"""
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(tool_name: str, arguments: dict[str, Any]) -> tuple[str, str]:
+        return tool_name, json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+
+    def get(self, tool_name: str, arguments: dict[str, Any]) -> ToolResult | None:
+        """Cached result of an identical earlier call, if still valid"""
+        entry = self._entries.get(self._key(tool_name, arguments))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.result
+
+    def put(self, tool_name: str, arguments: dict[str, Any], result: ToolResult, read_paths: list[Path] | None):
+        """Store a result together with the files it depends on"""
+        paths = frozenset(read_paths) if read_paths is not None else None
+        self._entries[self._key(tool_name, arguments)] = _Entry(result=result, read_paths=paths)
+
+    def invalidate(self, written_paths: list[Path] | None):
+        """Drop entries that may be stale after a write
+
+        Args:
+            written_paths: Files that were (or may have been) modified; None if unknown
+        """
+        if written_paths is None:
+            self._entries.clear()
+            return
+        if not written_paths:
+            return
+        written = set(written_paths)
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if entry.read_paths is not None and not (entry.read_paths & written)
+        }
+
+    def clear(self):
+        """Drop all entries (files may change between runs)"""
+        self._entries.clear()
@@ -4,11 +4,12 @@ Simple, clean implementation using Z.AI GLM-4.6
 """
 
 import os
-import aiohttp
 import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
+from ..utils.http_pool import get_http_session
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -30,73 +31,60 @@ class SimpleWebSearch:
             self.available = False
             return
             
-        if not self._check_dependencies():
-            self.available = False
-            return
-            
         self.available = True
         logger.info(f"Web search initialized with {self.model}")
     
-    def _check_dependencies(self) -> bool:
-        """Check if required dependencies are available"""
-        try:
-            import aiohttp
-            return True
-        except ImportError:
-            logger.error("aiohttp not available - install with: pip install aiohttp")
-            return False
-    
     async def search(self, query: str, max_results: int = MAX_RESULTS) -> Dict[str, Any]:
         """Perform web search"""
         if not self.available:
             return {
                 "success": False,
                 "content": "",
-                "error": "Web search not available - API key or dependencies missing"
+                "error": "Web search not available - ZAI_API_KEY not set"
             }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "user", 
-                            "content": f"Search the web for: {query}. Provide {max_results} relevant results with URLs and summaries."
-                        }
-                    ],
-                    "max_tokens": MAX_TOKENS,
-                    "stream": False
-                }
-                
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
+            session = get_http_session(self.base_url)
+            payload = {
+                "model": self.model,
+                "messages": [
+                    {
+                        "role": "user", 
+                        "content": f"Search the web for: {query}. Provide {max_results} relevant results with URLs and summaries."
+                    }
+                ],
+                "max_tokens": MAX_TOKENS,
+                "stream": False
+            }
+            
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+            
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers=headers
+            ) as response:
                 
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=headers
-                ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+                    
+                    return {
+                        "success": True,
+                        "content": content,
+                        "error": None
+                    }
+                else:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "content": "",
+                        "error": f"API error {response.status}: {error_text}"
+                    }
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-                        
-                        return {
-                            "success": True,
-                            "content": content,
-                            "error": None
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "content": "",
-                            "error": f"API error {response.status}: {error_text}"
-                        }
-                        
         except Exception as e:
             logger.exception("Web search failed")
             return {
@@ -125,21 +113,13 @@ async def test_web_search():
     """Test web search functionality"""
     print("🧪 Testing simple web search...")
     
-    # Check dependencies
-    try:
-        import aiohttp
-        print("✅ aiohttp available")
-    except ImportError:
-        print("❌ aiohttp not available - install first")
-        return False
-    
     # Check API key
     api_key = os.getenv('ZAI_API_KEY')
     if not api_key:
         print("❌ Z.AI API key not found")
         return False
     
-    print("✅ Dependencies and API key check passed")
+    print("✅ API key check passed")
     
     # Test search
     result = await web_search("Python programming", max_results=3)
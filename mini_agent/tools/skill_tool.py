@@ -4,6 +4,7 @@ Skill Tool - Tool for Agent to load Skills on-demand
 Implements Progressive Disclosure (Level 2): Load full skill content when needed
 """
 
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .base import Tool, ToolResult
@@ -37,6 +38,18 @@ class GetSkillTool(Tool):
             "required": ["skill_name"],
         }
 
+    @property
+    def parallel_safe(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    def read_paths(self, **arguments: Any) -> list[Path] | None:
+        # Skills are loaded once at startup
+        return []
+
     async def execute(self, skill_name: str) -> ToolResult:
         """Get detailed information about specified skill"""
         skill = self.skill_loader.get_skill(skill_name)
@@ -0,0 +1,175 @@
+"""Sub-agent fan-out tool.
+
+spawn_subagents delegates independent subtasks to child agents. Each child has its own
+message history and a subset of the parent's tools, and the children run concurrently
+on the parent's event loop. Only each child's final answer goes back to the parent, so
+the exploration itself never enters the parent's history.
+"""
+
+import asyncio
+from typing import Any, Callable
+
+from ..budget import RunBudget
+from .base import Tool, ToolResult
+
+SUBAGENT_SYSTEM_PROMPT = """You are a sub-agent working on one subtask delegated by another agent.
+
+Work on the subtask independently with the tools available to you. Do not ask questions: nobody
+will answer them. When you are done, reply with a concise report of your findings or of what you
+changed; this report is the only thing the delegating agent will see."""
+
+
+class SpawnSubagentsTool(Tool):
+    """Run several sub-agents concurrently and return their condensed results."""
+
+    def __init__(
+        self,
+        llm_client: Any,
+        tools: list[Tool],
+        workspace_dir: str,
+        max_concurrency: int = 4,
+        max_result_chars: int = 4000,
+        agent_options: dict[str, Any] | None = None,
+        budget: Callable[[], RunBudget] | None = None,
+    ):
+        """Initialize SpawnSubagentsTool.
+
+        Args:
+            llm_client: LLM client shared with the sub-agents
+            tools: Tools the sub-agents can be given
+            workspace_dir: Workspace of the sub-agents
+            max_concurrency: Maximum number of sub-agents running at the same time
+            max_result_chars: Longer sub-agent results are truncated to this many chars
+            agent_options: Other Agent constructor arguments for the sub-agents (max_steps, ...)
+            budget: Returns the parent's current run budget. Each sub-agent gets what is left of
+                it, and the tokens the sub-agents use are charged to it.
+        """
+        self.llm_client = llm_client
+        self.available_tools = {tool.name: tool for tool in tools if tool.name != self.name}
+        self.workspace_dir = workspace_dir
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_result_chars = max_result_chars
+        self.agent_options = agent_options or {}
+        self.budget = budget
+
+    @property
+    def name(self) -> str:
+        return "spawn_subagents"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Delegate independent subtasks to sub-agents that run in parallel, and get back a short report "
+            "from each one. Use it to explore several files, URLs or questions at once. Each sub-agent starts "
+            "with an empty history: describe its subtask completely. Sub-agents cannot see each other's work, "
+            "so only split work that is independent."
+        )
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "description": "Subtasks, one sub-agent each",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "task": {
+                                "type": "string",
+                                "description": "Complete, self-contained description of the subtask",
+                            },
+                            "tools": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": f"Tools the sub-agent may use (default: all of {', '.join(self.available_tools)})",
+                            },
+                        },
+                        "required": ["task"],
+                    },
+                    "minItems": 1,
+                },
+            },
+            "required": ["tasks"],
+        }
+
+    def _scoped_tools(self, names: list[str] | None) -> list[Tool]:
+        if names is None:
+            return list(self.available_tools.values())
+        return [self.available_tools[name] for name in names]
+
+    async def _run_subagent(
+        self, task: str, tools: list[Tool], semaphore: asyncio.Semaphore, budget: RunBudget | None
+    ) -> tuple[str, str]:
+        """Run one sub-agent to completion
+
+        Returns:
+            (stop reason, result text)
+        """
+        # Imported here: the agent module imports the tools package
+        from ..agent import Agent
+        from ..events import NullSink
+
+        async with semaphore:
+            agent = None
+            try:
+                agent = Agent(
+                    llm_client=self.llm_client,
+                    system_prompt=SUBAGENT_SYSTEM_PROMPT,
+                    tools=tools,
+                    workspace_dir=self.workspace_dir,
+                    event_sink=NullSink(),
+                    **self.agent_options,
+                )
+                agent.add_user_message(task)
+                if budget is None:
+                    result = await agent.run()
+                else:
+                    result = await agent.run(time_budget=budget.remaining_time(), token_budget=budget.remaining_tokens())
+                return agent.stop_reason or "end_turn", result
+            except Exception as e:
+                return "error", f"{type(e).__name__}: {e}"
+            finally:
+                if budget is not None and agent is not None:
+                    budget.record(agent.budget.input_tokens, agent.budget.output_tokens, agent.budget.llm_time)
+
+    def _condense(self, result: str) -> str:
+        if len(result) <= self.max_result_chars:
+            return result
+        return f"{result[: self.max_result_chars]}\n... [truncated {len(result) - self.max_result_chars} chars]"
+
+    async def execute(self, tasks: list[dict[str, Any]]) -> ToolResult:
+        """Run the sub-agents and collect their results."""
+        if not tasks:
+            return ToolResult(success=False, content="", error="No tasks given")
+
+        scoped_tools = []
+        for i, spec in enumerate(tasks, 1):
+            names = spec.get("tools")
+            unknown = [name for name in names or [] if name not in self.available_tools]
+            if unknown:
+                return ToolResult(
+                    success=False,
+                    content="",
+                    error=f"Task {i}: unknown tools {', '.join(unknown)}. Available: {', '.join(self.available_tools)}",
+                )
+            scoped_tools.append(self._scoped_tools(names))
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        budget = self.budget() if self.budget else None
+        outcomes = await asyncio.gather(
+            *(self._run_subagent(spec["task"], tools, semaphore, budget) for spec, tools in zip(tasks, scoped_tools))
+        )
+
+        sections = []
+        for i, (spec, (stop_reason, result)) in enumerate(zip(tasks, outcomes), 1):
+            title = spec["task"].strip().splitlines()[0] if spec["task"].strip() else "(empty task)"
+            if len(title) > 100:
+                title = title[:97] + "..."
+            sections.append(f"## Sub-agent {i}: {title}\nStatus: {stop_reason}\n\n{self._condense(result)}")
+
+        failed = sum(1 for stop_reason, _ in outcomes if stop_reason == "error")
+        if failed == len(outcomes):
+            return ToolResult(success=False, content="", error="All sub-agents failed\n\n" + "\n\n".join(sections))
+        return ToolResult(success=True, content="\n\n".join(sections))
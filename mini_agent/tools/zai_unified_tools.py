@@ -18,6 +18,7 @@ from datetime import datetime
 
 try:
     import aiohttp
+    from ..utils.http_pool import get_http_session
     AIOHTTP_AVAILABLE = True
 except ImportError:
     AIOHTTP_AVAILABLE = False
@@ -146,54 +147,54 @@ class ZAIWebSearchTool(Tool):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/web_search",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/web_search",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    search_results = result.get("search_result", [])
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        search_results = result.get("search_result", [])
+                    # Format results for MiniMax-M2
+                    formatted_results = []
+                    for i, item in enumerate(search_results, 1):
+                        title = item.get("title", "Untitled")
+                        link = item.get("link", "")
+                        content = item.get("content", "")
                         
-                        # Format results for MiniMax-M2
-                        formatted_results = []
-                        for i, item in enumerate(search_results, 1):
-                            title = item.get("title", "Untitled")
-                            link = item.get("link", "")
-                            content = item.get("content", "")
-                            
-                            formatted_results.append(
-                                f"### Result {i}: {title}\n"
-                                f"**Source**: {link}\n"
-                                f"**Content**: {content}\n"
-                            )
-                        
-                        if formatted_results:
-                            output = (
-                                f"## Web Search Results for: {query}\n"
-                                f"**Model**: {self.model} (Lite plan)\n"
-                                f"**Results**: {len(formatted_results)}\n"
-                                f"**Timestamp**: {datetime.now().isoformat()}\n\n"
-                                + "\n".join(formatted_results)
-                            )
-                        else:
-                            output = f"No results found for query: {query}"
-                        
-                        logger.info(f"Z.AI web search completed: {len(search_results)} results for '{query}'")
-                        return ToolResult(success=True, content=output, error=None)
-                        
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Z.AI web search error {response.status}: {error_text}")
-                        return ToolResult(
-                            success=False,
-                            content="",
-                            error=f"Z.AI API error {response.status}: {error_text}"
+                        formatted_results.append(
+                            f"### Result {i}: {title}\n"
+                            f"**Source**: {link}\n"
+                            f"**Content**: {content}\n"
                         )
-                        
+                    
+                    if formatted_results:
+                        output = (
+                            f"## Web Search Results for: {query}\n"
+                            f"**Model**: {self.model} (Lite plan)\n"
+                            f"**Results**: {len(formatted_results)}\n"
+                            f"**Timestamp**: {datetime.now().isoformat()}\n\n"
+                            + "\n".join(formatted_results)
+                        )
+                    else:
+                        output = f"No results found for query: {query}"
+                    
+                    logger.info(f"Z.AI web search completed: {len(search_results)} results for '{query}'")
+                    return ToolResult(success=True, content=output, error=None)
+                    
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Z.AI web search error {response.status}: {error_text}")
+                    return ToolResult(
+                        success=False,
+                        content="",
+                        error=f"Z.AI API error {response.status}: {error_text}"
+                    )
+                    
         except Exception as e:
             logger.exception("Z.AI web search failed")
             return ToolResult(
@@ -303,59 +304,59 @@ class ZAIWebReaderTool(Tool):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/reader",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
+            session = get_http_session(self.base_url)
+            async with session.post(
+                f"{self.base_url}/reader",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
+                    reader_result = result.get("web_page_reader_result", {})
+                    
+                    title = reader_result.get("title", "N/A")
+                    description = reader_result.get("description", "N/A")
+                    content = reader_result.get("content", "")
+                    
+                    # Truncate content to prevent excessive token usage
+                    if len(content) > MAX_TOKENS_PER_CALL * 4:  # Rough char-to-token ratio
+                        content = content[:MAX_TOKENS_PER_CALL * 4] + "\n\n[Content truncated due to length]"
+                    
+                    output = (
+                        f"## Web Page Content: {title}\n"
+                        f"**URL**: {url}\n"
+                        f"**Description**: {description}\n"
+                        f"**Model**: {self.model} (Lite plan)\n"
+                        f"**Format**: {format}\n"
+                        f"**Timestamp**: {datetime.now().isoformat()}\n\n"
+                        f"### Content\n{content}"
+                    )
+                    
+                    logger.info(f"Z.AI web reader completed: {url}")
+                    return ToolResult(success=True, content=output, error=None)
+                    
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Z.AI web reader error {response.status}: {error_text}")
+                    
+                    # Fallback: use web search to get information about the URL
+                    if response.status in [400, 401, 403]:
+                        logger.info(f"Attempting web search fallback for URL: {url}")
+                        search_tool = ZAIWebSearchTool(self.api_key)
+                        if search_tool.available:
+                            return await search_tool.execute(
+                                query=f"content from {url}",
+                                max_results=3
+                            )
+                    
+                    return ToolResult(
+                        success=False,
+                        content="",
+                        error=f"Z.AI reader API error {response.status}: {error_text}"
+                    )
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        reader_result = result.get("web_page_reader_result", {})
-                        
-                        title = reader_result.get("title", "N/A")
-                        description = reader_result.get("description", "N/A")
-                        content = reader_result.get("content", "")
-                        
-                        # Truncate content to prevent excessive token usage
-                        if len(content) > MAX_TOKENS_PER_CALL * 4:  # Rough char-to-token ratio
-                            content = content[:MAX_TOKENS_PER_CALL * 4] + "\n\n[Content truncated due to length]"
-                        
-                        output = (
-                            f"## Web Page Content: {title}\n"
-                            f"**URL**: {url}\n"
-                            f"**Description**: {description}\n"
-                            f"**Model**: {self.model} (Lite plan)\n"
-                            f"**Format**: {format}\n"
-                            f"**Timestamp**: {datetime.now().isoformat()}\n\n"
-                            f"### Content\n{content}"
-                        )
-                        
-                        logger.info(f"Z.AI web reader completed: {url}")
-                        return ToolResult(success=True, content=output, error=None)
-                        
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Z.AI web reader error {response.status}: {error_text}")
-                        
-                        # Fallback: use web search to get information about the URL
-                        if response.status in [400, 401, 403]:
-                            logger.info(f"Attempting web search fallback for URL: {url}")
-                            search_tool = ZAIWebSearchTool(self.api_key)
-                            if search_tool.available:
-                                return await search_tool.execute(
-                                    query=f"content from {url}",
-                                    max_results=3
-                                )
-                        
-                        return ToolResult(
-                            success=False,
-                            content="",
-                            error=f"Z.AI reader API error {response.status}: {error_text}"
-                        )
-                        
         except Exception as e:
             logger.exception("Z.AI web reader failed")
             return ToolResult(
@@ -0,0 +1,106 @@
+"""Shared aiohttp sessions for HTTP APIs called on every step
+
+Opening an `aiohttp.ClientSession` per request means a TCP and TLS handshake per
+request. The pool keeps one session per origin (scheme, host and port), so requests
+to the same API reuse keep-alive connections. Each session has its own connector,
+with DNS caching and a per-host connection limit.
+
+Sessions belong to the event loop they were created on. A session created on a loop
+that has since been closed is replaced. Call `close_http_sessions()` before the loop
+shuts down.
+"""
+
+import asyncio
+import logging
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPSessionPool:
+    """One keep-alive aiohttp session per origin and event loop"""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30.0,
+    ):
+        """Initialize session pool.
+
+        Args:
+            limit: Maximum open connections per session
+            limit_per_host: Maximum open connections per host
+            ttl_dns_cache: Seconds to cache DNS lookups
+            keepalive_timeout: Seconds to keep an idle connection open
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        # (origin, loop) -> session
+        self._sessions: dict[tuple[str, asyncio.AbstractEventLoop], aiohttp.ClientSession] = {}
+
+    @staticmethod
+    def origin(url: str) -> str:
+        """Scheme, host and port of a URL"""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def get(self, url: str) -> aiohttp.ClientSession:
+        """Get the session for a URL's origin, creating it on first use
+
+        Must be called from a running event loop. The session is shared: use it for
+        requests, but do not close it or use it as a context manager.
+        """
+        loop = asyncio.get_running_loop()
+        key = (self.origin(url), loop)
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            self._drop_stale()
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[key] = session
+        return session
+
+    def _drop_stale(self):
+        """Forget sessions that were closed or whose event loop is gone"""
+        for key, session in list(self._sessions.items()):
+            if session.closed or key[1].is_closed():
+                del self._sessions[key]
+
+    async def close(self):
+        """Close all sessions of the running event loop"""
+        loop = asyncio.get_running_loop()
+        for key, session in list(self._sessions.items()):
+            if key[1] is loop:
+                del self._sessions[key]
+                try:
+                    await session.close()
+                except Exception as e:
+                    logger.debug("Error closing HTTP session for %s: %s", key[0], e)
+        self._drop_stale()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_pool = HTTPSessionPool()
+
+
+def get_http_session(url: str) -> aiohttp.ClientSession:
+    """Shared session for the origin of `url` (see HTTPSessionPool.get)"""
+    return _pool.get(url)
+
+
+async def close_http_sessions():
+    """Close the shared sessions; call before the event loop shuts down"""
+    await _pool.close()
@@ -0,0 +1,90 @@
+"""Stub LLMs, tools and an agent factory shared by the agent tests."""
+
+from mini_agent.agent import Agent
+from mini_agent.events import EventSink, NullSink
+from mini_agent.schema import FunctionCall, LLMResponse, ToolCall
+from mini_agent.tools.base import Tool, ToolResult
+
+
+def tool_call(call_id, name, arguments) -> ToolCall:
+    return ToolCall(id=call_id, type="function", function=FunctionCall(name=name, arguments=arguments))
+
+
+class ScriptedLLM:
+    """LLM stub that plays a script, one step per call, then answers "done".
+
+    A step is a (tool name, arguments) pair, issued as a single tool call, or a complete
+    LLMResponse.
+    """
+
+    def __init__(self, script, thinking=None, usage=None):
+        self.script = list(script)
+        self.thinking = thinking
+        self.usage = usage  # Reported with the final answer
+        self.step = 0
+        self.calls = 0
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.calls += 1
+        if self.step >= len(self.script):
+            return LLMResponse(content="done", finish_reason="stop", usage=self.usage)
+        step = self.script[self.step]
+        self.step += 1
+        if isinstance(step, LLMResponse):
+            return step
+        name, arguments = step
+        return LLMResponse(content="", thinking=self.thinking, tool_calls=[tool_call(f"call-{self.step}", name, arguments)], finish_reason="tool_use")
+
+
+class EchoLLM:
+    """LLM stub that calls echo once per user message, then answers."""
+
+    def __init__(self, loop_forever: bool = False):
+        self.calls = 0
+        self.loop_forever = loop_forever
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.calls += 1
+        if messages[-1].role == "user" or self.loop_forever:
+            return LLMResponse(content="", thinking="use echo", tool_calls=[tool_call(f"call-{self.calls}", "echo", {"text": "ping"})], finish_reason="tool_use")
+        return LLMResponse(content="done", finish_reason="stop")
+
+
+class EchoTool(Tool):
+    def __init__(self):
+        self.executions = 0
+
+    @property
+    def name(self):
+        return "echo"
+
+    @property
+    def description(self):
+        return "Echo helper"
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    async def execute(self, text: str):
+        self.executions += 1
+        return ToolResult(success=True, content=f"tool:{text}")
+
+
+class RecordingSink(EventSink):
+    """Sink that keeps every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event):
+        self.events.append(event)
+
+
+def make_agent(tmp_path, llm, tools=(), message="go", **kwargs) -> Agent:
+    """Agent in tmp_path with a "system" prompt and no output, given one user message (None: none)"""
+    kwargs.setdefault("event_sink", NullSink())
+    agent = Agent(llm_client=llm, system_prompt="system", tools=list(tools), workspace_dir=str(tmp_path), **kwargs)
+    if message is not None:
+        agent.add_user_message(message)
+    return agent
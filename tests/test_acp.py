@@ -4,8 +4,10 @@ from types import SimpleNamespace
 
 import pytest
 
-from mini_agent.acp import MiniMaxACPAgent
-from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+import mini_agent.acp as acp_module
+from mini_agent.acp import MiniMaxACPAgent, run_acp_server
+from mini_agent.config import AgentConfig, Config, LLMConfig, RateLimitConfig, ResponseCacheConfig, ToolsConfig
+from mini_agent.llm import CachingClient, RateLimitedClient
 from mini_agent.schema import FunctionCall, LLMResponse, ToolCall
 from mini_agent.tools.base import Tool, ToolResult
 
@@ -77,8 +79,10 @@ async def test_acp_turn_executes_tool(acp_agent):
     response = await agent.prompt(prompt)
     assert response.stopReason == "end_turn"
     assert any("tool:ping" in str(update) for update in conn.updates)
+    # A cancel while idle does not carry over into the next prompt
     await agent.cancel(SimpleNamespace(sessionId=session.sessionId))
-    assert agent._sessions[session.sessionId].cancelled
+    response = await agent.prompt(prompt)
+    assert response.stopReason == "end_turn"
 
 
 @pytest.mark.asyncio
@@ -87,3 +91,39 @@ async def test_acp_invalid_session(acp_agent):
     prompt = SimpleNamespace(sessionId="missing", prompt=[{"text": "?"}])
     response = await agent.prompt(prompt)
     assert response.stopReason == "refusal"
+
+
+@pytest.mark.asyncio
+async def test_acp_server_uses_configured_client(tmp_path, monkeypatch, capsys):
+    """The server builds its client like the CLI: rate limited and cached, without writing to stdout."""
+    config = Config(
+        llm=LLMConfig(
+            api_key="test-key",
+            rate_limit=RateLimitConfig(requests=10),
+            response_cache=ResponseCacheConfig(enabled=True, path=str(tmp_path / "cache.sqlite")),
+        ),
+        agent=AgentConfig(workspace_dir=str(tmp_path), system_prompt_path=str(tmp_path / "missing.md")),
+        tools=ToolsConfig(enable_bash=False, enable_skills=False, enable_mcp=False),
+    )
+    served = {}
+
+    class Started(Exception):
+        pass
+
+    async def fake_stdio_streams():
+        return None, None
+
+    def fake_connection(factory, writer, reader):
+        served["agent"] = factory(DummyConn())
+        raise Started
+
+    monkeypatch.setattr(acp_module, "stdio_streams", fake_stdio_streams)
+    monkeypatch.setattr(acp_module, "AgentSideConnection", fake_connection)
+    capsys.readouterr()
+
+    with pytest.raises(Started):
+        await run_acp_server(config)
+
+    llm = served["agent"]._llm
+    assert isinstance(llm, CachingClient) and isinstance(llm.client, RateLimitedClient)
+    assert "LLM" not in capsys.readouterr().out
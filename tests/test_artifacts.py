@@ -0,0 +1,103 @@
+"""Test cases for the artifact store and read_artifact tool."""
+
+import pytest
+
+from mini_agent.agent import Agent
+from mini_agent.events import NullSink
+from mini_agent.schema import FunctionCall, ToolCall
+from mini_agent.tools.artifact_tool import ArtifactStore, ReadArtifactTool
+from mini_agent.tools.base import ToolResult
+
+
+def test_store_is_content_addressed(tmp_path):
+    """Identical content maps to one artifact file."""
+    store = ArtifactStore(tmp_path / ".artifacts")
+
+    first = store.put("hello world")
+    second = store.put("hello world")
+
+    assert first == second
+    assert store.get(first) == "hello world"
+    assert len(list((tmp_path / ".artifacts").iterdir())) == 1
+    assert store.put("other") != first
+
+
+@pytest.mark.asyncio
+async def test_read_artifact_pages_by_offset(tmp_path):
+    """read_artifact returns bounded pages and points at the next offset."""
+    store = ArtifactStore(tmp_path)
+    artifact_id = store.put("abcdefghij")
+    tool = ReadArtifactTool(store, max_chars=4)
+
+    page = await tool.execute(artifact_id=artifact_id, offset=0)
+    assert page.content.startswith("abcd")
+    assert "offset=4" in page.content
+
+    last = await tool.execute(artifact_id=artifact_id, offset=8, limit=100)
+    assert last.content.startswith("ij")
+    assert "end of artifact" in last.content
+
+    missing = await tool.execute(artifact_id="../../etc/passwd")
+    assert not missing.success
+
+
+@pytest.mark.asyncio
+async def test_agent_keeps_preview_in_history(tmp_path):
+    """Large tool results are stored out of band; history keeps a preview and handle."""
+    agent = Agent(
+        llm_client=None,
+        system_prompt="system",
+        tools=[],
+        workspace_dir=str(tmp_path),
+        event_sink=NullSink(),
+        artifact_threshold=1000,
+    )
+    assert "read_artifact" in agent.tools
+
+    output = "HEAD" + "x" * 50000 + "TAIL"
+    tool_call = ToolCall(id="1", type="function", function=FunctionCall(name="bash", arguments={}))
+    await agent._record_tool_result(tool_call, ToolResult(success=True, content=output))
+
+    history_content = agent.messages[-1].content
+    assert len(history_content) < 3000
+    assert history_content.startswith("HEAD") and history_content.endswith("TAIL")
+    artifact_id = agent.artifact_store.put(output)
+    assert artifact_id in history_content
+    page = await agent.tools["read_artifact"].execute(artifact_id=artifact_id, offset=4, limit=10)
+    assert page.content.startswith("x" * 10)
+
+    small_call = ToolCall(id="2", type="function", function=FunctionCall(name="bash", arguments={}))
+    await agent._record_tool_result(small_call, ToolResult(success=True, content="short"))
+    assert agent.messages[-1].content == "short"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [300, 200])
+async def test_preview_is_smaller_than_a_small_threshold(tmp_path, threshold):
+    """The history entry, handle included, stays within the threshold."""
+    agent = Agent(
+        llm_client=None,
+        system_prompt="system",
+        tools=[],
+        workspace_dir=str(tmp_path),
+        event_sink=NullSink(),
+        artifact_threshold=threshold,
+    )
+    output = "HEAD" + "x" * 400 + "TAIL"
+    tool_call = ToolCall(id="1", type="function", function=FunctionCall(name="bash", arguments={}))
+    await agent._record_tool_result(tool_call, ToolResult(success=True, content=output))
+
+    history_content = agent.messages[-1].content
+    assert len(history_content) <= threshold
+    assert history_content.startswith("HEAD") and history_content.endswith("TAIL")
+
+
+def test_preview_never_grows_the_content(tmp_path):
+    """Content that fits, or is shorter than the handle, is kept; otherwise only the handle remains."""
+    store = ArtifactStore(tmp_path, preview_chars=100)
+    artifact_id = "0" * 16
+
+    assert store.preview("short", artifact_id) == "short"
+    assert store.preview("x" * 150, artifact_id) == "x" * 150
+    handle_only = store.preview("x" * 5000, artifact_id)
+    assert artifact_id in handle_only and "x" not in handle_only
@@ -0,0 +1,134 @@
+"""Test cases for the batch task runner."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from mini_agent.batch import BatchRunner, BatchTask, load_tasks, summarize_results
+from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+from mini_agent.schema import FunctionCall, LLMResponse, ToolCall
+
+
+class SlowLLM:
+    """Shared LLM stub: writes a file named after the task, then answers; each call takes 0.1s."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, messages, tools=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.1)
+        self.active -= 1
+        prompt = next(m.content for m in messages if m.role == "user")
+        if messages[-1].role == "user":
+            args = {"path": "out.txt", "content": prompt}
+            tool_call = ToolCall(id="w1", type="function", function=FunctionCall(name="write_file", arguments=args))
+            return LLMResponse(content="", tool_calls=[tool_call], finish_reason="tool_use")
+        return LLMResponse(content=f"done: {prompt}", finish_reason="stop")
+
+
+def make_config(tmp_path) -> Config:
+    return Config(
+        llm=LLMConfig(api_key="test-key"),
+        agent=AgentConfig(max_steps=5, workspace_dir=str(tmp_path)),
+        tools=ToolsConfig(enable_note=False),
+    )
+
+
+def test_load_tasks_assigns_ids(tmp_path):
+    path = tmp_path / "tasks.jsonl"
+    path.write_text('{"id": "a", "prompt": "first"}\n\n{"prompt": "second", "max_steps": 3}\n', encoding="utf-8")
+
+    tasks = load_tasks(path)
+
+    assert [t.id for t in tasks] == ["a", "task-3"]
+    assert tasks[1].max_steps == 3
+
+
+def test_load_tasks_rejects_invalid_line(tmp_path):
+    path = tmp_path / "tasks.jsonl"
+    path.write_text('{"id": "a"}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 1"):
+        load_tasks(path)
+
+
+@pytest.mark.parametrize("task_id", ["../escape", "a/b", "/tmp/x", "..", ".", ""])
+def test_load_tasks_rejects_ids_that_are_not_file_names(tmp_path, task_id):
+    path = tmp_path / "tasks.jsonl"
+    path.write_text(json.dumps({"id": task_id, "prompt": "p"}) + "\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="not a plain file name"):
+        load_tasks(path)
+
+
+def test_load_tasks_rejects_duplicate_ids(tmp_path):
+    path = tmp_path / "tasks.jsonl"
+    path.write_text('{"id": "a", "prompt": "first"}\n{"id": "a", "prompt": "second"}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 2.*duplicate id 'a'"):
+        load_tasks(path)
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_concurrently_in_isolated_workspaces(tmp_path):
+    """Tasks share one LLM client, run up to the concurrency cap, and write to their own workspace."""
+    llm = SlowLLM()
+    runner = BatchRunner(
+        llm_client=llm,
+        base_tools=[],
+        config=make_config(tmp_path),
+        system_prompt="system",
+        workspace_root=tmp_path / "workspaces",
+        concurrency=3,
+    )
+    tasks = [BatchTask(id=f"t{i}", prompt=f"task {i}") for i in range(6)]
+    output = tmp_path / "results.jsonl"
+
+    start = time.perf_counter()
+    records = await runner.run(tasks, output)
+    elapsed = time.perf_counter() - start
+
+    assert llm.max_active == 3
+    assert elapsed < 1.0  # Sequential would take 6 tasks x 2 calls x 0.1s = 1.2s
+    assert [r["id"] for r in records] == [t.id for t in tasks]
+    assert all(r["stop_reason"] == "end_turn" and r["steps"] == 2 for r in records)
+    for i in range(6):
+        assert (tmp_path / "workspaces" / f"t{i}" / "out.txt").read_text(encoding="utf-8") == f"task {i}"
+
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert sorted(r["id"] for r in lines) == sorted(t.id for t in tasks)
+
+    metrics = summarize_results(records, elapsed)
+    assert metrics["tasks"] == 6 and metrics["stop_reasons"] == {"end_turn": 6}
+
+
+@pytest.mark.asyncio
+async def test_failed_task_does_not_stop_batch(tmp_path):
+    """An exception in one task is recorded and the other tasks still finish."""
+
+    class FlakyLLM(SlowLLM):
+        async def generate(self, messages, tools=None):
+            if "boom" in messages[1].content:
+                raise RuntimeError("provider down")
+            return await super().generate(messages, tools)
+
+    runner = BatchRunner(
+        llm_client=FlakyLLM(),
+        base_tools=[],
+        config=make_config(tmp_path),
+        system_prompt="system",
+        workspace_root=tmp_path / "workspaces",
+        record_events=True,
+    )
+    tasks = [BatchTask(id="ok", prompt="fine"), BatchTask(id="bad", prompt="boom")]
+
+    records = await runner.run(tasks, tmp_path / "results.jsonl")
+
+    assert [r["stop_reason"] for r in records] == ["end_turn", "error"]
+    assert "provider down" in records[1]["result"]
+    assert (tmp_path / "workspaces" / "ok" / "events.jsonl").exists()
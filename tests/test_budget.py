@@ -0,0 +1,128 @@
+"""Test cases for run time and token budgets."""
+
+import asyncio
+
+import pytest
+
+from mini_agent.budget import RunBudget
+from mini_agent.schema import LLMResponse
+from mini_agent.tools.base import Tool, ToolResult
+from tests import helpers
+from tests.helpers import tool_call
+
+
+class LoopingLLM:
+    """LLM stub that always calls a tool, reporting token usage; records max_tokens per call."""
+
+    def __init__(self, delay: float = 0.0, usage=None):
+        self.delay = delay
+        self.usage = usage
+        self.max_tokens = []
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.max_tokens.append(max_tokens)
+        await asyncio.sleep(self.delay)
+        step = len(self.max_tokens)
+        return LLMResponse(
+            content=f"progress {step}",
+            tool_calls=[tool_call(f"call-{step}", "wait", {})],
+            finish_reason="tool_use",
+            usage=self.usage,
+        )
+
+
+class WaitTool(Tool):
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    @property
+    def name(self):
+        return "wait"
+
+    @property
+    def description(self):
+        return "Wait helper"
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {}}
+
+    async def execute(self):
+        await asyncio.sleep(self.delay)
+        return ToolResult(success=True, content="waited")
+
+
+def make_agent(tmp_path, llm, tool_delay=0.0, **kwargs):
+    return helpers.make_agent(tmp_path, llm, [WaitTool(tool_delay)], max_steps=50, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_token_budget_stops_with_partial_result(tmp_path):
+    """Reported usage is charged per step; the run stops before a call it cannot afford."""
+    llm = LoopingLLM(usage={"input_tokens": 1000, "output_tokens": 500, "cache_read_input_tokens": 500})
+    agent = make_agent(tmp_path, llm)
+
+    result = await agent.run(token_budget=4200)
+
+    assert agent.stop_reason == "token_budget"
+    assert len(llm.max_tokens) == 2
+    assert agent.budget.tokens_used == 4000
+    assert "token budget of 4200 tokens exhausted" in result
+    assert result.endswith("Partial result:\nprogress 2")
+    # Output limit shrinks with the remaining budget
+    assert llm.max_tokens[0] is not None and llm.max_tokens[1] < llm.max_tokens[0]
+
+
+@pytest.mark.asyncio
+async def test_unlimited_run_passes_no_max_tokens(tmp_path):
+    """Without budgets the client's own output limit is used, and usage is still tracked."""
+    llm = LoopingLLM(usage={"prompt_tokens": 10, "completion_tokens": 5})
+    agent = make_agent(tmp_path, llm, token_budget=None)
+    agent.max_steps = 3
+
+    await agent.run()
+
+    assert agent.stop_reason == "max_steps"
+    assert llm.max_tokens == [None, None, None]
+    assert agent.budget.tokens_used == 45
+
+
+@pytest.mark.asyncio
+async def test_time_budget_aborts_slow_tool(tmp_path):
+    """A tool call running past the deadline is cancelled and gets an error result."""
+    agent = make_agent(tmp_path, LoopingLLM(), tool_delay=5.0, time_budget=0.2)
+
+    start = asyncio.get_running_loop().time()
+    result = await agent.run()
+
+    assert asyncio.get_running_loop().time() - start < 2.0
+    assert agent.stop_reason == "time_budget"
+    assert "time budget of 0.2s exhausted" in result
+    tool_msg = agent.messages[-1]
+    assert tool_msg.role == "tool" and tool_msg.tool_call_id == "call-1"
+    assert "time budget exhausted" in tool_msg.content
+
+
+@pytest.mark.asyncio
+async def test_time_budget_aborts_slow_llm_call(tmp_path):
+    """An LLM call running past the deadline is cancelled; the run-level argument overrides the default."""
+    agent = make_agent(tmp_path, LoopingLLM(delay=5.0), time_budget=60)
+
+    result = await agent.run(time_budget=0.1)
+
+    assert agent.stop_reason == "time_budget"
+    assert "Partial result" not in result
+    assert agent.messages[-1].role == "user"
+
+
+def test_max_tokens_follows_output_rate():
+    """With a time budget, the output limit is what the observed output rate can produce in time."""
+    budget = RunBudget(time_budget=10.0)
+    assert budget.max_tokens(100) is None  # No rate observed yet
+
+    budget.record(input_tokens=100, output_tokens=1000, duration=10.0)  # 100 tokens/s
+    budget.started -= 5.0  # 5s elapsed (plus the test's own runtime)
+    assert 256 <= budget.max_tokens(100) <= 500
+
+    budget.started -= 10.0
+    assert budget.exhausted(100) == "time_budget"
@@ -0,0 +1,170 @@
+"""Test cases for cooperative cancellation of agent runs."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mini_agent.acp import MiniMaxACPAgent
+from mini_agent.cancellation import CancellationToken
+from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+from mini_agent.events import RunStarted
+from mini_agent.tools.bash_tool import BashTool
+from tests.helpers import RecordingSink, ScriptedLLM, make_agent
+
+
+class HangingLLM:
+    """LLM stub whose call never returns; records whether it was cancelled."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def generate(self, messages, tools=None):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def bash_llm(command: str) -> ScriptedLLM:
+    """LLM stub that runs one bash command, then answers."""
+    return ScriptedLLM([("bash", {"command": command})])
+
+
+def process_alive(pid: int) -> bool:
+    """Whether a process is running (zombies awaiting their reaper count as dead)"""
+    status = Path(f"/proc/{pid}/status")
+    try:
+        return "State:\tZ" not in status.read_text()
+    except FileNotFoundError:
+        return False
+
+
+async def cancel_after(agent, delay: float):
+    await asyncio.sleep(delay)
+    agent.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cancel_aborts_in_flight_llm_call(tmp_path):
+    """Cancelling during an LLM call cancels the call and ends the run right away."""
+    llm = HangingLLM()
+    agent = make_agent(tmp_path, llm)
+
+    started = time.monotonic()
+    canceller = asyncio.create_task(cancel_after(agent, 0.05))
+    result = await agent.run()
+    await canceller
+
+    assert time.monotonic() - started < 1
+    assert result == "Task cancelled."
+    assert agent.stop_reason == "cancelled"
+    assert llm.cancelled
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_run_startup_is_kept(tmp_path):
+    """A cancel arriving once the run has started, before its first LLM call, stops that run."""
+
+    class CancellingSink(RecordingSink):
+        async def emit(self, event):
+            await super().emit(event)
+            if isinstance(event, RunStarted):
+                agent.cancel()
+
+    llm = bash_llm("true")
+    agent = make_agent(tmp_path, llm, event_sink=CancellingSink())
+
+    assert await agent.run() == "Task cancelled."
+    assert llm.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_after_run_does_not_stop_next_run(tmp_path):
+    """A cancel arriving while the agent is idle is not carried over into the next run."""
+    llm = bash_llm("true")
+    agent = make_agent(tmp_path, llm)
+    assert await agent.run() == "done"
+
+    agent.cancel()
+    agent.add_user_message("again")
+    assert await agent.run() == "done"
+    assert agent.stop_reason == "end_turn" and llm.calls == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses /proc and POSIX shell syntax")
+@pytest.mark.asyncio
+async def test_cancel_kills_foreground_bash_command(tmp_path):
+    """Cancelling during a bash call kills the command with its children and records an error result."""
+    agent = make_agent(tmp_path, bash_llm("sleep 30 & echo $! > pid.txt; wait"), tools=[BashTool(workspace_dir=str(tmp_path))])
+    pid_file = tmp_path / "pid.txt"
+
+    async def cancel_once_started():
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.01)
+        agent.cancel()
+
+    started = time.monotonic()
+    canceller = asyncio.create_task(cancel_once_started())
+    await asyncio.wait_for(agent.run(), timeout=10)
+    await canceller
+
+    assert time.monotonic() - started < 5
+    assert agent.stop_reason == "cancelled"
+    tool_msg = agent.messages[-1]
+    assert tool_msg.role == "tool" and "run cancelled" in tool_msg.content
+
+    pid = int(pid_file.read_text())
+    for _ in range(50):
+        if not process_alive(pid):
+            break
+        await asyncio.sleep(0.02)
+    assert not process_alive(pid)
+
+
+@pytest.mark.asyncio
+async def test_acp_cancel_interrupts_prompt(tmp_path):
+    """An ACP cancel notification interrupts the running prompt instead of waiting for the step to end."""
+    config = Config(
+        llm=LLMConfig(api_key="test-key"),
+        agent=AgentConfig(max_steps=5, workspace_dir=str(tmp_path)),
+        tools=ToolsConfig(),
+    )
+
+    class Conn:
+        async def sessionUpdate(self, payload):
+            pass
+
+    llm = HangingLLM()
+    acp_agent = MiniMaxACPAgent(Conn(), config, llm, [], "system")
+    session = await acp_agent.newSession(SimpleNamespace(cwd=None))
+
+    prompt = asyncio.create_task(acp_agent.prompt(SimpleNamespace(sessionId=session.sessionId, prompt=[{"text": "hi"}])))
+    await asyncio.sleep(0.05)
+    await acp_agent.cancel(SimpleNamespace(sessionId=session.sessionId))
+    response = await asyncio.wait_for(prompt, timeout=1)
+
+    assert response.stopReason == "cancelled"
+    assert llm.cancelled
+
+
+@pytest.mark.asyncio
+async def test_token_race_prefers_finished_work():
+    """Work that finishes before the token is checked keeps its result; later cancels interrupt."""
+    token = CancellationToken()
+
+    async def finish_and_cancel():
+        token.cancel()
+        return "result"
+
+    assert await token.race(finish_and_cancel()) == (True, "result")
+
+    # Already cancelled: the work is not started
+    assert await token.race(asyncio.sleep(60)) == (False, None)
+
+    finished, _ = await CancellationToken().race(asyncio.sleep(60), timeout=0.01)
+    assert not finished
@@ -0,0 +1,149 @@
+"""Test cases for deterministic context eviction policies."""
+
+import pytest
+
+from mini_agent.context_policy import (
+    ELIDED_MARKER,
+    ElideOldToolOutputs,
+    KeepLastToolResults,
+    SlidingWindow,
+    TruncateToolOutputs,
+    create_context_policy,
+)
+from mini_agent.events import ContextTrimmed
+from mini_agent.schema import FunctionCall, LLMResponse, Message, ToolCall
+from tests.helpers import RecordingSink, make_agent
+
+
+def count_chars(messages):
+    """Token counter stub: one token per content char"""
+    return sum(len(msg.content) for msg in messages)
+
+
+def tool_round(i, output):
+    call = ToolCall(id=f"call-{i}", type="function", function=FunctionCall(name="read_file", arguments={"path": f"{i}.txt"}))
+    return [
+        Message(role="assistant", content=f"a{i}", tool_calls=[call]),
+        Message(role="tool", content=output, tool_call_id=f"call-{i}", name="read_file"),
+    ]
+
+
+def make_history(outputs):
+    messages = [Message(role="system", content="sys"), Message(role="user", content="task")]
+    for i, output in enumerate(outputs):
+        messages.extend(tool_round(i, output))
+    return messages
+
+
+def test_truncate_keeps_head_and_tail():
+    """Large tool outputs are cut to head and tail; small ones and the input history are untouched."""
+    messages = make_history(["x" * 50 + "y" * 1000 + "z" * 50, "small"])
+    original = messages[3].content
+
+    result = TruncateToolOutputs(max_chars=100).apply(messages, 0, count_chars)
+
+    assert result[3].content.startswith("x" * 50) and result[3].content.endswith("z" * 50)
+    assert "[1000 chars truncated]" in result[3].content
+    assert result[5] is messages[5]
+    assert messages[3].content == original
+
+
+def test_elide_oldest_first_until_within_limit():
+    """Tool outputs are elided oldest first, stopping once history fits, never the last keep_last."""
+    messages = make_history(["a" * 100, "b" * 100, "c" * 100, "d" * 100])
+
+    result = ElideOldToolOutputs(keep_last=1).apply(messages, 350, count_chars)
+
+    tool_contents = [msg.content for msg in result if msg.role == "tool"]
+    assert tool_contents[0].startswith(ELIDED_MARKER) and tool_contents[1].startswith(ELIDED_MARKER)
+    assert tool_contents[2:] == ["c" * 100, "d" * 100]
+    # Every tool result stays paired with its call
+    assert [msg.role for msg in result] == [msg.role for msg in messages]
+
+    everything = ElideOldToolOutputs(keep_last=1).apply(messages, 0, count_chars)
+    assert [msg.content for msg in everything if msg.role == "tool"][-1] == "d" * 100
+
+
+def test_keep_last_tool_results_elides_unconditionally():
+    """All but the last N tool outputs are elided regardless of the limit; elision is idempotent."""
+    messages = make_history(["a", "b", "c"])
+
+    result = KeepLastToolResults(keep_last=1).apply(messages, 10**6, count_chars)
+    again = KeepLastToolResults(keep_last=1).apply(result, 10**6, count_chars)
+
+    assert [msg.content.startswith(ELIDED_MARKER) for msg in result if msg.role == "tool"] == [True, True, False]
+    assert all(a is b for a, b in zip(result, again))
+
+
+def test_sliding_window_keeps_task_and_latest_request():
+    """The window drops the oldest rounds, starting at an assistant or user message."""
+    messages = make_history(["a" * 100, "b" * 100])
+    messages.append(Message(role="user", content="follow-up"))
+    messages.extend(tool_round(2, "c" * 100))
+
+    result = SlidingWindow().apply(messages, 250, count_chars)
+
+    assert [msg.content for msg in result[:2]] == ["sys", "task"]
+    assert result[2].role == "assistant"
+    assert count_chars(result) <= 250
+    assert any(msg.content == "follow-up" for msg in result)
+
+    # Never drops the latest user message, even if history still does not fit
+    tight = SlidingWindow().apply(messages, 0, count_chars)
+    assert [msg.content for msg in tight[:3]] == ["sys", "task", "follow-up"]
+
+
+def test_create_context_policy_from_config():
+    """Policies are created from a name or a dict with arguments; bad specs raise ValueError."""
+    assert isinstance(create_context_policy("sliding_window"), SlidingWindow)
+    policy = create_context_policy({"name": "truncate_tool_outputs", "max_chars": 10})
+    assert isinstance(policy, TruncateToolOutputs) and policy.max_chars == 10
+
+    with pytest.raises(ValueError, match="Unknown context policy"):
+        create_context_policy("compress_everything")
+    with pytest.raises(ValueError, match="Invalid arguments"):
+        create_context_policy({"name": "sliding_window", "size": 3})
+
+
+class BigOutputLLM:
+    """LLM stub that reads a large file twice, then answers; fails on summarization calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages, tools=None):
+        if "summarize" in messages[0].content.lower() or "summary" in messages[-1].content.lower():
+            raise AssertionError("LLM summarization should not run")
+        self.calls += 1
+        if self.calls <= 2:
+            return LLMResponse(content="", tool_calls=tool_round(self.calls, "")[0].tool_calls, finish_reason="tool_use")
+        return LLMResponse(content="done", finish_reason="stop")
+
+
+@pytest.mark.asyncio
+async def test_agent_applies_policies_before_llm_summarization(tmp_path):
+    """Overflowing history is shrunk locally; the LLM is never asked to summarize."""
+    from mini_agent.tools.file_tools import ReadTool
+
+    for i in (1, 2):
+        (tmp_path / f"{i}.txt").write_text(f"line {i} " * 1200)
+    sink = RecordingSink()
+    agent = make_agent(
+        tmp_path,
+        BigOutputLLM(),
+        [ReadTool(str(tmp_path))],
+        message="read both files",
+        token_limit=5000,
+        context_policies=[ElideOldToolOutputs(keep_last=1)],
+        llm_summarization=False,
+        event_sink=sink,
+    )
+
+    assert await agent.run() == "done"
+
+    trimmed = [event for event in sink.events if isinstance(event, ContextTrimmed)]
+    assert len(trimmed) == 1 and trimmed[0].policy == "elide_old_tool_outputs"
+    assert trimmed[0].tokens_after <= 5000 < trimmed[0].tokens_before
+    tool_msgs = [msg for msg in agent.messages if msg.role == "tool"]
+    assert tool_msgs[0].content.startswith(ELIDED_MARKER)
+    assert "line 2" in tool_msgs[1].content
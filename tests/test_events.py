@@ -0,0 +1,120 @@
+"""Test cases for the agent event stream and sinks."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from mini_agent.acp import MiniMaxACPAgent
+from mini_agent.agent import Agent
+from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+from mini_agent.events import JsonlSink, MultiSink, NullSink
+from tests import helpers
+from tests.helpers import EchoLLM, EchoTool, RecordingSink
+
+
+def make_agent(tmp_path, sink, llm=None, max_steps=5) -> Agent:
+    return helpers.make_agent(tmp_path, llm or EchoLLM(), tools=[EchoTool()], message="hi", max_steps=max_steps, event_sink=sink)
+
+
+@pytest.mark.asyncio
+async def test_run_emits_typed_events(tmp_path):
+    """A run emits step, assistant, tool and finish events in order."""
+    sink = RecordingSink()
+    agent = make_agent(tmp_path, sink)
+
+    result = await agent.run()
+
+    assert result == "done"
+    assert agent.stop_reason == "end_turn"
+    assert [event.type for event in sink.events] == [
+        "run_started",
+        "step_started",
+        "assistant_message",
+        "tool_started",
+        "tool_finished",
+        "step_started",
+        "assistant_message",
+        "run_finished",
+    ]
+    assert sink.events[4].result.content == "tool:ping"
+    assert sink.events[-1].stop_reason == "end_turn"
+
+
+@pytest.mark.asyncio
+async def test_null_sink_is_silent(tmp_path, capsys):
+    """Headless runs write nothing to stdout."""
+    agent = make_agent(tmp_path, NullSink())
+
+    await agent.run()
+
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_writes_one_record_per_event(tmp_path):
+    """JSONL sink serializes events, including nested tool calls and results."""
+    path = tmp_path / "events" / "run.jsonl"
+    jsonl = JsonlSink(path)
+    recorder = RecordingSink()
+    agent = make_agent(tmp_path, MultiSink(jsonl, recorder))
+
+    await agent.run()
+    await agent.event_sink.close()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == len(recorder.events)
+    tool_finished = next(r for r in records if r["type"] == "tool_finished")
+    assert tool_finished["tool_call"]["function"]["name"] == "echo"
+    assert tool_finished["result"] == {"success": True, "content": "tool:ping", "error": None}
+    assert all("timestamp" in r for r in records)
+
+
+@pytest.mark.asyncio
+async def test_max_steps_stop_reason(tmp_path):
+    """Running out of steps is reported as max_steps."""
+    sink = RecordingSink()
+    agent = make_agent(tmp_path, sink, llm=EchoLLM(loop_forever=True), max_steps=2)
+
+    await agent.run()
+
+    assert agent.stop_reason == "max_steps"
+    assert sink.events[-1].stop_reason == "max_steps"
+
+
+class CancellingTool(EchoTool):
+    """Echo tool that cancels its agent while executing."""
+
+    agent = None
+
+    async def execute(self, text: str):
+        self.agent.cancel()
+        return await super().execute(text)
+
+
+@pytest.mark.asyncio
+async def test_acp_prompt_reuses_agent_loop_and_cancels(tmp_path):
+    """ACP runs the Agent loop and maps a cancel during a tool call to the cancelled stop reason."""
+    config = Config(
+        llm=LLMConfig(api_key="test-key"),
+        agent=AgentConfig(max_steps=5, workspace_dir=str(tmp_path)),
+        tools=ToolsConfig(),
+    )
+
+    class Conn:
+        def __init__(self):
+            self.updates = []
+
+        async def sessionUpdate(self, payload):
+            self.updates.append(payload)
+
+    tool = CancellingTool()
+    conn = Conn()
+    acp_agent = MiniMaxACPAgent(conn, config, EchoLLM(loop_forever=True), [tool], "system")
+    session = await acp_agent.newSession(SimpleNamespace(cwd=None))
+    tool.agent = acp_agent._sessions[session.sessionId].agent
+
+    response = await acp_agent.prompt(SimpleNamespace(sessionId=session.sessionId, prompt=[{"text": "hi"}]))
+
+    assert response.stopReason == "cancelled"
+    assert any("tool:ping" in str(update) for update in conn.updates)
@@ -0,0 +1,114 @@
+"""Test cases for compact message history and agent parking."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from mini_agent.acp import MiniMaxACPAgent
+from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+from mini_agent.history import CompactHistory, MessageRecord
+from mini_agent.journal import SessionJournal
+from mini_agent.schema import FunctionCall, Message, ToolCall
+from tests import helpers
+from tests.helpers import EchoLLM, EchoTool
+
+
+def make_agent(tmp_path, journal=None):
+    return helpers.make_agent(tmp_path, EchoLLM(), [EchoTool()], message=None, journal=journal)
+
+
+def test_records_round_trip():
+    """Records rebuild equal messages, share content and intern the small strings."""
+    content = "x" * 1000
+    messages = [
+        Message(role="user", content=[{"type": "text", "text": "hi"}]),
+        Message(
+            role="assistant",
+            content="",
+            thinking="plan",
+            tool_calls=[ToolCall(id="call-1", type="function", function=FunctionCall(name="echo", arguments={"text": "a"}))],
+        ),
+        Message(role="tool", content=content, tool_call_id="call-1", name="echo"),
+    ]
+    history = CompactHistory.from_messages(messages, [3, 5, 250])
+
+    assert [msg.model_dump() for msg in history.to_messages()] == [msg.model_dump() for msg in messages]
+    assert history[2].content is content
+    assert history[2].tokens == 250
+    assert history[2].tool_call_id is history[1].tool_calls[0][0]
+    assert isinstance(history[:2], CompactHistory) and len(history[:2]) == 2
+
+    extended = history.extend([Message(role="assistant", content="done")])
+    assert len(history) == 3 and len(extended) == 4
+    assert extended[0] is history[0]
+    with pytest.raises(AttributeError):
+        history[0].content = "changed"
+    assert not hasattr(MessageRecord.from_message(messages[0]), "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_park_and_resume_run(tmp_path):
+    """A parked agent restores its history on access, with token counts and no re-encoding."""
+    agent = make_agent(tmp_path)
+    agent.add_user_message("first")
+    await agent.run()
+    history = [msg.model_dump() for msg in agent.messages]
+    tokens = agent._estimate_tokens()
+
+    snapshot = agent.park()
+    assert agent.parked and len(snapshot) == len(history)
+    assert agent._messages == [] and agent.token_ledger.total == 0
+    assert agent.park() is snapshot
+
+    agent.token_ledger._encode_message = staticmethod(lambda msg: pytest.fail("re-encoded a restored message"))
+    assert [msg.model_dump() for msg in agent.messages] == history
+    assert not agent.parked
+    assert agent._estimate_tokens() == tokens
+
+    del agent.token_ledger._encode_message
+    agent.park()
+    agent.add_user_message("second")
+    await agent.run()
+    assert [msg.model_dump() for msg in agent.messages[: len(history)]] == history
+    assert len(agent.messages) == len(history) + 4 and agent.messages[-1].content == "done"
+
+
+@pytest.mark.asyncio
+async def test_parked_agent_keeps_appending_to_journal(tmp_path):
+    """Restoring a parked history does not rewrite the journal."""
+    journal = SessionJournal("parked", journal_dir=tmp_path / "sessions")
+    agent = make_agent(tmp_path, journal)
+    agent.add_user_message("first")
+    await agent.run()
+    agent.park()
+    agent.add_user_message("second")
+    await agent.run()
+    journal.close()
+
+    ops = [json.loads(line)["op"] for line in journal.path.read_text().splitlines()]
+    assert "reset" not in ops
+    assert [msg.content for msg in SessionJournal.load(journal.path)] == [msg.content for msg in agent.messages]
+
+
+@pytest.mark.asyncio
+async def test_acp_parks_idle_sessions(tmp_path):
+    """ACP sessions are parked between prompts and carry their history into the next one."""
+
+    class Conn:
+        async def sessionUpdate(self, payload):
+            pass
+
+    config = Config(llm=LLMConfig(api_key="test-key"), agent=AgentConfig(max_steps=5, workspace_dir=str(tmp_path)), tools=ToolsConfig())
+    server = MiniMaxACPAgent(Conn(), config, EchoLLM(), [EchoTool()], "system")
+    session = await server.newSession(SimpleNamespace(cwd=None))
+    agent = server._sessions[session.sessionId].agent
+
+    await server.prompt(SimpleNamespace(sessionId=session.sessionId, prompt=[{"text": "hello"}]))
+    assert agent.parked
+    await server.prompt(SimpleNamespace(sessionId=session.sessionId, prompt=[{"text": "again"}]))
+    assert agent.parked
+
+    contents = [msg.content for msg in agent.messages]
+    assert contents.count("hello") == 1 and contents.count("again") == 1
+    assert contents.index("hello") < contents.index("again")
@@ -0,0 +1,55 @@
+"""Test cases for the shared HTTP session pool."""
+
+import asyncio
+
+import pytest
+
+from mini_agent.llm.coding_plan_zai_client import CodingPlanZAIClient
+from mini_agent.mock_server import MockLLMServer, MockReply
+from mini_agent.utils.http_pool import HTTPSessionPool, close_http_sessions
+
+
+@pytest.mark.asyncio
+async def test_one_session_per_origin():
+    """Sessions are keyed by origin and replaced once closed."""
+    pool = HTTPSessionPool()
+    session = pool.get("https://api.z.ai/api/coding/paas/v4")
+
+    assert pool.get("https://API.z.ai/api/paas/v4/reader") is session
+    assert pool.get("https://api.z.ai:8443/v4") is not session
+    assert len(pool) == 2
+
+    await pool.close()
+    assert session.closed and len(pool) == 0
+    assert not pool.get("https://api.z.ai/v4").closed
+    await pool.close()
+
+
+def test_sessions_of_closed_loops_are_replaced():
+    """A session created on a finished event loop is not reused by a new one."""
+    pool = HTTPSessionPool()
+
+    async def get():
+        return pool.get("https://api.z.ai/v4")
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert second is not first
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_zai_calls_reuse_connections():
+    """Sequential Z.AI client calls share one keep-alive connection."""
+    async with MockLLMServer([MockReply(text="pong")]) as server:
+        client = CodingPlanZAIClient(api_key="test")
+        client.base_url = f"{server.url}/v1"
+
+        for _ in range(3):
+            result = await client.chat_completion([{"role": "user", "content": "ping"}])
+            assert result["success"], result
+
+        assert server.stats.requests == 3
+        assert server.stats.connections == 1
+        await close_http_sessions()
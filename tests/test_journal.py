@@ -0,0 +1,133 @@
+"""Test cases for the session journal and resume."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from acp import RequestError
+
+from mini_agent.acp import MiniMaxACPAgent
+from mini_agent.agent import Agent
+from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+from mini_agent.events import NullSink
+from mini_agent.journal import SessionJournal
+from mini_agent.schema import Message
+from tests.helpers import EchoLLM, EchoTool, make_agent
+
+
+def test_sync_appends_then_resets(tmp_path):
+    """Appends are journaled incrementally; replaced history becomes one reset record."""
+    journal = SessionJournal("s1", journal_dir=tmp_path)
+    messages = [Message(role="system", content="system"), Message(role="user", content="hi")]
+    journal.sync(messages)
+    messages.append(Message(role="assistant", content="hello"))
+    journal.sync(messages)
+    journal.sync(messages)  # No changes, nothing written
+
+    ops = [json.loads(line)["op"] for line in journal.path.read_text().splitlines()]
+    assert ops == ["session", "append", "append", "append"]
+
+    compacted = [messages[0], Message(role="user", content="summary")]
+    journal.sync(compacted)
+    journal.close()
+
+    assert [m.content for m in SessionJournal.load(journal.path)] == ["system", "summary"]
+
+
+def test_torn_last_record_is_ignored(tmp_path):
+    """A crash mid-write loses only the incomplete record, and appending continues cleanly."""
+    journal = SessionJournal("s2", journal_dir=tmp_path)
+    messages = [Message(role="system", content="system"), Message(role="user", content="hi")]
+    journal.sync(messages)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"op": "append", "message": {"role": "assist')
+
+    reopened = SessionJournal.open("s2", journal_dir=tmp_path)
+    assert [m.content for m in reopened.messages] == ["system", "hi"]
+
+    reopened.sync(reopened.messages + [Message(role="assistant", content="after crash")])
+    reopened.close()
+    assert [m.content for m in SessionJournal.load(reopened.path)] == ["system", "hi", "after crash"]
+
+
+@pytest.mark.asyncio
+async def test_agent_resume_rebuilds_history_without_rerunning(tmp_path):
+    """Resuming restores history from the journal; no LLM or tool calls are replayed."""
+    llm, tool = EchoLLM(), EchoTool()
+    journal = SessionJournal("run", journal_dir=tmp_path / "sessions")
+    agent = make_agent(tmp_path, llm, [tool], message="first task", journal=journal)
+    await agent.run()
+    history = [m.model_dump() for m in agent.messages]
+
+    resumed_llm, resumed_tool = EchoLLM(), EchoTool()
+    resumed = Agent.resume(
+        "run",
+        llm_client=resumed_llm,
+        tools=[resumed_tool],
+        journal_dir=tmp_path / "sessions",
+        workspace_dir=str(tmp_path),
+        event_sink=NullSink(),
+    )
+
+    assert [m.model_dump() for m in resumed.messages] == history
+    assert resumed_llm.calls == 0 and resumed_tool.executions == 0
+
+    resumed.add_user_message("second task")
+    await resumed.run()
+    reloaded = SessionJournal.load(tmp_path / "sessions" / "run.jsonl")
+    assert [m.content for m in reloaded] == [m.content for m in resumed.messages]
+    assert "first task" in [m.content for m in reloaded] and reloaded[-1].content == "done"
+    assert resumed_llm.calls == 2 and resumed_tool.executions == 1
+
+
+def test_resume_unknown_session(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Agent.resume("missing", llm_client=None, tools=[], journal_dir=tmp_path)
+
+
+@pytest.mark.parametrize("session_id", ["../run", "sessions/run", "/tmp/run", ".."])
+def test_session_id_must_be_a_file_name(tmp_path, session_id):
+    with pytest.raises(ValueError, match="Invalid session id"):
+        SessionJournal(session_id, journal_dir=tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_acp_load_session_after_restart(tmp_path):
+    """A new ACP server instance can load a session journaled by a previous one."""
+
+    class Conn:
+        async def sessionUpdate(self, payload):
+            pass
+
+    config = Config(
+        llm=LLMConfig(api_key="test-key"),
+        agent=AgentConfig(max_steps=5, workspace_dir=str(tmp_path), enable_journal=True, journal_dir=str(tmp_path / "sessions")),
+        tools=ToolsConfig(),
+    )
+    first = MiniMaxACPAgent(Conn(), config, EchoLLM(), [EchoTool()], "system")
+    session = await first.newSession(SimpleNamespace(cwd=None))
+    await first.prompt(SimpleNamespace(sessionId=session.sessionId, prompt=[{"text": "hello"}]))
+    history = [m.content for m in first._sessions[session.sessionId].agent.messages]
+
+    second = MiniMaxACPAgent(Conn(), config, EchoLLM(), [EchoTool()], "system")
+    await second.loadSession(SimpleNamespace(sessionId=session.sessionId, cwd=None))
+
+    assert [m.content for m in second._sessions[session.sessionId].agent.messages] == history
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("session_id", ["missing", "../run", "/etc/passwd"])
+async def test_acp_load_unknown_session(tmp_path, session_id):
+    """Unknown session ids, and ids that are not journal file names, are reported as not found."""
+    (tmp_path / "run.jsonl").write_text("")  # Would be reached by "../run" without the check
+    config = Config(
+        llm=LLMConfig(api_key="test-key"),
+        agent=AgentConfig(workspace_dir=str(tmp_path), enable_journal=True, journal_dir=str(tmp_path / "sessions")),
+        tools=ToolsConfig(),
+    )
+    acp_agent = MiniMaxACPAgent(None, config, EchoLLM(), [], "system")
+
+    with pytest.raises(RequestError, match="Invalid params") as error:
+        await acp_agent.loadSession(SimpleNamespace(sessionId=session_id, cwd=None))
+    assert error.value.data["message"] == "Session not found"
@@ -0,0 +1,111 @@
+"""Test cases for the mock LLM server."""
+
+import asyncio
+
+import pytest
+
+from mini_agent.llm import LLMClient
+from mini_agent.mock_server import MockLLMServer, MockReply
+from mini_agent.retry import RetryConfig
+from mini_agent.schema import LLMProvider, Message
+
+SCRIPT = [
+    MockReply(thinking="Look first", text="Checking", tool_calls=[{"name": "read_file", "arguments": {"path": "a.txt"}}]),
+    MockReply(text="All done"),
+]
+
+TOOLS = [{"name": "read_file", "description": "Read a file", "input_schema": {"type": "object", "properties": {"path": {"type": "string"}}}}]
+
+
+def make_client(url: str, provider: LLMProvider, retries: int = 0) -> LLMClient:
+    return LLMClient(
+        api_key="test",
+        provider=provider,
+        api_base=url,
+        model="mock-model",
+        retry_config=RetryConfig(enabled=retries > 0, max_retries=retries, initial_delay=0.001),
+    )
+
+
+def follow_up(response) -> list[Message]:
+    return [
+        Message(role="user", content="read a.txt"),
+        Message(role="assistant", content=response.content, thinking=response.thinking, tool_calls=response.tool_calls),
+        Message(role="tool", content="alpha", tool_call_id=response.tool_calls[0].id, name="read_file"),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", [LLMProvider.ANTHROPIC, LLMProvider.OPENAI])
+async def test_scripted_tool_use_round_trip(provider):
+    """Both API surfaces return the scripted tool call, then the next turn's reply."""
+    async with MockLLMServer(script=SCRIPT) as server:
+        client = make_client(server.url, provider)
+
+        first = await client.generate([Message(role="user", content="read a.txt")], tools=TOOLS)
+        assert first.content == "Checking"
+        assert first.tool_calls[0].function.name == "read_file"
+        assert first.tool_calls[0].function.arguments == {"path": "a.txt"}
+
+        second = await client.generate(follow_up(first), tools=TOOLS)
+        assert second.content == "All done" and not second.tool_calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", [LLMProvider.ANTHROPIC, LLMProvider.OPENAI])
+async def test_streaming(provider):
+    """Streamed replies deliver thinking, text and tool call deltas."""
+    async with MockLLMServer(script=SCRIPT) as server:
+        client = make_client(server.url, provider)
+
+        chunks = [chunk async for chunk in client.generate_stream([Message(role="user", content="hi")], tools=TOOLS)]
+
+    response = chunks[-1].response
+    assert {chunk.type for chunk in chunks} >= {"thinking", "text", "tool_call_delta", "done"}
+    assert response.thinking == "Look first"
+    assert response.tool_calls[0].function.arguments == {"path": "a.txt"}
+    assert server.stats.streamed == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", [LLMProvider.ANTHROPIC, LLMProvider.OPENAI])
+async def test_responses_report_usage(provider):
+    """Token usage reaches LLMResponse.usage, streamed or not."""
+    async with MockLLMServer(script=[MockReply(text="One"), MockReply(text="Two")]) as server:
+        client = make_client(server.url, provider)
+        response = await client.generate([Message(role="user", content="hi")])
+        chunks = [chunk async for chunk in client.generate_stream([Message(role="user", content="hi")])]
+
+    input_key, output_key = ("input_tokens", "output_tokens") if provider == LLMProvider.ANTHROPIC else ("prompt_tokens", "completion_tokens")
+    for usage in (response.usage, chunks[-1].response.usage):
+        assert usage[input_key] > 0 and usage[output_key] > 0
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_and_retries():
+    """Injected errors reach the client; with retries, a flaky server eventually answers."""
+    async with MockLLMServer(error_rate=1.0, error_statuses=(500,)) as server:
+        client = make_client(server.url, LLMProvider.ANTHROPIC)
+        client._client.client = client._client.client.with_options(max_retries=0)
+        with pytest.raises(Exception, match="Injected mock error"):
+            await client.generate([Message(role="user", content="hi")])
+        assert server.stats.errors == 1
+
+    async with MockLLMServer(error_rate=0.5, error_statuses=(500,), seed=1) as server:
+        client = make_client(server.url, LLMProvider.OPENAI, retries=10)
+        client._client.client = client._client.client.with_options(max_retries=0)
+        responses = await asyncio.gather(*(client.generate([Message(role="user", content="hi")]) for _ in range(5)))
+        assert all(response.content == "OK" for response in responses)
+        assert server.stats.errors > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_stats():
+    """Latency keeps requests in flight together; stats count requests, peak concurrency and connections."""
+    async with MockLLMServer(latency=0.05) as server:
+        client = make_client(server.url, LLMProvider.ANTHROPIC)
+        await asyncio.gather(*(client.generate([Message(role="user", content="hi")]) for _ in range(20)))
+
+    assert server.stats.requests == 20
+    assert server.stats.peak_active > 1
+    assert 1 <= server.stats.connections <= 20
@@ -0,0 +1,122 @@
+"""Test cases for parallel tool dispatch in Agent."""
+
+import asyncio
+import time
+
+import pytest
+
+from mini_agent.agent import Agent
+from mini_agent.schema import LLMResponse, ToolCall
+from mini_agent.tools.base import Tool, ToolResult
+from tests import helpers
+from tests.helpers import ScriptedLLM, tool_call
+
+
+class SleepTool(Tool):
+    """Tool that sleeps and records execution order."""
+
+    def __init__(self, name: str, delay: float, parallel_safe: bool, log: list):
+        self._name = name
+        self._delay = delay
+        self._parallel_safe = parallel_safe
+        self._log = log
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def description(self):
+        return "Sleep helper"
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {"label": {"type": "string"}}}
+
+    @property
+    def parallel_safe(self):
+        return self._parallel_safe
+
+    async def execute(self, label: str):
+        self._log.append(f"start:{label}")
+        await asyncio.sleep(self._delay)
+        self._log.append(f"end:{label}")
+        return ToolResult(success=True, content=f"{self._name}:{label}")
+
+
+def make_call(call_id: str, name: str, label: str) -> ToolCall:
+    return tool_call(call_id, name, {"label": label})
+
+
+def make_agent(tmp_path, tool_calls, tools, **kwargs) -> Agent:
+    llm = ScriptedLLM([LLMResponse(content="", tool_calls=tool_calls, finish_reason="tool_use")])
+    return helpers.make_agent(tmp_path, llm, tools, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_parallel_safe_calls_run_concurrently_in_order(tmp_path):
+    """Parallel-safe calls overlap, and tool messages keep the original call order."""
+    log = []
+    tools = [SleepTool("read", 0.2, True, log)]
+    calls = [make_call(f"c{i}", "read", str(i)) for i in range(4)]
+    agent = make_agent(tmp_path, calls, tools, parallel_tool_calls=True, max_parallel_tools=4)
+
+    start = time.perf_counter()
+    result = await agent.run()
+    elapsed = time.perf_counter() - start
+
+    assert result == "done"
+    assert elapsed < 0.6  # Sequential execution would take ~0.8s
+    tool_msgs = [m for m in agent.messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_msgs] == ["c0", "c1", "c2", "c3"]
+    assert [m.content for m in tool_msgs] == ["read:0", "read:1", "read:2", "read:3"]
+
+
+@pytest.mark.asyncio
+async def test_unsafe_call_acts_as_barrier(tmp_path):
+    """A non parallel-safe call never overlaps with the calls around it."""
+    log = []
+    tools = [SleepTool("read", 0.05, True, log), SleepTool("write", 0.05, False, log)]
+    calls = [
+        make_call("c0", "read", "a"),
+        make_call("c1", "read", "b"),
+        make_call("c2", "write", "w"),
+        make_call("c3", "read", "c"),
+    ]
+    agent = make_agent(tmp_path, calls, tools, parallel_tool_calls=True)
+
+    await agent.run()
+
+    write_start = log.index("start:w")
+    assert log.index("end:a") < write_start and log.index("end:b") < write_start
+    assert log.index("end:w") < log.index("start:c")
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap(tmp_path):
+    """No more than max_parallel_tools calls execute at the same time."""
+    log = []
+    tools = [SleepTool("read", 0.05, True, log)]
+    calls = [make_call(f"c{i}", "read", str(i)) for i in range(6)]
+    agent = make_agent(tmp_path, calls, tools, parallel_tool_calls=True, max_parallel_tools=2)
+
+    await agent.run()
+
+    running = peak = 0
+    for entry in log:
+        running += 1 if entry.startswith("start:") else -1
+        peak = max(peak, running)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_by_default(tmp_path):
+    """Without parallel mode every call runs to completion before the next starts."""
+    log = []
+    tools = [SleepTool("read", 0.01, True, log)]
+    calls = [make_call(f"c{i}", "read", str(i)) for i in range(3)]
+    agent = make_agent(tmp_path, calls, tools)
+
+    await agent.run()
+
+    assert log == ["start:0", "end:0", "start:1", "end:1", "start:2", "end:2"]
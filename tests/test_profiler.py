@@ -0,0 +1,134 @@
+"""Test cases for the latency profiler."""
+
+import asyncio
+import json
+
+import pytest
+
+from mini_agent.agent import Agent
+from mini_agent.events import NullSink
+from mini_agent.profiler import Profiler
+from mini_agent.retry import RetryConfig, async_retry
+from mini_agent.schema import FunctionCall, LLMResponse, ToolCall
+from mini_agent.tools.base import Tool, ToolResult
+
+
+class SleepTool(Tool):
+    """Parallel-safe tool that sleeps briefly."""
+
+    @property
+    def name(self):
+        return "sleep"
+
+    @property
+    def description(self):
+        return "Sleep helper"
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {}}
+
+    @property
+    def parallel_safe(self):
+        return True
+
+    async def execute(self):
+        await asyncio.sleep(0.01)
+        return ToolResult(success=True, content="slept")
+
+
+class TwoToolLLM:
+    """LLM stub that calls sleep twice in one step, then answers."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages, tools=None):
+        self.calls += 1
+        if self.calls == 1:
+            tool_calls = [
+                ToolCall(id=f"call-{i}", type="function", function=FunctionCall(name="sleep", arguments={})) for i in range(2)
+            ]
+            return LLMResponse(content="", tool_calls=tool_calls, finish_reason="tool_use")
+        return LLMResponse(content="done", finish_reason="stop")
+
+
+@pytest.mark.asyncio
+async def test_agent_run_records_phase_spans(tmp_path):
+    """A profiled run records LLM, tool, log and render spans; parallel tools get their own lanes."""
+    profiler = Profiler()
+    agent = Agent(
+        llm_client=TwoToolLLM(),
+        system_prompt="system",
+        tools=[SleepTool()],
+        workspace_dir=str(tmp_path),
+        parallel_tool_calls=True,
+        event_sink=NullSink(),
+        profiler=profiler,
+    )
+    agent.add_user_message("hi")
+
+    assert await agent.run() == "done"
+
+    spans = {(span.category, span.name): [] for span in profiler.spans}
+    for span in profiler.spans:
+        spans[(span.category, span.name)].append(span)
+    assert len(spans[("agent", "run")]) == 1
+    assert len(spans[("agent", "step")]) == 2
+    assert len(spans[("llm", "generate")]) == 2
+    assert spans[("llm", "generate")][-1].args["finish_reason"] == "stop"
+    assert ("log", "log_request") in spans
+    assert ("render", "tool_finished") in spans
+
+    tool_spans = spans[("tool", "sleep")]
+    assert len(tool_spans) == 2
+    assert all(span.args["success"] for span in tool_spans)
+    assert len({span.lane for span in tool_spans}) == 2
+    assert all(span.duration is not None for span in profiler.spans)
+
+
+@pytest.mark.asyncio
+async def test_retry_attempts_are_recorded_as_instants():
+    """Retries inside an active profiler show up as instant events."""
+    profiler = Profiler()
+    attempts = 0
+
+    @async_retry(RetryConfig(max_retries=2, initial_delay=0.001))
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise ConnectionError("boom")
+        return "ok"
+
+    with profiler.activate():
+        assert await flaky() == "ok"
+    assert await flaky() == "ok"  # Outside activate(): nothing recorded
+
+    retries = [span for span in profiler.spans if span.name == "retry"]
+    assert [span.args["attempt"] for span in retries] == [1, 2]
+    assert all(span.instant and span.args["error"] == "boom" for span in retries)
+
+
+def test_chrome_trace_and_summary(tmp_path):
+    """Spans export as Chrome trace events and aggregate into a summary table."""
+    profiler = Profiler()
+    for _ in range(2):
+        with profiler.span("generate", "llm") as args:
+            args["finish_reason"] = "stop"
+    profiler.instant("retry", "llm", attempt=1)
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(path)
+    trace = json.loads(path.read_text(encoding="utf-8"))
+
+    events = trace["traceEvents"]
+    assert [event["ph"] for event in events] == ["X", "X", "i"]
+    assert events[0]["args"] == {"finish_reason": "stop"}
+    assert all(event["dur"] >= 0 for event in events[:2])
+
+    rows = {row["name"]: row for row in profiler.summary()}
+    assert rows["generate"]["count"] == 2
+    assert rows["retry"]["count"] == 1
+    table = profiler.format_summary()
+    assert "generate" in table and "Total ms" in table
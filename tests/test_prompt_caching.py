@@ -0,0 +1,119 @@
+"""Test cases for Anthropic prompt caching."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mini_agent.llm import AnthropicClient
+from mini_agent.retry import RetryConfig
+from mini_agent.schema import FunctionCall, Message, ToolCall
+
+
+def ns(**kwargs):
+    return SimpleNamespace(**kwargs)
+
+
+def make_client(prompt_caching: bool = True) -> AnthropicClient:
+    return AnthropicClient(
+        api_key="test",
+        api_base="http://localhost",
+        retry_config=RetryConfig(enabled=False),
+        prompt_caching=prompt_caching,
+    )
+
+
+TOOLS = [
+    {"name": "read_file", "description": "Read", "input_schema": {"type": "object"}},
+    {"name": "bash", "description": "Run", "input_schema": {"type": "object"}},
+]
+
+HISTORY = [
+    Message(role="system", content="You are helpful."),
+    Message(role="user", content="List files"),
+    Message(
+        role="assistant",
+        content="",
+        thinking="Use bash",
+        tool_calls=[ToolCall(id="t1", type="function", function=FunctionCall(name="bash", arguments={"command": "ls"}))],
+    ),
+    Message(role="tool", content="a.txt", tool_call_id="t1", name="bash"),
+]
+
+
+def build(client: AnthropicClient, messages=HISTORY, tools=TOOLS):
+    system_message, api_messages = client._convert_messages(messages)
+    return client._build_params(system_message, api_messages, tools), api_messages
+
+
+def test_breakpoints_on_system_tools_and_history():
+    """System prompt, last tool and last history block are marked; inputs are not modified."""
+    params, api_messages = build(make_client())
+
+    assert params["system"] == [{"type": "text", "text": "You are helpful.", "cache_control": {"type": "ephemeral"}}]
+    assert "cache_control" not in params["tools"][0]
+    assert params["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in TOOLS[-1]
+
+    last_block = params["messages"][-1]["content"][-1]
+    assert last_block["type"] == "tool_result" and last_block["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in api_messages[-1]["content"][-1]
+    # Earlier messages are untouched
+    assert params["messages"][:-1] == api_messages[:-1]
+
+
+def test_string_user_message_becomes_cached_text_block():
+    """A plain-string last message is converted to a text block with a breakpoint."""
+    params, _ = build(make_client(), messages=HISTORY[:2], tools=None)
+
+    assert params["messages"][-1]["content"] == [{"type": "text", "text": "List files", "cache_control": {"type": "ephemeral"}}]
+    assert "tools" not in params
+
+
+def test_caching_disabled_leaves_request_unchanged():
+    """Without prompt caching, requests carry no cache_control markers."""
+    params, _ = build(make_client(prompt_caching=False))
+
+    assert params["system"] == "You are helpful."
+    assert "cache_control" not in str(params)
+
+
+def test_response_usage_includes_cache_tokens():
+    """Cache read/write token counts are copied into LLMResponse.usage."""
+    response = ns(
+        content=[ns(type="text", text="done")],
+        stop_reason="end_turn",
+        usage=ns(input_tokens=12, output_tokens=5, cache_creation_input_tokens=0, cache_read_input_tokens=3400),
+    )
+
+    result = make_client()._parse_response(response)
+
+    assert result.usage == {
+        "input_tokens": 12,
+        "output_tokens": 5,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": 3400,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_usage_merges_start_and_delta():
+    """Streaming usage combines message_start input counts with the final output count."""
+    client = make_client()
+    events = [
+        ns(type="message_start", message=ns(usage=ns(input_tokens=10, output_tokens=1, cache_read_input_tokens=2000))),
+        ns(type="content_block_start", index=0, content_block=ns(type="text")),
+        ns(type="content_block_delta", index=0, delta=ns(type="text_delta", text="ok")),
+        ns(type="message_delta", delta=ns(stop_reason="end_turn"), usage=ns(output_tokens=7)),
+    ]
+
+    async def fake_stream_request(*args):
+        for event in events:
+            yield event
+
+    async def open_stream(*args):
+        return fake_stream_request()
+
+    client._make_stream_request = open_stream
+    chunks = [chunk async for chunk in client.generate_stream([Message(role="user", content="hi")])]
+
+    assert chunks[-1].response.usage == {"input_tokens": 10, "output_tokens": 7, "cache_read_input_tokens": 2000}
@@ -0,0 +1,103 @@
+"""Test cases for the client-side LLM rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from mini_agent.config import Config
+from mini_agent.llm import RateLimitedClient, RateLimiter
+from mini_agent.llm.rate_limit import rate_limit_priority, shared_rate_limiter, usage_tokens
+from mini_agent.schema import LLMResponse, Message
+
+
+class StubLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.calls += 1
+        return LLMResponse(content="ok", finish_reason="stop", usage={"input_tokens": 40, "output_tokens": 10})
+
+
+@pytest.mark.asyncio
+async def test_requests_over_the_limit_wait_for_the_window():
+    """The third request waits until the first grant leaves the window."""
+    limiter = RateLimiter(requests=2, window=0.2)
+    started = time.monotonic()
+
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert time.monotonic() - started >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_by_priority():
+    """Waiting requests are granted highest priority first, then in arrival order."""
+    limiter = RateLimiter(requests=1, window=0.05)
+    await limiter.acquire()
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority=priority)
+        order.append(name)
+
+    tasks = [asyncio.create_task(request("low", -1))]
+    with rate_limit_priority(5):
+        tasks.append(asyncio.create_task(request("high", None)))
+    tasks.append(asyncio.create_task(request("normal", 0)))
+    await asyncio.sleep(0)
+    assert limiter.status()["queued"] == 3
+
+    await asyncio.gather(*tasks)
+    assert order == ["high", "normal", "low"]
+
+
+@pytest.mark.asyncio
+async def test_token_limit_uses_settled_usage():
+    """Estimated tokens are corrected to the reported usage, freeing capacity early."""
+    limiter = RateLimiter(tokens=100, window=60)
+    client = RateLimitedClient(StubLLM(), limiter)
+
+    await client.generate([Message(role="user", content="hi")], max_tokens=500)
+    assert limiter.status()["tokens"] == 50
+
+    await asyncio.wait_for(client.generate([Message(role="user", content="hi")], max_tokens=40), timeout=1)
+    assert limiter.status()["tokens"] == 100
+    assert limiter.status()["next_slot_in"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = RateLimiter(requests=1, window=0.05)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+    assert limiter.status()["queued"] == 0
+
+
+def test_shared_limiters_and_usage():
+    assert shared_rate_limiter("test:model", requests=5) is shared_rate_limiter("test:model", requests=99)
+    assert shared_rate_limiter("test:model").requests == 5
+    assert usage_tokens({"prompt_tokens": 7, "completion_tokens": 3}) == 10
+    assert usage_tokens({"input_tokens": 1, "output_tokens": 2, "cache_read_input_tokens": 4}) == 7
+    assert usage_tokens({}) is None
+
+
+def test_config_parses_rate_limits(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        'api_key: "key"\nrate_limit:\n  requests: 300\n  window: 18000\n'
+        'backends:\n  - name: glm\n    api_key: "zai"\n    rate_limit: {requests: 120, window: 18000}\n',
+        encoding="utf-8",
+    )
+    llm = Config.from_yaml(path).llm
+    assert (llm.rate_limit.requests, llm.rate_limit.tokens, llm.rate_limit.window) == (300, None, 18000)
+    assert llm.backends[0].rate_limit.requests == 120
+
+    path.write_text('api_key: "key"\n', encoding="utf-8")
+    assert not Config.from_yaml(path).llm.rate_limit.enabled
@@ -0,0 +1,86 @@
+"""Test cases for the record/replay LLM clients."""
+
+import time
+
+import pytest
+
+from mini_agent.llm.replay import CassetteMismatchError, RecordingClient, ReplayClient, load_cassette
+from mini_agent.schema import LLMResponse, Message
+from mini_agent.tools.file_tools import ReadTool, WriteTool
+from tests import helpers
+from tests.helpers import ScriptedLLM
+
+
+def scripted_llm():
+    """LLM stub that writes a file, reads it back, then answers."""
+    script = [("write_file", {"path": "a.txt", "content": "alpha"}), ("read_file", {"path": "a.txt"})]
+    return ScriptedLLM(script, thinking="plan", usage={"input_tokens": 10, "output_tokens": 1})
+
+
+def make_agent(workspace, llm):
+    return helpers.make_agent(workspace, llm, [ReadTool(str(workspace)), WriteTool(str(workspace))])
+
+
+def dump_history(agent):
+    return [msg.model_dump() for msg in agent.messages[1:]]
+
+
+@pytest.mark.asyncio
+async def test_replay_reproduces_recorded_session(tmp_path):
+    """A recorded session replays to the same history, with strict request matching."""
+    cassette = tmp_path / "session.jsonl"
+    workspace = tmp_path / "ws"
+    recorded = make_agent(workspace, RecordingClient(scripted_llm(), cassette))
+    assert await recorded.run() == "done"
+
+    calls = load_cassette(cassette)
+    assert len(calls) == 3
+    assert calls[0]["request"]["tools"] == ["read_file", "write_file"]
+    assert calls[-1]["response"]["usage"] == {"input_tokens": 10, "output_tokens": 1}
+
+    (workspace / "a.txt").unlink()
+    replayed = make_agent(workspace, ReplayClient(cassette, strict=True))
+    assert await replayed.run() == "done"
+    assert dump_history(replayed) == dump_history(recorded)
+
+
+@pytest.mark.asyncio
+async def test_replay_mismatch_and_exhaustion():
+    """Strict replay rejects a different request; running past the cassette raises."""
+    response = LLMResponse(content="hi", finish_reason="stop")
+    calls = [{"request": {"fingerprint": "0" * 16}, "response": response.model_dump(), "latency": 0.5}]
+
+    with pytest.raises(CassetteMismatchError, match="does not match"):
+        await ReplayClient(calls, strict=True).generate([Message(role="user", content="x")])
+
+    client = ReplayClient(calls)
+    assert (await client.generate([Message(role="user", content="x")])).content == "hi"
+    with pytest.raises(CassetteMismatchError, match="exhausted"):
+        await client.generate([])
+    client.reset()
+    assert client.position == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_latency():
+    """Synthetic and scaled recorded latency are slept and accounted in replay_time."""
+    response = LLMResponse(content="hi", finish_reason="stop").model_dump()
+    client = ReplayClient([{"request": {}, "response": response, "latency": 0.1}], latency=0.02, latency_scale=0.5)
+
+    started = time.monotonic()
+    await client.generate([])
+
+    assert time.monotonic() - started >= 0.07
+    assert client.replay_time == pytest.approx(0.07)
+
+
+@pytest.mark.asyncio
+async def test_recording_streamed_calls(tmp_path):
+    """Streaming calls pass chunks through and record the final response."""
+    cassette = tmp_path / "stream.jsonl"
+    client = RecordingClient(ReplayClient([{"request": {}, "response": {"content": "hello", "finish_reason": "stop"}}]), cassette)
+
+    chunks = [chunk async for chunk in client.generate_stream([Message(role="user", content="hi")])]
+
+    assert [chunk.type for chunk in chunks] == ["text", "done"]
+    assert load_cassette(cassette)[0]["response"]["content"] == "hello"
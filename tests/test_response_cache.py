@@ -0,0 +1,139 @@
+"""Test cases for the disk-backed LLM response cache."""
+
+import pytest
+
+from mini_agent.config import Config
+from mini_agent.llm import CachingClient, ResponseCache
+from mini_agent.llm.base import LLMClientBase
+from mini_agent.llm.response_cache import request_key
+from mini_agent.schema import FunctionCall, LLMResponse, Message, ToolCall
+
+TOOLS = [{"name": "read_file", "description": "Read a file", "input_schema": {"type": "object"}}]
+
+
+class CountingLLM:
+    """LLM stub that answers with the number of calls made so far."""
+
+    model = "test-model"
+    provider = "anthropic"
+    api_base = "https://example.invalid/anthropic"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.calls += 1
+        tool_call = ToolCall(id="call-1", type="function", function=FunctionCall(name="read_file", arguments={"path": "a.txt"}))
+        return LLMResponse(content=f"answer {self.calls}", thinking="plan", tool_calls=[tool_call], finish_reason="tool_use")
+
+    async def generate_stream(self, messages, tools=None, max_tokens=None):
+        for chunk in LLMClientBase._response_chunks(await self.generate(messages, tools)):
+            yield chunk
+
+
+def messages(text="hi"):
+    return [Message(role="system", content="system"), Message(role="user", content=text)]
+
+
+def test_request_key_is_canonical():
+    """Equal requests hash equally; any change to the request changes the key."""
+    key = request_key(messages(), TOOLS, 100, model="m")
+
+    assert key == request_key(messages(), [dict(reversed(list(TOOLS[0].items())))], 100, model="m")
+    assert key != request_key(messages("other"), TOOLS, 100, model="m")
+    assert key != request_key(messages(), TOOLS, 200, model="m")
+    assert key != request_key(messages(), [], 100, model="m")
+    assert key != request_key(messages(), TOOLS, 100, model="other")
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_hit_the_cache(tmp_path):
+    """A repeated request is served from disk, also after reopening the cache."""
+    llm = CountingLLM()
+    client = CachingClient(llm, ResponseCache(tmp_path / "cache.sqlite"))
+
+    first = await client.generate(messages(), TOOLS)
+    second = await client.generate(messages(), TOOLS)
+    await client.generate(messages("other"), TOOLS)
+
+    assert llm.calls == 2
+    assert second == first
+    assert client.cache.stats.to_dict() == {"hits": 1, "misses": 2, "expired": 0, "stores": 2, "evictions": 0, "hit_rate": 0.3333}
+    client.cache.close()
+
+    reopened = CachingClient(llm, ResponseCache(tmp_path / "cache.sqlite"))
+    assert (await reopened.generate(messages(), TOOLS)).content == "answer 1"
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_streamed_requests_share_the_cache(tmp_path):
+    """A streamed miss is stored; a hit is streamed back as equivalent chunks."""
+    llm = CountingLLM()
+    client = CachingClient(llm, ResponseCache(tmp_path / "cache.sqlite"))
+
+    missed = [chunk async for chunk in client.generate_stream(messages(), TOOLS)]
+    hit = [chunk async for chunk in client.generate_stream(messages(), TOOLS)]
+
+    assert llm.calls == 1
+    assert [chunk.type for chunk in hit] == ["thinking", "text", "tool_call_delta", "done"]
+    assert hit == missed
+    assert (await client.generate(messages(), TOOLS)).content == "answer 1"
+
+
+class FailingLLM(CountingLLM):
+    """LLM stub that reports failures in the response, as GLMClient does."""
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.calls += 1
+        return LLMResponse(content="Error: Unable to generate response - timeout", finish_reason="error")
+
+
+@pytest.mark.asyncio
+async def test_error_responses_are_not_cached(tmp_path):
+    llm = FailingLLM()
+    client = CachingClient(llm, ResponseCache(tmp_path / "cache.sqlite"))
+
+    await client.generate(messages())
+    [chunk async for chunk in client.generate_stream(messages())]
+    await client.generate(messages())
+
+    assert llm.calls == 3
+    assert len(client.cache) == 0
+
+
+def test_lru_eviction_and_ttl(tmp_path, monkeypatch):
+    """Least recently used entries go first; entries past the TTL are misses."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_entries=2, ttl=60)
+    clock = [1000.0]
+    monkeypatch.setattr("mini_agent.llm.response_cache.time.time", lambda: clock[0])
+
+    for key in ("a", "b"):
+        cache.put(key, LLMResponse(content=key, finish_reason="stop"))
+        clock[0] += 1
+    assert cache.get("a") is not None  # "b" is now least recently used
+    clock[0] += 1
+    cache.put("c", LLMResponse(content="c", finish_reason="stop"))
+
+    assert cache.get("b") is None
+    assert len(cache) == 2 and cache.stats.evictions == 1
+
+    clock[0] += 61
+    assert cache.get("c") is None
+    assert cache.stats.expired == 1 and len(cache) == 1
+
+    small = ResponseCache(tmp_path / "small.sqlite", max_bytes=200)
+    small.put("x", LLMResponse(content="x" * 120, finish_reason="stop"))
+    small.put("y", LLMResponse(content="y" * 120, finish_reason="stop"))
+    assert small.get("x") is None and small.get("y") is not None
+
+
+def test_config_parses_response_cache(tmp_path):
+    """response_cache settings are read from the config file; the cache is off by default."""
+    path = tmp_path / "config.yaml"
+    path.write_text('api_key: "test-key"\n', encoding="utf-8")
+    assert not Config.from_yaml(path).llm.response_cache.enabled
+
+    path.write_text('api_key: "test-key"\nresponse_cache:\n  enabled: true\n  max_entries: 5\n  ttl: null\n', encoding="utf-8")
+    cache_config = Config.from_yaml(path).llm.response_cache
+    assert cache_config.enabled and cache_config.max_entries == 5 and cache_config.ttl is None
@@ -0,0 +1,139 @@
+"""Test cases for the retry engine: error classification, Retry-After and circuit breaking."""
+
+import time
+
+import pytest
+
+from mini_agent.config import Config
+from mini_agent.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryConfig,
+    RetryExhaustedError,
+    async_retry,
+    is_retryable,
+    retry_after,
+)
+
+
+class Response:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class StatusError(Exception):
+    """Stand-in for an SDK status error (status_code and response.headers)."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = Response(headers or {})
+
+
+class APIConnectionError(Exception):
+    """Matched by class name, like the anthropic and openai SDK errors."""
+
+
+def flaky(*errors):
+    """Coroutine function raising the given errors in turn, then returning "ok"."""
+    calls = []
+
+    async def call():
+        calls.append(time.monotonic())
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return call, calls
+
+
+def test_error_classification():
+    assert all(is_retryable(StatusError(status)) for status in (408, 429, 500, 503, 529))
+    assert not any(is_retryable(StatusError(status)) for status in (400, 401, 403, 404, 422))
+    assert is_retryable(TimeoutError()) and is_retryable(ConnectionResetError())
+    assert is_retryable(APIConnectionError("connection refused"))
+    assert not is_retryable(ValueError("bad response"))
+
+
+def test_retry_after_parsing():
+    assert retry_after(StatusError(429, {"retry-after": "2"})) == 2.0
+    assert retry_after(StatusError(429, {"retry-after-ms": "1500", "retry-after": "9"})) == 1.5
+    assert 0 < retry_after(StatusError(429, {"retry-after": "Wed, 21 Oct 2099 07:28:00 GMT"}))
+    assert retry_after(StatusError(429, {"retry-after": "soon"})) is None
+    assert retry_after(StatusError(429)) is None
+
+
+@pytest.mark.asyncio
+async def test_fatal_errors_are_not_retried():
+    call, calls = flaky(StatusError(401), StatusError(401))
+
+    with pytest.raises(StatusError):
+        await async_retry(RetryConfig(max_retries=3, initial_delay=0.001))(call)()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_honor_retry_after():
+    call, calls = flaky(StatusError(429, {"retry-after": "0.05"}), StatusError(503))
+
+    result = await async_retry(RetryConfig(max_retries=3, initial_delay=0.001, jitter=False))(call)()
+
+    assert result == "ok" and len(calls) == 3
+    assert calls[1] - calls[0] >= 0.045
+    assert calls[2] - calls[1] < 0.045
+
+
+def test_decorrelated_jitter_bounds():
+    config = RetryConfig(initial_delay=1.0, max_delay=10.0)
+    delay = None
+    for attempt in range(20):
+        previous = delay
+        delay = config.next_delay(attempt, previous)
+        assert 1.0 <= delay <= min(10.0, 3 * (previous or 1.0))
+
+    assert RetryConfig(initial_delay=1.0, jitter=False).next_delay(2, 4.0) == 4.0
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_and_recovers():
+    """An endpoint that keeps failing is cut off, then probed again after the timeout."""
+    config = RetryConfig(max_retries=1, initial_delay=0.001, circuit_breaker_threshold=2, circuit_breaker_timeout=0.05)
+    call, calls = flaky(*[StatusError(500)] * 5)
+    retrying = async_retry(config, endpoint="https://breaker.test")(call)
+
+    for _ in range(2):
+        with pytest.raises(RetryExhaustedError):
+            await retrying()
+    with pytest.raises(CircuitOpenError):
+        await retrying()
+    assert len(calls) == 4
+
+    time.sleep(0.06)
+    with pytest.raises(CircuitOpenError):
+        await retrying()  # The trial call fails, so the circuit opens again
+    assert len(calls) == 5
+
+    time.sleep(0.06)
+    assert await retrying() == "ok"
+    assert len(calls) == 6
+
+
+def test_circuit_breaker_admits_one_trial_call():
+    breaker = CircuitBreaker("endpoint", threshold=1, timeout=0.0)
+    breaker.record_failure()
+
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_config_parses_retry_settings(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text('api_key: "key"\nretry:\n  jitter: false\n  circuit_breaker_threshold: 0\n', encoding="utf-8")
+
+    retry = Config.from_yaml(path).llm.retry
+    assert (retry.jitter, retry.circuit_breaker_threshold, retry.circuit_breaker_timeout) == (False, 0, 30.0)
@@ -0,0 +1,160 @@
+"""Test cases for the multi-provider router client."""
+
+import asyncio
+
+import pytest
+
+from mini_agent.agent import Agent
+from mini_agent.config import Config
+from mini_agent.events import NullSink
+from mini_agent.llm import AllBackendsFailedError, LLMClientBase, RouterClient
+from mini_agent.schema import LLMResponse, Message
+
+
+class BadRequestError(Exception):
+    status_code = 400
+
+
+class Backend:
+    """LLM stub with a fixed latency that can be switched to failing."""
+
+    def __init__(self, name, latency=0.0, failing=False, error=None):
+        self.name = name
+        self.latency = latency
+        self.failing = failing
+        self.error = error
+        self.calls = 0
+        self.seen: list[list[str]] = []
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        self.calls += 1
+        self.seen.append([msg.content for msg in messages])
+        await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        if self.failing:
+            raise ConnectionError(f"{self.name} is down")
+        return LLMResponse(content=f"from {self.name}", finish_reason="stop")
+
+    async def generate_stream(self, messages, tools=None, max_tokens=None):
+        response = await self.generate(messages, tools)
+        for chunk in LLMClientBase._response_chunks(response):
+            yield chunk
+
+
+def ask():
+    return [Message(role="user", content="hi")]
+
+
+@pytest.mark.asyncio
+async def test_routes_to_fastest_backend():
+    """Every backend is tried once, then the fastest one serves the requests."""
+    slow, fast = Backend("slow", latency=0.03), Backend("fast", latency=0.001)
+    router = RouterClient({"slow": slow, "fast": fast})
+
+    for _ in range(5):
+        await router.generate(ask())
+
+    assert (slow.calls, fast.calls) == (1, 4)
+    assert router.last_backend == "fast"
+    assert [row["backend"] for row in router.stats()] == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_priority_strategy_keeps_order():
+    """With the priority strategy, later backends are only used for failover."""
+    first, second = Backend("first", latency=0.02), Backend("second")
+    router = RouterClient({"first": first, "second": second}, strategy="priority")
+
+    for _ in range(3):
+        await router.generate(ask())
+
+    assert (first.calls, second.calls) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_failover_and_cooldown():
+    """A failing backend is skipped during its cooldown; the request is served elsewhere."""
+    down, up = Backend("down", failing=True), Backend("up")
+    router = RouterClient({"down": down, "up": up}, strategy="priority", cooldown=60)
+
+    assert (await router.generate(ask())).content == "from up"
+    assert (await router.generate(ask())).content == "from up"
+    assert down.calls == 1
+    assert up.seen == [["hi"], ["hi"]]
+    assert router.stats()[-1] == {
+        "backend": "down",
+        "requests": 1,
+        "failures": 1,
+        "error_rate": 1.0,
+        "latency_ms": None,
+        "available": False,
+    }
+
+    up.failing = True
+    with pytest.raises(AllBackendsFailedError) as excinfo:
+        await router.generate(ask())
+    assert set(excinfo.value.errors) == {"down", "up"}
+
+
+@pytest.mark.asyncio
+async def test_request_errors_are_raised_without_failover():
+    """An error caused by the request itself is raised; backend health is untouched."""
+    rejecting, spare = Backend("rejecting", error=BadRequestError("context too long")), Backend("spare")
+    router = RouterClient({"rejecting": rejecting, "spare": spare}, strategy="priority")
+
+    with pytest.raises(BadRequestError):
+        await router.generate(ask())
+    with pytest.raises(BadRequestError):
+        [chunk async for chunk in router.generate_stream(ask())]
+
+    assert spare.calls == 0
+    assert router.stats()[0] == {
+        "backend": "rejecting",
+        "requests": 0,
+        "failures": 0,
+        "error_rate": 0.0,
+        "latency_ms": None,
+        "available": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_streaming_failover_before_first_chunk():
+    down, up = Backend("down", failing=True), Backend("up")
+    router = RouterClient({"down": down, "up": up}, strategy="priority")
+
+    chunks = [chunk async for chunk in router.generate_stream(ask())]
+
+    assert chunks[-1].response.content == "from up"
+
+
+@pytest.mark.asyncio
+async def test_agent_run_survives_backend_outage(tmp_path):
+    """An agent keeps its conversation when the router fails over mid-run."""
+    primary, backup = Backend("primary"), Backend("backup")
+    router = RouterClient({"primary": primary, "backup": backup}, strategy="priority")
+    agent = Agent(llm_client=router, system_prompt="system", tools=[], workspace_dir=str(tmp_path), event_sink=NullSink())
+
+    agent.add_user_message("first")
+    await agent.run()
+    primary.failing = True
+    agent.add_user_message("second")
+    assert await agent.run() == "from backup"
+
+    assert backup.seen[-1][1:] == ["first", "from primary", "second"]
+
+
+def test_config_parses_backends(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        'api_key: "key"\nbackends:\n  - name: glm\n    provider: zai\n    api_key: "zai-key"\n    model: GLM-4.6\nrouting:\n  strategy: priority\n',
+        encoding="utf-8",
+    )
+    llm = Config.from_yaml(path).llm
+    assert [(b.name, b.provider, b.model) for b in llm.backends] == [("glm", "zai", "GLM-4.6")]
+    assert llm.routing.strategy == "priority"
+
+    path.write_text('api_key: "key"\nrouting:\n  strategy: random\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="routing strategy"):
+        Config.from_yaml(path)
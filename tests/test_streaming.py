@@ -0,0 +1,181 @@
+"""Test cases for streaming generation across LLM clients, Agent and ACP."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mini_agent.acp import MiniMaxACPAgent
+from mini_agent.agent import Agent
+from mini_agent.config import AgentConfig, Config, LLMConfig, ToolsConfig
+from mini_agent.llm import AnthropicClient, OpenAIClient
+from mini_agent.llm.base import LLMClientBase
+from mini_agent.retry import RetryConfig
+from mini_agent.schema import FunctionCall, LLMResponse, Message, StreamChunk, ToolCall
+
+
+async def aiter_list(items):
+    for item in items:
+        yield item
+
+
+def ns(**kwargs):
+    return SimpleNamespace(**kwargs)
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_anthropic_stream_assembles_response():
+    """Anthropic raw events are surfaced as deltas and assembled into a response."""
+    client = AnthropicClient(api_key="test", api_base="http://localhost", retry_config=RetryConfig(enabled=False))
+    events = [
+        ns(type="message_start", message=ns()),
+        ns(type="content_block_start", index=0, content_block=ns(type="thinking")),
+        ns(type="content_block_delta", index=0, delta=ns(type="thinking_delta", thinking="Let me ")),
+        ns(type="content_block_delta", index=0, delta=ns(type="thinking_delta", thinking="check.")),
+        ns(type="content_block_start", index=1, content_block=ns(type="text")),
+        ns(type="content_block_delta", index=1, delta=ns(type="text_delta", text="Reading")),
+        ns(type="content_block_start", index=2, content_block=ns(type="tool_use", id="toolu_1", name="read_file")),
+        ns(type="content_block_delta", index=2, delta=ns(type="input_json_delta", partial_json='{"path": ')),
+        ns(type="content_block_delta", index=2, delta=ns(type="input_json_delta", partial_json='"a.txt"}')),
+        ns(type="message_delta", delta=ns(stop_reason="tool_use")),
+        ns(type="message_stop"),
+    ]
+
+    async def fake_stream_request(*args):
+        return aiter_list(events)
+
+    client._make_stream_request = fake_stream_request
+    chunks = await collect(client.generate_stream([Message(role="user", content="hi")]))
+
+    assert [c.delta for c in chunks if c.type == "thinking"] == ["Let me ", "check."]
+    assert [c.delta for c in chunks if c.type == "text"] == ["Reading"]
+    tool_deltas = [c for c in chunks if c.type == "tool_call_delta"]
+    assert tool_deltas[0].tool_call_id == "toolu_1" and tool_deltas[0].tool_name == "read_file"
+
+    response = chunks[-1].response
+    assert chunks[-1].type == "done"
+    assert response.content == "Reading"
+    assert response.thinking == "Let me check."
+    assert response.finish_reason == "tool_use"
+    assert response.tool_calls[0].function.arguments == {"path": "a.txt"}
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_assembles_response():
+    """OpenAI chunks (reasoning, content, fragmented tool calls) assemble into a response."""
+    client = OpenAIClient(api_key="test", api_base="http://localhost", retry_config=RetryConfig(enabled=False))
+
+    def chunk(delta, finish_reason=None):
+        return ns(choices=[ns(delta=delta, finish_reason=finish_reason)])
+
+    def delta(content=None, tool_calls=None, reasoning_details=None):
+        return ns(content=content, tool_calls=tool_calls, reasoning_details=reasoning_details)
+
+    chunks_in = [
+        chunk(delta(reasoning_details=[{"type": "reasoning.text", "text": "Think"}])),
+        chunk(delta(content="Sure")),
+        chunk(delta(tool_calls=[ns(index=0, id="call_1", function=ns(name="bash", arguments='{"comm'))])),
+        chunk(delta(tool_calls=[ns(index=0, id=None, function=ns(name=None, arguments='and": "ls"}'))])),
+        chunk(delta(), finish_reason="tool_calls"),
+    ]
+
+    async def fake_stream_request(*args):
+        return aiter_list(chunks_in)
+
+    client._make_stream_request = fake_stream_request
+    chunks = await collect(client.generate_stream([Message(role="user", content="hi")]))
+
+    assert [c.delta for c in chunks if c.type == "thinking"] == ["Think"]
+    assert [c.delta for c in chunks if c.type == "text"] == ["Sure"]
+    response = chunks[-1].response
+    assert response.thinking == "Think"
+    assert response.finish_reason == "tool_calls"
+    assert response.tool_calls[0].id == "call_1"
+    assert response.tool_calls[0].function.arguments == {"command": "ls"}
+
+
+class NonStreamingClient(LLMClientBase):
+    """Client implementing only generate()."""
+
+    async def generate(self, messages, tools=None):
+        return LLMResponse(content="hello", thinking="hmm", finish_reason="stop")
+
+    def _prepare_request(self, messages, tools=None):
+        return {}
+
+    def _convert_messages(self, messages):
+        return None, []
+
+
+@pytest.mark.asyncio
+async def test_base_generate_stream_falls_back_to_generate():
+    """Clients without native streaming still expose generate_stream()."""
+    client = NonStreamingClient(api_key="test", api_base="http://localhost", model="test")
+    chunks = await collect(client.generate_stream([Message(role="user", content="hi")]))
+
+    assert [c.type for c in chunks] == ["thinking", "text", "done"]
+    assert chunks[-1].response.content == "hello"
+
+
+class StreamingLLM:
+    """LLM stub that streams a tool call first, then a final answer."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_stream(self, messages, tools=None):
+        self.calls += 1
+        if self.calls == 1:
+            tool_call = ToolCall(id="t1", type="function", function=FunctionCall(name="missing", arguments={}))
+            yield StreamChunk(type="thinking", delta="plan")
+            response = LLMResponse(content="", thinking="plan", tool_calls=[tool_call], finish_reason="tool_use")
+            yield StreamChunk(type="done", response=response)
+            return
+        for piece in ["Hel", "lo"]:
+            yield StreamChunk(type="text", delta=piece)
+        yield StreamChunk(type="done", response=LLMResponse(content="Hello", finish_reason="stop"))
+
+
+@pytest.mark.asyncio
+async def test_agent_consumes_stream(tmp_path, capsys):
+    """Agent prints deltas as they arrive and stores the assembled response."""
+    agent = Agent(llm_client=StreamingLLM(), system_prompt="system", tools=[], workspace_dir=str(tmp_path), stream=True)
+    agent.add_user_message("hi")
+
+    result = await agent.run()
+
+    assert result == "Hello"
+    assert agent.messages[-1].content == "Hello"
+    assert "Hello" in capsys.readouterr().out
+
+
+class DummyConn:
+    def __init__(self):
+        self.updates = []
+
+    async def sessionUpdate(self, payload):
+        self.updates.append(payload)
+
+
+@pytest.mark.asyncio
+async def test_acp_forwards_stream_deltas(tmp_path):
+    """ACP sends one message update per streamed text delta."""
+    config = Config(
+        llm=LLMConfig(api_key="test-key"),
+        agent=AgentConfig(max_steps=3, workspace_dir=str(tmp_path), stream=True),
+        tools=ToolsConfig(),
+    )
+    conn = DummyConn()
+    acp_agent = MiniMaxACPAgent(conn, config, StreamingLLM(), [], "system")
+    session = await acp_agent.newSession(SimpleNamespace(cwd=None))
+
+    response = await acp_agent.prompt(SimpleNamespace(sessionId=session.sessionId, prompt=[{"text": "hi"}]))
+
+    assert response.stopReason == "end_turn"
+    message_chunks = [
+        update.update.content.text for update in conn.updates if update.update.session_update == "agent_message_chunk"
+    ]
+    assert message_chunks == ["Hel", "lo"]
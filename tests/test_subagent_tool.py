@@ -0,0 +1,118 @@
+"""Test cases for the spawn_subagents tool."""
+
+import asyncio
+import time
+
+import pytest
+
+from mini_agent.schema import LLMResponse
+from mini_agent.tools.base import Tool, ToolResult
+from mini_agent.tools.subagent_tool import SUBAGENT_SYSTEM_PROMPT
+from tests import helpers
+from tests.helpers import tool_call
+
+
+class LookupTool(Tool):
+    """Slow lookup tool."""
+
+    @property
+    def name(self):
+        return "lookup"
+
+    @property
+    def description(self):
+        return "Look up a topic"
+
+    @property
+    def parameters(self):
+        return {"type": "object", "properties": {"topic": {"type": "string"}}}
+
+    async def execute(self, topic: str):
+        await asyncio.sleep(0.2)
+        return ToolResult(success=True, content=f"facts about {topic}")
+
+
+class NoopTool(LookupTool):
+    @property
+    def name(self):
+        return "noop"
+
+
+class DelegatingLLM:
+    """Parent fans out to sub-agents; each sub-agent looks its topic up once and reports."""
+
+    def __init__(self, tasks, usage=None):
+        self.tasks = tasks
+        self.usage = usage  # Reported with every response
+        self.child_tools = []
+        self.child_max_tokens = []
+
+    async def generate(self, messages, tools=None, max_tokens=None):
+        last = messages[-1]
+        if messages[0].content.startswith(SUBAGENT_SYSTEM_PROMPT):
+            self.child_max_tokens.append(max_tokens)
+            if last.role == "user":
+                self.child_tools.append(sorted(tools))
+                return LLMResponse(content="", tool_calls=[tool_call("c1", "lookup", {"topic": last.content})], finish_reason="tool_use", usage=self.usage)
+            return LLMResponse(content=f"report: {last.content}", finish_reason="stop", usage=self.usage)
+
+        if last.role == "user":
+            return LLMResponse(content="", tool_calls=[tool_call("p1", "spawn_subagents", {"tasks": self.tasks})], finish_reason="tool_use", usage=self.usage)
+        return LLMResponse(content="all done", finish_reason="stop", usage=self.usage)
+
+
+def make_agent(tmp_path, llm, **kwargs):
+    return helpers.make_agent(tmp_path, llm, [LookupTool(), NoopTool()], message="research", max_subagents=4, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_subagents_run_concurrently_with_isolated_histories(tmp_path):
+    """Sub-agents run at the same time; only their reports reach the parent history."""
+    llm = DelegatingLLM([{"task": "alpha", "tools": ["lookup"]}, {"task": "beta"}, {"task": "gamma"}])
+    agent = make_agent(tmp_path, llm)
+
+    started = time.monotonic()
+    assert await agent.run() == "all done"
+    assert time.monotonic() - started < 0.5  # Three 0.2s lookups, run concurrently
+
+    tool_msgs = [msg for msg in agent.messages if msg.role == "tool"]
+    assert len(tool_msgs) == 1
+    report = tool_msgs[0].content
+    for i, topic in enumerate(["alpha", "beta", "gamma"], 1):
+        assert f"## Sub-agent {i}: {topic}\nStatus: end_turn" in report
+        assert f"report: facts about {topic}" in report
+
+    # Scoped tool subsets; sub-agents are never offered spawn_subagents themselves
+    assert sorted(llm.child_tools) == [["lookup"], ["lookup", "noop"], ["lookup", "noop"]]
+
+
+@pytest.mark.asyncio
+async def test_subagents_share_the_parent_budget(tmp_path):
+    """Sub-agents run within what is left of the parent's budget, and their tokens count against it."""
+    llm = DelegatingLLM([{"task": "alpha"}, {"task": "beta"}], usage={"input_tokens": 1000, "output_tokens": 500})
+    agent = make_agent(tmp_path, llm, token_budget=10000)
+
+    assert await agent.run() == "all done"
+
+    # 1500 tokens used by the parent's first call leave 8500 for each sub-agent
+    assert len(llm.child_max_tokens) == 4
+    assert all(max_tokens is not None and max_tokens < 8500 for max_tokens in llm.child_max_tokens)
+    assert agent.budget.tokens_used == 6 * 1500
+
+
+@pytest.mark.asyncio
+async def test_unknown_tools_are_rejected(tmp_path):
+    """Asking for a tool the parent does not have fails the call without starting sub-agents."""
+    agent = make_agent(tmp_path, DelegatingLLM([{"task": "alpha", "tools": ["bash"]}]))
+
+    result = await agent.tools["spawn_subagents"].execute(tasks=[{"task": "alpha", "tools": ["bash"]}])
+
+    assert not result.success
+    assert "unknown tools bash" in result.error
+
+
+def test_tool_is_opt_in(tmp_path):
+    """Without max_subagents the tool is not offered."""
+    agent = helpers.make_agent(tmp_path, DelegatingLLM([]), [LookupTool()], message=None)
+
+    assert "spawn_subagents" not in agent.tools
@@ -0,0 +1,149 @@
+"""Test cases for rolling message history summarization."""
+
+import asyncio
+import time
+
+import pytest
+
+from mini_agent.agent import SUMMARY_PREFIX, Agent
+from mini_agent.schema import LLMResponse, Message
+
+
+class SummaryLLM:
+    """LLM stub that answers summary requests after a fixed delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.prompts = []
+
+    async def generate(self, messages, tools=None):
+        self.prompts.append(messages[-1].content)
+        await asyncio.sleep(self.delay)
+        return LLMResponse(content=f"summary {len(self.prompts)}", finish_reason="stop")
+
+
+def add_round(agent: Agent, user_text: str, steps: int):
+    agent.add_user_message(user_text)
+    for i in range(steps):
+        agent.messages.append(Message(role="assistant", content=f"{user_text} step {i} " + "x" * 200))
+        agent.messages.append(Message(role="tool", content="result " + "y" * 200, tool_call_id=f"{user_text}-{i}", name="bash"))
+
+
+def make_agent(tmp_path, llm) -> Agent:
+    return Agent(llm_client=llm, system_prompt="system", tools=[], workspace_dir=str(tmp_path), token_limit=100)
+
+
+@pytest.mark.asyncio
+async def test_rounds_are_summarized_concurrently(tmp_path):
+    """Each round gets one summary, and the summary calls overlap."""
+    llm = SummaryLLM(delay=0.2)
+    agent = make_agent(tmp_path, llm)
+    for name in ["task1", "task2", "task3"]:
+        add_round(agent, name, steps=2)
+
+    start = time.perf_counter()
+    await agent._summarize_messages()
+    elapsed = time.perf_counter() - start
+
+    assert len(llm.prompts) == 3
+    assert elapsed < 0.5  # Sequential calls would take ~0.6s
+    assert [m.role for m in agent.messages] == ["system", "user", "user", "user", "user", "user", "user"]
+    assert [m.content for m in agent.messages[1::2]] == ["task1", "task2", "task3"]
+    assert all(m.content.startswith(SUMMARY_PREFIX) for m in agent.messages[2::2])
+
+
+@pytest.mark.asyncio
+async def test_only_new_span_is_summarized(tmp_path):
+    """A second overflow summarizes only messages added since the last summary."""
+    llm = SummaryLLM()
+    agent = make_agent(tmp_path, llm)
+    add_round(agent, "task1", steps=2)
+    add_round(agent, "task2", steps=2)
+    await agent._summarize_messages()
+    assert len(llm.prompts) == 2
+    first_summaries = [m for m in agent.messages if Agent._is_summary_message(m)]
+
+    # The in-progress round keeps executing
+    for i in range(3):
+        agent.messages.append(Message(role="assistant", content="more work " + "z" * 200))
+        agent.messages.append(Message(role="tool", content="more output " + "w" * 200, tool_call_id=f"new-{i}", name="bash"))
+    await agent._summarize_messages()
+
+    assert len(llm.prompts) == 3
+    assert "more work" in llm.prompts[-1]
+    assert "task1 step" not in llm.prompts[-1]
+    summaries = [m for m in agent.messages if Agent._is_summary_message(m)]
+    assert summaries[:2] == first_summaries
+    assert len(summaries) == 3
+    assert agent.messages[-1] is summaries[-1]
+
+
+@pytest.mark.asyncio
+async def test_no_summary_below_limit(tmp_path):
+    """Nothing is summarized while history fits in the token limit."""
+    llm = SummaryLLM()
+    agent = Agent(llm_client=llm, system_prompt="system", tools=[], workspace_dir=str(tmp_path))
+    add_round(agent, "task1", steps=1)
+
+    await agent._summarize_messages()
+
+    assert llm.prompts == []
+
+
+@pytest.mark.asyncio
+async def test_background_compaction_applied_at_step_boundary(tmp_path):
+    """Crossing the watermark starts compaction, which is swapped in at the next step."""
+    llm = SummaryLLM(delay=0.05)
+    agent = Agent(
+        llm_client=llm,
+        system_prompt="system",
+        tools=[],
+        workspace_dir=str(tmp_path),
+        token_limit=1000,
+        background_compaction=True,
+        compaction_watermark=0.3,
+    )
+    add_round(agent, "task1", steps=2)
+    add_round(agent, "task2", steps=1)
+    in_flight = Message(role="assistant", content="calling a tool")
+    agent.messages.append(in_flight)
+
+    await agent._maybe_start_background_compaction()
+    assert agent._compaction_task is not None
+    assert in_flight not in agent._compaction_snapshot
+
+    # Tool results arrive while the summary is generated
+    tool_result = Message(role="tool", content="done", tool_call_id="late", name="bash")
+    agent.messages.append(tool_result)
+    await asyncio.sleep(0.1)
+    await agent._summarize_messages()
+
+    assert agent._compaction_task is None
+    assert len(llm.prompts) == 2
+    assert Agent._is_summary_message(agent.messages[2])
+    assert agent.messages[-2:] == [in_flight, tool_result]
+
+
+@pytest.mark.asyncio
+async def test_background_compaction_skipped_if_history_replaced(tmp_path):
+    """A finished compaction is discarded if its snapshot is no longer a prefix of history."""
+    llm = SummaryLLM()
+    agent = Agent(
+        llm_client=llm,
+        system_prompt="system",
+        tools=[],
+        workspace_dir=str(tmp_path),
+        token_limit=1000,
+        background_compaction=True,
+        compaction_watermark=0.3,
+    )
+    add_round(agent, "task1", steps=3)
+    agent.messages.append(Message(role="assistant", content="calling a tool"))
+    await agent._maybe_start_background_compaction()
+    await agent._compaction_task
+
+    agent.messages = [agent.messages[0], Message(role="user", content="fresh start")]
+    await agent._summarize_messages()
+
+    assert agent._compaction_task is None
+    assert [m.content for m in agent.messages[1:]] == ["fresh start"]
@@ -0,0 +1,88 @@
+"""Test cases for incremental token accounting."""
+
+from mini_agent import token_ledger
+from mini_agent.schema import FunctionCall, Message, ToolCall
+from mini_agent.token_ledger import TokenLedger
+
+
+class CountingLedger(TokenLedger):
+    """Ledger that records how many messages were encoded."""
+
+    def __init__(self):
+        super().__init__()
+        self.encoded = 0
+
+    def _encode_message(self, msg):
+        self.encoded += 1
+        return super()._encode_message(msg)
+
+
+def make_history():
+    return [
+        Message(role="system", content="You are a helpful assistant."),
+        Message(role="user", content="List the files."),
+        Message(
+            role="assistant",
+            content="",
+            thinking="I should call bash.",
+            tool_calls=[ToolCall(id="1", type="function", function=FunctionCall(name="bash", arguments={"command": "ls"}))],
+        ),
+        Message(role="tool", content="a.txt\nb.txt", tool_call_id="1", name="bash"),
+    ]
+
+
+def test_only_new_messages_are_encoded():
+    """Counting the same history twice encodes nothing the second time."""
+    ledger = CountingLedger()
+    messages = make_history()
+
+    first = ledger.count(messages)
+    assert ledger.encoded == 4
+    assert ledger.total == first
+
+    assert ledger.count(messages) == first
+    assert ledger.encoded == 4
+
+    messages.append(Message(role="assistant", content="There are two files."))
+    assert ledger.count(messages) > first
+    assert ledger.encoded == 5
+
+
+def test_modified_message_is_re_encoded():
+    """Reassigning a message field invalidates its cached count."""
+    ledger = CountingLedger()
+    messages = make_history()
+    before = ledger.count(messages)
+
+    messages[1].content = "List the files in the current directory, including hidden ones."
+    after = ledger.count(messages)
+
+    assert ledger.encoded == 5
+    assert after > before
+
+
+def test_total_matches_fresh_count():
+    """Incremental totals equal a from-scratch count."""
+    ledger = TokenLedger()
+    messages = make_history()
+    ledger.count(messages[:2])
+    ledger.count(messages)
+
+    assert ledger.total == TokenLedger().count(messages)
+
+
+def test_replaced_history_prunes_entries():
+    """Entries for messages dropped from history are released."""
+    ledger = TokenLedger()
+    messages = make_history()
+    ledger.count(messages)
+
+    ledger.count(messages[:2])
+
+    assert len(ledger._entries) == 2
+
+
+def test_encoder_is_created_once():
+    """The tiktoken encoder (or its failure) is cached per process."""
+    assert token_ledger.get_encoding() is token_ledger.get_encoding()
+    assert token_ledger.get_encoding.cache_info().currsize == 1
@@ -0,0 +1,112 @@
+"""Test cases for read-only tool result memoization."""
+
+import pytest
+
+from mini_agent.tools.base import ToolResult
+from mini_agent.tools.bash_tool import BashTool
+from mini_agent.tools.file_tools import EditTool, ReadTool, WriteTool
+from mini_agent.tools.result_cache import ToolResultCache
+from tests import helpers
+from tests.helpers import ScriptedLLM
+
+
+class CountingReadTool(ReadTool):
+    """read_file that counts real executions."""
+
+    def __init__(self, workspace_dir):
+        super().__init__(workspace_dir)
+        self.executions = 0
+
+    async def execute(self, **kwargs):
+        self.executions += 1
+        return await super().execute(**kwargs)
+
+
+def make_agent(tmp_path, calls, memoize_tools=True):
+    read_tool = CountingReadTool(str(tmp_path))
+    tools = [read_tool, WriteTool(str(tmp_path)), EditTool(str(tmp_path)), BashTool(workspace_dir=str(tmp_path))]
+    agent = helpers.make_agent(tmp_path, ScriptedLLM(calls), tools, max_steps=20, memoize_tools=memoize_tools)
+    return agent, read_tool
+
+
+def tool_outputs(agent):
+    return [msg.content for msg in agent.messages if msg.role == "tool"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_are_served_from_cache(tmp_path):
+    """Identical read calls (in any argument order) execute once per run."""
+    (tmp_path / "a.txt").write_text("alpha\n")
+    calls = [
+        ("read_file", {"path": "a.txt", "offset": 1}),
+        ("read_file", {"offset": 1, "path": "a.txt"}),
+        ("read_file", {"path": str(tmp_path / "other.txt")}),  # Failure: not cached
+        ("read_file", {"path": str(tmp_path / "other.txt")}),
+    ]
+    agent, read_tool = make_agent(tmp_path, calls)
+
+    await agent.run()
+
+    outputs = tool_outputs(agent)
+    assert outputs[0] == outputs[1] and "alpha" in outputs[0]
+    assert read_tool.executions == 3
+    assert agent.tool_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_affected_reads(tmp_path):
+    """Writing or editing a file invalidates reads of that file only; bash invalidates everything."""
+    (tmp_path / "a.txt").write_text("alpha\n")
+    (tmp_path / "b.txt").write_text("beta\n")
+    calls = [
+        ("read_file", {"path": "a.txt"}),
+        ("read_file", {"path": "b.txt"}),
+        ("write_file", {"path": str(tmp_path / "a.txt"), "content": "gamma\n"}),
+        ("read_file", {"path": "a.txt"}),  # Re-executed
+        ("read_file", {"path": "b.txt"}),  # Cached
+        ("edit_file", {"path": "a.txt", "old_str": "gamma", "new_str": "delta"}),
+        ("read_file", {"path": "a.txt"}),  # Re-executed
+        ("bash", {"command": "echo epsilon > b.txt"}),
+        ("read_file", {"path": "b.txt"}),  # Re-executed
+    ]
+    agent, read_tool = make_agent(tmp_path, calls)
+
+    await agent.run()
+
+    outputs = tool_outputs(agent)
+    assert "gamma" in outputs[3]
+    assert "delta" in outputs[6]
+    assert "epsilon" in outputs[8]
+    assert read_tool.executions == 5
+
+
+@pytest.mark.asyncio
+async def test_memoization_is_opt_in_and_per_run(tmp_path):
+    """Without memoize_tools every call executes; with it, the cache is reset on each run."""
+    (tmp_path / "a.txt").write_text("alpha\n")
+    agent, read_tool = make_agent(tmp_path, [("read_file", {"path": "a.txt"})] * 2, memoize_tools=False)
+    await agent.run()
+    assert agent.tool_cache is None
+    assert read_tool.executions == 2
+
+    agent, read_tool = make_agent(tmp_path, [("read_file", {"path": "a.txt"})] * 2)
+    await agent.run()
+    agent.llm.step = 0
+    agent.add_user_message("again")
+    await agent.run()
+    assert read_tool.executions == 2
+
+
+def test_unknown_dependencies_are_dropped_by_any_write(tmp_path):
+    """Entries without known read paths do not survive a write to any file."""
+    cache = ToolResultCache()
+    result = ToolResult(success=True, content="x")
+    cache.put("lookup", {"q": 1}, result, None)
+    cache.put("get_skill", {"skill_name": "pdf"}, result, [])
+
+    cache.invalidate([tmp_path / "a.txt"])
+
+    assert cache.get("lookup", {"q": 1}) is None
+    assert cache.get("get_skill", {"skill_name": "pdf"}) is result
+    cache.invalidate(None)
+    assert len(cache) == 0
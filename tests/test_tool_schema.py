@@ -4,7 +4,9 @@ from typing import Any
 
 import pytest
 
+from mini_agent.llm import AnthropicClient, OpenAIClient
 from mini_agent.tools.base import Tool, ToolResult
+from mini_agent.tools.registry import ToolRegistry
 
 
 class MockWeatherTool(Tool):
@@ -253,5 +255,49 @@ async def test_tool_execute():
     assert result.content == "Weather data"
 
 
+class CountingTool(MockWeatherTool):
+    """Weather tool that counts schema builds."""
+
+    builds = 0
+
+    def to_schema(self) -> dict[str, Any]:
+        CountingTool.builds += 1
+        return super().to_schema()
+
+
+def test_registry_builds_schemas_once():
+    """Registry schemas are built at registration and reused until the tool set changes."""
+    CountingTool.builds = 0
+    registry = ToolRegistry([CountingTool(), MockCalculatorTool()])
+
+    first = registry.anthropic_schemas()
+    assert registry.anthropic_schemas() is first
+    assert CountingTool.builds == 1
+    assert [s["name"] for s in first] == ["get_weather", "calculator"]
+    assert [s["function"]["name"] for s in registry.openai_schemas()] == ["get_weather", "calculator"]
+
+    registry.add(MockSearchTool())
+    assert registry.anthropic_schemas() is not first
+    assert [s["name"] for s in registry.anthropic_schemas()] == ["get_weather", "calculator", "search_database"]
+    assert CountingTool.builds == 1
+
+    registry.remove("calculator")
+    assert "calculator" not in registry
+    assert [s["name"] for s in registry.anthropic_schemas()] == ["get_weather", "search_database"]
+    with pytest.raises(KeyError):
+        registry.remove("calculator")
+
+
+def test_clients_use_registry_schemas():
+    """LLM clients take precomputed schemas from a registry instead of calling to_schema()."""
+    registry = ToolRegistry([MockWeatherTool(), MockCalculatorTool()])
+    anthropic_client = AnthropicClient(api_key="test", api_base="http://localhost")
+    openai_client = OpenAIClient(api_key="test", api_base="http://localhost")
+
+    assert anthropic_client._convert_tools(registry) == [t.to_schema() for t in registry.values()]
+    assert openai_client._convert_tools(registry) == [t.to_openai_schema() for t in registry.values()]
+    assert anthropic_client._convert_tools(registry)[0] is registry.anthropic_schemas()[0]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])